@@ -0,0 +1,88 @@
+"""Outbound channel calls with and without CoalescingNotifier under bursty posting.
+
+Simulates a busy forum thread. Every post notifies all subscribers on
+three channels, and some posts are re-sent unchanged (double submits,
+edits that do not change the text). A simulated clock drives the
+coalescing window, so the run is fast and reproducible:
+
+    python bench_coalescing.py
+"""
+import random
+import time
+from models import Student
+from notifiers import Notifier, CompositeNotifier
+from coalescing import CoalescingNotifier
+
+SUBSCRIBERS = 100
+BURSTS = 30
+POSTS_PER_BURST = 40
+BURST_SECONDS = 20.0
+QUIET_SECONDS = 120.0
+DUPLICATE_RATE = 0.1
+WINDOW = 30.0
+
+
+class CountingNotifier(Notifier):
+    """Stands in for a real channel and counts outbound calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def send_notification(self, student: Student, message: str):
+        self.calls += 1
+
+
+class SimClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run(coalesce: bool, seed: int = 7) -> tuple[int, int, float]:
+    rng = random.Random(seed)
+    students = [Student(f"S{i}", f"s{i}@example.com", f"+1000{i}") for i in range(SUBSCRIBERS)]
+    channels = [CountingNotifier() for _ in range(3)]
+    clock = SimClock()
+    if coalesce:
+        stages = [CoalescingNotifier(c, window=WINDOW, background=False, clock=clock) for c in channels]
+        notifier = CompositeNotifier(stages)
+    else:
+        stages = []
+        notifier = CompositeNotifier(channels)
+
+    notifications = 0
+    last_message = None
+    started = time.perf_counter()
+    for burst in range(BURSTS):
+        for n in range(POSTS_PER_BURST):
+            clock.now += rng.expovariate(POSTS_PER_BURST / BURST_SECONDS)
+            if last_message is not None and rng.random() < DUPLICATE_RATE:
+                message = last_message
+            else:
+                author = rng.choice(students)
+                message = f"New post in 'Lab 0 questions' by {author.name}: reply #{burst}-{n}"
+            last_message = message
+            for student in students:
+                notifier.send_notification(student, message)
+                notifications += 1
+        clock.now += QUIET_SECONDS
+    for stage in stages:
+        stage.flush()
+    elapsed = time.perf_counter() - started
+    return notifications, sum(c.calls for c in channels), elapsed
+
+
+def main():
+    notifications, plain_calls, plain_time = run(coalesce=False)
+    _, coalesced_calls, coalesced_time = run(coalesce=True)
+    print(f"notifications sent by the forum: {notifications:,}")
+    print(f"{'pipeline':>12} {'channel calls':>14} {'time (s)':>9}")
+    print(f"{'plain':>12} {plain_calls:>14,} {plain_time:>9.3f}")
+    print(f"{'coalesced':>12} {coalesced_calls:>14,} {coalesced_time:>9.3f}")
+    print(f"reduction: {plain_calls / coalesced_calls:.1f}x fewer channel calls")
+
+
+if __name__ == "__main__":
+    main()
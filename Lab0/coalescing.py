@@ -0,0 +1,154 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+from models import Student
+from notifiers import Notifier
+
+
+class _Digest:
+    """
+    SRP: Messages waiting to be sent to one recipient on one channel.
+    """
+    __slots__ = ("student", "messages", "due")
+
+    def __init__(self, student: Student, due: float):
+        self.student = student
+        self.messages: list[str] = []
+        self.due = due
+
+
+class CoalescingNotifier(Notifier):
+    """
+    SRP: Reduces outbound traffic; delivery stays with the wrapped channel.
+    OCP: Wraps any Notifier (one channel) without changing it.
+    DIP: Is itself a Notifier, so Forum and CompositeNotifier use it unchanged.
+
+    Messages to the same recipient within `window` seconds of the first one
+    are merged into a single digest. A recipient's messages go out early
+    once `max_digest` of them are waiting. A message identical to one
+    recently sent or queued for the same recipient is dropped; the last
+    `dedup_size` content hashes are kept in an LRU.
+
+    With `background=True` a daemon thread sends digests when their window
+    ends. Otherwise they go out on a later send_notification call or on
+    flush(); this mode uses `clock` and suits simulations.
+    """
+    def __init__(self, notifier: Notifier, window: float = 5.0, dedup_size: int = 10_000,
+                 max_digest: int = 50, background: bool = True,
+                 clock: Callable[[], float] = time.monotonic):
+        if window < 0 or dedup_size < 0 or max_digest <= 0:
+            raise ValueError("window and dedup_size must be >= 0 and max_digest positive")
+        self._notifier = notifier
+        self._window = window
+        self._dedup_size = dedup_size
+        self._max_digest = max_digest
+        self._clock = clock
+        self._recent: OrderedDict[bytes, None] = OrderedDict()
+        # Insertion order is also due order, since every window is the same length.
+        self._pending: dict[tuple[str, str, str], _Digest] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self.received = 0
+        self.duplicates = 0
+        self.sent = 0
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(target=self._run, name="notify-coalescer", daemon=True)
+            self._thread.start()
+
+    def send_notification(self, student: Student, message: str):
+        recipient = (student.name, student.email, student.phone)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Notifier is closed")
+            self.received += 1
+            if self._seen(recipient, message):
+                self.duplicates += 1
+                return
+            now = self._clock()
+            digest = self._pending.get(recipient)
+            if digest is None:
+                digest = self._pending[recipient] = _Digest(student, now + self._window)
+                self._cond.notify()
+            digest.messages.append(message)
+            ready = self._take_due(now)
+            if len(digest.messages) >= self._max_digest and recipient in self._pending:
+                ready.append(self._pending.pop(recipient))
+            self.sent += len(ready)
+        self._send(ready)
+
+    def flush(self):
+        """Send every pending digest now."""
+        with self._cond:
+            ready = list(self._pending.values())
+            self._pending.clear()
+            self.sent += len(ready)
+        self._send(ready)
+
+    def close(self):
+        """Send what is pending and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def stats(self) -> dict[str, int]:
+        return {"received": self.received, "duplicates": self.duplicates, "sent": self.sent}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _seen(self, recipient: tuple[str, str, str], message: str) -> bool:
+        if not self._dedup_size:
+            return False
+        key = hashlib.blake2b("\0".join((*recipient, message)).encode("utf-8"),
+                              digest_size=16).digest()
+        if key in self._recent:
+            self._recent.move_to_end(key)
+            return True
+        self._recent[key] = None
+        if len(self._recent) > self._dedup_size:
+            self._recent.popitem(last=False)
+        return False
+
+    def _take_due(self, now: float) -> list[_Digest]:
+        ready = []
+        while self._pending:
+            recipient, digest = next(iter(self._pending.items()))
+            if digest.due > now:
+                break
+            ready.append(self._pending.pop(recipient))
+        return ready
+
+    def _send(self, digests: list[_Digest]):
+        for digest in digests:
+            messages = digest.messages
+            if len(messages) == 1:
+                text = messages[0]
+            else:
+                text = f"{len(messages)} new notifications:\n" + "\n".join(f"- {m}" for m in messages)
+            self._notifier.send_notification(digest.student, text)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if not self._pending:
+                        self._cond.wait()
+                        continue
+                    delay = next(iter(self._pending.values())).due - self._clock()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if self._closed:
+                    return
+                ready = self._take_due(self._clock())
+                self.sent += len(ready)
+            self._send(ready)
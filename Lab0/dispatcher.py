@@ -0,0 +1,155 @@
+import queue
+import threading
+import time
+from typing import Optional
+from models import Student
+from notifiers import Notifier
+
+_STOP = object()
+
+
+class _ChannelWorker:
+    """
+    SRP: Owns one channel's bounded queue and the thread that drains it in batches.
+    """
+    def __init__(self, notifier: Notifier, batch_size: int, max_delay: float,
+                 max_queue: int, put_timeout: Optional[float]):
+        self.notifier = notifier
+        self._batch_size = batch_size
+        self._max_delay = max_delay
+        self._put_timeout = put_timeout
+        self._queue = queue.Queue(maxsize=max_queue)
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self._drop_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name=f"notify-{type(notifier).__name__}", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, item: tuple[Student, str]) -> bool:
+        # Backpressure: blocks while the queue is full, up to put_timeout.
+        try:
+            self._queue.put(item, timeout=self._put_timeout)
+            return True
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+            return False
+
+    def stop(self):
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def join(self):
+        self._queue.join()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            batch = [item]
+            deadline = time.monotonic() + self._max_delay
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._deliver(batch)
+            for _ in range(len(batch) + stopping):
+                self._queue.task_done()
+
+    def _deliver(self, batch: list[tuple[Student, str]]):
+        try:
+            self.notifier.send_batch(batch)
+            self.delivered += len(batch)
+        except Exception:
+            # A failing channel must not stop the others or the worker.
+            self.failed += len(batch)
+        self.batches += 1
+
+
+class NotificationDispatcher(Notifier):
+    """
+    SRP: Decouples sending a notification from delivering it.
+    OCP: Wraps any Notifier channels; channels with a bulk API override send_batch.
+    DIP: Is itself a Notifier, so Forum uses it without changes.
+
+    send_notification only enqueues. Each channel has its own bounded queue
+    and worker thread, so channels deliver concurrently and a slow channel
+    delays only itself. A worker sends up to `batch_size` messages at once,
+    or whatever arrived within `max_delay` seconds of the first one. When a
+    channel's queue is full, callers block for up to `put_timeout` seconds
+    (None waits for space); after that the message is dropped for that
+    channel and counted.
+    """
+    def __init__(self, notifiers: list[Notifier], batch_size: int = 100,
+                 max_delay: float = 0.05, max_queue: int = 10_000,
+                 put_timeout: Optional[float] = None):
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self._workers = [
+            _ChannelWorker(n, batch_size, max_delay, max_queue, put_timeout) for n in notifiers
+        ]
+        self._closed = False
+        # Guards _closed and the count of sends still enqueueing. Puts happen
+        # outside it; close() waits for in-flight sends before the stop
+        # markers go in, so no message can land behind one.
+        self._idle = threading.Condition()
+        self._in_flight = 0
+
+    def send_notification(self, student: Student, message: str):
+        with self._idle:
+            if self._closed:
+                raise RuntimeError("Dispatcher is closed")
+            self._in_flight += 1
+        try:
+            for worker in self._workers:
+                worker.submit((student, message))
+        finally:
+            with self._idle:
+                self._in_flight -= 1
+                if not self._in_flight:
+                    self._idle.notify_all()
+
+    def flush(self):
+        """Block until every queued notification has been delivered (or failed)."""
+        for worker in self._workers:
+            worker.join()
+
+    def close(self):
+        """Deliver what is queued, then stop the channel workers."""
+        with self._idle:
+            if self._closed:
+                return
+            self._closed = True
+            self._idle.wait_for(lambda: not self._in_flight)
+        for worker in self._workers:
+            worker.stop()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            type(w.notifier).__name__: {
+                "delivered": w.delivered, "failed": w.failed,
+                "dropped": w.dropped, "batches": w.batches,
+            }
+            for w in self._workers
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
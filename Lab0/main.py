@@ -1,35 +1,41 @@
 from models import Student, Post
-from notifiers import Notifier, EmailNotifier, SMSNotifier, PushNotifier, CompositeNotifier, NullNotifier
+from notifiers import Notifier, EmailNotifier, SMSNotifier, PushNotifier
+from dispatcher import NotificationDispatcher
+from repository import PostRepository, InMemoryPostRepository
 
 class Forum:
     """
     DIP: Depends on the Notifier abstraction, not concrete channels.
     SRP: Manages forum posts and delegates notification.
     OCP: New notifier types can be added without modifying this class.
+    DIP: Stores posts through the PostRepository abstraction (in memory by default).
     """
-    def __init__(self, notifier: Notifier):
+    def __init__(self, notifier: Notifier, repository: PostRepository = None):
         self.notifier = notifier
-        self.posts = []
+        self.posts = repository if repository is not None else InMemoryPostRepository()
 
     def add_post(self, student: Student, content: str):
         post = Post(student, content)
-        self.posts.append(post)
+        self.posts.add(post)
         self.notifier.send_notification(student, f"New post created: {content}")
         print(f"[Forum] {student.name} posted: {content}")
 
-    def list_posts(self):
+    def list_posts(self, author: Student = None):
         print("\n[Forum] Listing all posts:")
-        for post in self.posts:
+        # Streamed page by page, so memory stays bounded however many posts there are.
+        for post in self.posts.stream(author=author):
             print(f"{post.student.name}: {post.content}")
 
 def main():
     alice = Student("Alice", "alice@example.com", "+123456789")
     bob = Student("Bob", "bob@example.com", "+987654321")
-    # DIP/OCP: Swap or compose notifier implementations without changing Forum
-    notifier = CompositeNotifier([EmailNotifier(), SMSNotifier(), PushNotifier()])
-    forum = Forum(notifier)
-    forum.add_post(alice, "Hello, this is my first post!")
-    forum.add_post(bob, "Welcome Alice!")
+    # DIP/OCP: Swap or compose notifier implementations without changing Forum.
+    # The dispatcher delivers in the background, so add_post does not wait on channels.
+    with NotificationDispatcher([EmailNotifier(), SMSNotifier(), PushNotifier()]) as notifier:
+        forum = Forum(notifier)
+        forum.add_post(alice, "Hello, this is my first post!")
+        forum.add_post(bob, "Welcome Alice!")
+        notifier.flush()
     forum.list_posts()
 
 if __name__ == "__main__":
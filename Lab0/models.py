@@ -1,3 +1,7 @@
+import time
+from typing import Optional
+
+
 class Student:
     """
     SRP: Stores only student identity/contact data.
@@ -15,9 +19,12 @@ class Post:
     """
     SRP: Holds only post content and its author.
     """
-    def __init__(self, student: Student, content: str):
+    def __init__(self, student: Student, content: str, created_at: Optional[float] = None,
+                 post_id: Optional[int] = None):
         self.student = student
         self.content = content
+        self.created_at = time.time() if created_at is None else created_at
+        self.post_id = post_id  # assigned by the PostRepository
 
     def __str__(self):
         return f"{self.student.name}: {self.content}"
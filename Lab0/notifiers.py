@@ -10,6 +10,13 @@ class Notifier(ABC):
     def send_notification(self, student: Student, message: str):
         pass
 
+    def send_batch(self, notifications: list[tuple[Student, str]]):
+        """
+        OCP: Channels with a bulk API can override this; by default each is sent in turn.
+        """
+        for student, message in notifications:
+            self.send_notification(student, message)
+
 class EmailNotifier(Notifier):
     """
     SRP: Handles only email notifications.
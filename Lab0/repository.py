@@ -0,0 +1,214 @@
+import sqlite3
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, Optional
+from models import Student, Post
+
+# Position after the last post of a page: (created_at, post_id).
+Cursor = tuple[float, int]
+
+
+class PostRepository(ABC):
+    """
+    DIP: Forum depends on this abstraction, not on a storage backend.
+    OCP: New backends implement add/get/count/page; streaming, iteration and len() come for free.
+
+    Posts are ordered by (created_at, post_id). `page()` does keyset
+    pagination: it returns up to `limit` posts after `cursor`, plus the
+    cursor for the next page (None at the end). Results can be limited to
+    one author and to the time range [since, until). Iterating a repository
+    streams every post in that order, and len() is count(), so it can stand
+    in for the plain list of posts Forum used to keep.
+    """
+    @abstractmethod
+    def add(self, post: Post) -> int:
+        """Store `post`, set its post_id and return it."""
+
+    def add_many(self, posts: Iterable[Post]) -> int:
+        """Store many posts and return how many were stored; bulk backends may leave post_id unset."""
+        count = 0
+        for post in posts:
+            self.add(post)
+            count += 1
+        return count
+
+    @abstractmethod
+    def get(self, post_id: int) -> Optional[Post]:
+        pass
+
+    @abstractmethod
+    def count(self, author: Optional[Student] = None) -> int:
+        pass
+
+    @abstractmethod
+    def page(self, cursor: Optional[Cursor] = None, limit: int = 100,
+             author: Optional[Student] = None, since: Optional[float] = None,
+             until: Optional[float] = None) -> tuple[list[Post], Optional[Cursor]]:
+        pass
+
+    def stream(self, author: Optional[Student] = None, since: Optional[float] = None,
+               until: Optional[float] = None, page_size: int = 1000) -> Iterator[Post]:
+        """Yield matching posts in order, holding at most one page in memory."""
+        cursor = None
+        while True:
+            posts, cursor = self.page(cursor, page_size, author, since, until)
+            yield from posts
+            if cursor is None:
+                return
+
+    def __iter__(self) -> Iterator[Post]:
+        return self.stream()
+
+    def __len__(self) -> int:
+        return self.count()
+
+
+def _author_key(student: Student) -> str:
+    return student.email
+
+
+def _next_cursor(posts: list[Post], limit: int) -> Optional[Cursor]:
+    if len(posts) < limit:
+        return None
+    last = posts[-1]
+    return (last.created_at, last.post_id)
+
+
+class InMemoryPostRepository(PostRepository):
+    """
+    SRP: Keeps posts in memory with sorted (created_at, post_id) keys,
+    both overall and per author. Lookups and pages cost O(log n + page size).
+    """
+    def __init__(self):
+        self._posts: list[Post] = []
+        self._by_time: list[Cursor] = []
+        self._by_author: dict[str, list[Cursor]] = {}
+
+    def add(self, post: Post) -> int:
+        post.post_id = len(self._posts)
+        self._posts.append(post)
+        key = (post.created_at, post.post_id)
+        _insert(self._by_time, key)
+        _insert(self._by_author.setdefault(_author_key(post.student), []), key)
+        return post.post_id
+
+    def get(self, post_id: int) -> Optional[Post]:
+        return self._posts[post_id] if 0 <= post_id < len(self._posts) else None
+
+    def count(self, author: Optional[Student] = None) -> int:
+        if author is None:
+            return len(self._posts)
+        return len(self._by_author.get(_author_key(author), ()))
+
+    def page(self, cursor: Optional[Cursor] = None, limit: int = 100,
+             author: Optional[Student] = None, since: Optional[float] = None,
+             until: Optional[float] = None) -> tuple[list[Post], Optional[Cursor]]:
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        keys = self._by_time if author is None else self._by_author.get(_author_key(author), [])
+        start = 0 if since is None else bisect_left(keys, (since, -1))
+        if cursor is not None:
+            start = max(start, bisect_right(keys, cursor))
+        stop = len(keys) if until is None else bisect_left(keys, (until, -1))
+        posts = [self._posts[post_id] for _, post_id in keys[start:min(stop, start + limit)]]
+        return posts, _next_cursor(posts, limit)
+
+
+def _insert(keys: list[Cursor], key: Cursor):
+    # Posts nearly always arrive in time order, so this is usually an append.
+    if not keys or keys[-1] <= key:
+        keys.append(key)
+    else:
+        keys.insert(bisect_right(keys, key), key)
+
+
+class SQLitePostRepository(PostRepository):
+    """
+    SRP: Stores posts in SQLite, indexed by time and by author.
+    Pages are keyset queries, so each costs O(log n + page size) on disk.
+    """
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS posts (
+            post_id INTEGER PRIMARY KEY,
+            author_name TEXT NOT NULL,
+            author_email TEXT NOT NULL,
+            author_phone TEXT NOT NULL,
+            content TEXT NOT NULL,
+            created_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS posts_by_time ON posts (created_at, post_id);
+        CREATE INDEX IF NOT EXISTS posts_by_author ON posts (author_email, created_at, post_id);
+    """
+    _COLUMNS = "post_id, author_name, author_email, author_phone, content, created_at"
+
+    def __init__(self, path: str = ":memory:"):
+        self._db = sqlite3.connect(path)
+        self._db.executescript(self._SCHEMA)
+
+    def add(self, post: Post) -> int:
+        with self._db:
+            cur = self._db.execute(
+                "INSERT INTO posts (author_name, author_email, author_phone, content, created_at)"
+                " VALUES (?, ?, ?, ?, ?)", self._row(post)
+            )
+        post.post_id = cur.lastrowid
+        return post.post_id
+
+    def add_many(self, posts: Iterable[Post]) -> int:
+        with self._db:
+            cur = self._db.executemany(
+                "INSERT INTO posts (author_name, author_email, author_phone, content, created_at)"
+                " VALUES (?, ?, ?, ?, ?)", (self._row(p) for p in posts)
+            )
+        return cur.rowcount
+
+    def get(self, post_id: int) -> Optional[Post]:
+        row = self._db.execute(
+            f"SELECT {self._COLUMNS} FROM posts WHERE post_id = ?", (post_id,)
+        ).fetchone()
+        return self._post(row) if row else None
+
+    def count(self, author: Optional[Student] = None) -> int:
+        if author is None:
+            return self._db.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+        return self._db.execute(
+            "SELECT COUNT(*) FROM posts WHERE author_email = ?", (_author_key(author),)
+        ).fetchone()[0]
+
+    def page(self, cursor: Optional[Cursor] = None, limit: int = 100,
+             author: Optional[Student] = None, since: Optional[float] = None,
+             until: Optional[float] = None) -> tuple[list[Post], Optional[Cursor]]:
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        where, params = [], []
+        if author is not None:
+            where.append("author_email = ?")
+            params.append(_author_key(author))
+        if since is not None:
+            where.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("created_at < ?")
+            params.append(until)
+        if cursor is not None:
+            where.append("(created_at, post_id) > (?, ?)")
+            params.extend(cursor)
+        sql = f"SELECT {self._COLUMNS} FROM posts"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY created_at, post_id LIMIT ?"
+        posts = [self._post(row) for row in self._db.execute(sql, (*params, limit))]
+        return posts, _next_cursor(posts, limit)
+
+    def close(self):
+        self._db.close()
+
+    @staticmethod
+    def _row(post: Post) -> tuple:
+        s = post.student
+        return (s.name, s.email, s.phone, post.content, post.created_at)
+
+    @staticmethod
+    def _post(row: tuple) -> Post:
+        post_id, name, email, phone, content, created_at = row
+        return Post(Student(name, email, phone), content, created_at, post_id)
@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+
+from coalescing import CoalescingNotifier
+from models import Student
+from notifiers import Notifier
+
+ALICE = Student("Alice", "alice@example.com", "+123456789")
+BOB = Student("Bob", "bob@example.com", "+987654321")
+
+
+class Recording(Notifier):
+    def __init__(self):
+        self.sent = []
+        self.arrived = threading.Event()
+
+    def send_notification(self, student, message):
+        self.sent.append((student.name, message))
+        self.arrived.set()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make(window=5.0, **kwargs):
+    channel, clock = Recording(), Clock()
+    notifier = CoalescingNotifier(channel, window=window, background=False, clock=clock, **kwargs)
+    return notifier, channel, clock
+
+
+def test_messages_within_window_become_one_digest():
+    notifier, channel, clock = make()
+    notifier.send_notification(ALICE, "a")
+    clock.now = 2.0
+    notifier.send_notification(ALICE, "b")
+    assert channel.sent == []
+    clock.now = 5.0
+    notifier.send_notification(BOB, "c")  # Alice's window has ended
+    assert channel.sent == [("Alice", "2 new notifications:\n- a\n- b")]
+    notifier.flush()
+    assert channel.sent[-1] == ("Bob", "c")
+    assert notifier.stats() == {"received": 3, "duplicates": 0, "sent": 2}
+
+
+def test_duplicates_are_dropped_per_recipient():
+    notifier, channel, _ = make()
+    for student, message in [(ALICE, "hi"), (ALICE, "hi"), (BOB, "hi")]:
+        notifier.send_notification(student, message)
+    notifier.flush()
+    notifier.send_notification(ALICE, "hi")  # still in the LRU after sending
+    notifier.flush()
+    assert sorted(channel.sent) == [("Alice", "hi"), ("Bob", "hi")]
+    assert notifier.stats()["duplicates"] == 2
+
+
+def test_dedup_lru_forgets_oldest():
+    notifier, channel, _ = make(dedup_size=2)
+    for message in ("a", "b", "c", "a"):
+        notifier.send_notification(ALICE, message)
+    notifier.flush()
+    assert channel.sent == [("Alice", "4 new notifications:\n- a\n- b\n- c\n- a")]
+
+
+def test_max_digest_sends_early():
+    notifier, channel, _ = make(max_digest=3)
+    for message in ("a", "b", "c", "d"):
+        notifier.send_notification(ALICE, message)
+    assert channel.sent == [("Alice", "3 new notifications:\n- a\n- b\n- c")]
+    notifier.close()
+    assert channel.sent[-1] == ("Alice", "d")
+
+
+def test_zero_window_sends_immediately():
+    notifier, channel, _ = make(window=0.0)
+    notifier.send_notification(ALICE, "a")
+    assert channel.sent == [("Alice", "a")]
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError):
+        CoalescingNotifier(Recording(), window=-1, background=False)
+    with pytest.raises(ValueError):
+        CoalescingNotifier(Recording(), max_digest=0, background=False)
+
+
+def test_background_thread_sends_when_window_ends():
+    channel = Recording()
+    with CoalescingNotifier(channel, window=0.05) as notifier:
+        notifier.send_notification(ALICE, "a")
+        notifier.send_notification(ALICE, "b")
+        assert channel.arrived.wait(2)
+    assert channel.sent == [("Alice", "2 new notifications:\n- a\n- b")]
+    with pytest.raises(RuntimeError):
+        notifier.send_notification(ALICE, "late")
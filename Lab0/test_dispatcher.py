@@ -0,0 +1,152 @@
+import threading
+
+import pytest
+
+from dispatcher import NotificationDispatcher
+from models import Student
+from notifiers import Notifier
+
+ALICE = Student("Alice", "alice@example.com", "+123456789")
+
+
+class Recording(Notifier):
+    def __init__(self):
+        self.sent = []
+        self.batches = []
+
+    def send_notification(self, student, message):
+        self.sent.append((student, message))
+
+    def send_batch(self, notifications):
+        self.batches.append(len(notifications))
+        super().send_batch(notifications)
+
+
+class Failing(Notifier):
+    def send_notification(self, student, message):
+        raise ConnectionError("channel down")
+
+
+class Gated(Recording):
+    """Blocks every batch until `gate` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+    def send_batch(self, notifications):
+        self.started.set()
+        self.gate.wait()
+        super().send_batch(notifications)
+
+
+def test_every_channel_gets_every_message_in_batches():
+    a, b = Recording(), Recording()
+    with NotificationDispatcher([a, b], batch_size=4, max_delay=0.01) as dispatcher:
+        for i in range(10):
+            dispatcher.send_notification(ALICE, f"m{i}")
+        dispatcher.flush()
+        stats = dispatcher.stats()
+    assert [m for _, m in a.sent] == [f"m{i}" for i in range(10)] == [m for _, m in b.sent]
+    assert max(a.batches) <= 4
+    assert stats["Recording"]["delivered"] == 10
+
+
+def test_failing_channel_is_counted_and_does_not_stop_others():
+    ok = Recording()
+    with NotificationDispatcher([Failing(), ok], max_delay=0.0) as dispatcher:
+        dispatcher.send_notification(ALICE, "hello")
+        dispatcher.flush()
+        stats = dispatcher.stats()
+    assert stats["Failing"]["failed"] == 1
+    assert ok.sent == [(ALICE, "hello")]
+
+
+def test_full_queue_drops_after_put_timeout():
+    channel = Gated()
+    dispatcher = NotificationDispatcher([channel], max_delay=0.0, max_queue=1, put_timeout=0.01)
+    dispatcher.send_notification(ALICE, "taken by the worker")
+    assert channel.started.wait(2)
+    dispatcher.send_notification(ALICE, "queued")
+    dispatcher.send_notification(ALICE, "dropped")
+    channel.gate.set()
+    dispatcher.close()
+    assert [m for _, m in channel.sent] == ["taken by the worker", "queued"]
+    assert dispatcher.stats()["Gated"]["dropped"] == 1
+
+
+def test_send_after_close_raises():
+    dispatcher = NotificationDispatcher([Recording()])
+    dispatcher.close()
+    dispatcher.close()
+    with pytest.raises(RuntimeError):
+        dispatcher.send_notification(ALICE, "late")
+
+
+def test_close_waits_for_a_send_blocked_on_a_full_queue():
+    channel = Gated()
+    dispatcher = NotificationDispatcher([channel], max_delay=0.0, max_queue=1)
+    dispatcher.send_notification(ALICE, "m0")
+    assert channel.started.wait(2)
+    dispatcher.send_notification(ALICE, "m1")  # fills the queue
+    blocked = threading.Thread(target=dispatcher.send_notification, args=(ALICE, "m2"))
+    blocked.start()
+    closer = threading.Thread(target=dispatcher.close)
+    closer.start()
+    closer.join(0.1)
+    assert closer.is_alive()  # still waiting for the in-flight send
+    channel.gate.set()
+    blocked.join(2)
+    closer.join(2)
+    assert not closer.is_alive()
+    assert [m for _, m in channel.sent] == ["m0", "m1", "m2"]
+
+
+def test_close_racing_senders_never_strands_a_message():
+    for _ in range(50):
+        channel = Recording()
+        dispatcher = NotificationDispatcher([channel], batch_size=4, max_delay=0.0)
+        accepted = []
+
+        def spam():
+            try:
+                while True:
+                    dispatcher.send_notification(ALICE, "x")
+                    accepted.append(1)
+            except RuntimeError:
+                pass
+
+        senders = [threading.Thread(target=spam) for _ in range(3)]
+        for t in senders:
+            t.start()
+        dispatcher.close()
+        for t in senders:
+            t.join()
+        assert len(channel.sent) == len(accepted)
+
+
+def test_send_blocked_on_one_channel_does_not_block_other_senders():
+    fast, slow = Recording(), Gated()
+    dispatcher = NotificationDispatcher([fast, slow], max_delay=0.0, max_queue=1)
+    senders = []
+    try:
+        dispatcher.send_notification(ALICE, "m0")
+        assert slow.started.wait(2)
+        dispatcher.send_notification(ALICE, "m1")  # fills the slow queue
+        for message in ("m2", "m3"):
+            # Each reaches the fast channel, then waits for room on the slow one.
+            senders.append(threading.Thread(target=dispatcher.send_notification,
+                                            args=(ALICE, message)))
+            senders[-1].start()
+        for _ in range(200):
+            if len(fast.sent) == 4:
+                break
+            threading.Event().wait(0.01)
+        assert sorted(m for _, m in fast.sent) == ["m0", "m1", "m2", "m3"]
+    finally:
+        slow.gate.set()
+        for t in senders:
+            t.join(2)
+        dispatcher.close()
+    assert len(slow.sent) == 4
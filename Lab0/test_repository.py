@@ -0,0 +1,81 @@
+import pytest
+
+from main import Forum
+from models import Post, Student
+from notifiers import NullNotifier
+from repository import InMemoryPostRepository, SQLitePostRepository
+
+ALICE = Student("Alice", "alice@example.com", "+123456789")
+BOB = Student("Bob", "bob@example.com", "+987654321")
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repo(request):
+    if request.param == "memory":
+        yield InMemoryPostRepository()
+    else:
+        repository = SQLitePostRepository()
+        yield repository
+        repository.close()
+
+
+def fill(repo, count=10):
+    # Out-of-order timestamps exercise the sorted inserts.
+    times = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3][:count]
+    for i, t in enumerate(times):
+        repo.add(Post(ALICE if i % 2 else BOB, f"post {i}", created_at=float(t)))
+    return sorted((t, i) for i, t in enumerate(times))
+
+
+def contents(posts):
+    return [p.content for p in posts]
+
+
+def test_add_sets_ids_and_get_round_trips(repo):
+    post = Post(ALICE, "hello", created_at=1.0)
+    post_id = repo.add(post)
+    assert post.post_id == post_id
+    stored = repo.get(post_id)
+    assert (stored.student.email, stored.content, stored.created_at) == (ALICE.email, "hello", 1.0)
+    assert repo.get(post_id + 100) is None
+
+
+def test_pages_follow_time_order_with_cursors(repo):
+    expected = [f"post {i}" for _, i in fill(repo)]
+    seen, cursor = [], None
+    while True:
+        posts, cursor = repo.page(cursor, limit=3)
+        seen += contents(posts)
+        if cursor is None:
+            break
+    assert seen == expected
+    with pytest.raises(ValueError):
+        repo.page(limit=0)
+
+
+def test_author_and_time_filters(repo):
+    fill(repo)
+    assert repo.count() == 10 and repo.count(ALICE) == 5
+    assert all(p.student.email == ALICE.email for p in repo.stream(author=ALICE))
+    in_range = list(repo.stream(since=3.0, until=5.0, page_size=2))
+    assert sorted(p.created_at for p in in_range) == [3.0, 3.0, 4.0]
+
+
+def test_add_many_counts_posts(repo):
+    assert repo.add_many(Post(BOB, f"bulk {i}", created_at=float(i)) for i in range(5)) == 5
+    assert contents(repo.stream()) == [f"bulk {i}" for i in range(5)]
+
+
+def test_repository_iterates_and_has_len(repo):
+    expected = [f"post {i}" for _, i in fill(repo)]
+    assert len(repo) == 10
+    assert contents(repo) == expected
+
+
+def test_forum_posts_behave_like_a_list(repo):
+    forum = Forum(NullNotifier(), repo)
+    forum.add_post(ALICE, "first")
+    forum.add_post(BOB, "second")
+    assert len(forum.posts) == 2
+    assert [str(p) for p in forum.posts] == ["Alice: first", "Bob: second"]
+    assert len(Forum(NullNotifier()).posts) == 0
@@ -0,0 +1,61 @@
+"""Batch assignment vs the per-mission path.
+
+Assigns a burst of missions to a fleet, once through repeated
+`assign_mission_to_drone` calls and once through `assign_many`.
+Run from the Lab3 directory:
+
+    python -m benchmarks.bench_assign_many
+"""
+import random
+import time
+from typing import List
+
+from benchmarks.bench_drone_pool import make_fleet
+from drone_fleet.domain.fleet_manager import FleetManager
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.strategies import PrioritySelectionStrategy
+
+SIZES = (1_000, 5_000, 20_000)
+PAYLOADS = (None, "HD Camera", "Medical kit", "Thermal Camera")
+
+
+def make_missions(count: int, seed: int = 7) -> List[Mission]:
+    rng = random.Random(seed)
+    return [
+        Mission(f"M-{i}", [f"WP-{i}"], rng.randint(5, 120),
+                priority=rng.randint(1, 5), payload=rng.choice(PAYLOADS))
+        for i in range(count)
+    ]
+
+
+def fresh_fleet(size: int) -> FleetManager:
+    fm = FleetManager.instance()
+    fm.set_pool(DronePool(max_size=size))
+    fm.pool.preload(make_fleet(size))
+    fm.set_selection_strategy(PrioritySelectionStrategy())
+    return fm
+
+
+def main() -> None:
+    print(f"{'drones/missions':>16} {'loop (s)':>10} {'assign_many (s)':>16} {'speedup':>8}")
+    for size in SIZES:
+        missions = make_missions(size)
+
+        fm = fresh_fleet(size)
+        start = time.perf_counter()
+        for m in missions:
+            fm.assign_mission_to_drone(m)
+        loop = time.perf_counter() - start
+
+        fm = fresh_fleet(size)
+        start = time.perf_counter()
+        assigned = fm.assign_many(missions)
+        batch = time.perf_counter() - start
+        assert len(assigned) == size
+
+        print(f"{size:>16} {loop:>10.3f} {batch:>16.3f} {loop / batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Bulk Mission construction vs the MissionBuilder chain.
+
+Run from the Lab3 directory:
+
+    python -m benchmarks.bench_build_many
+"""
+import gc
+import time
+
+from drone_fleet.factory.mission_builder import MissionBuilder
+from drone_fleet.models.mission import Mission
+
+COUNT = 200_000
+
+
+def best_of(fn, repeat: int = 3) -> float:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def build_chain(records) -> None:
+    for r in records:
+        builder = MissionBuilder().name(r["name"])
+        for wp in r["waypoints"]:
+            builder.add_waypoint(wp)
+        builder.duration(r["duration_minutes"]).priority(r["priority"])
+        if r["payload"]:
+            builder.payload(r["payload"])
+        builder.build()
+
+
+def main() -> None:
+    records = [
+        {"name": f"M-{i}", "waypoints": (f"A{i}", f"B{i}"), "duration_minutes": 10 + i % 50,
+         "priority": 1 + i % 5, "payload": None if i % 3 else "Camera"}
+        for i in range(COUNT)
+    ]
+    columns = [[r[k] for r in records]
+               for k in ("name", "waypoints", "duration_minutes", "priority", "payload")]
+
+    chain = best_of(lambda: build_chain(records))
+    many = best_of(lambda: MissionBuilder.build_many(records, pause_gc=True))
+    cols = best_of(lambda: Mission.from_columns(*columns))
+    paused = best_of(lambda: Mission.from_columns(*columns, pause_gc=True))
+
+    for label, seconds in (("builder chain", chain), ("build_many paused", many), ("from_columns", cols),
+                           ("from_columns paused", paused)):
+        print(f"{label:>19}: {seconds:6.3f} s  ({COUNT / seconds:>12,.0f} missions/sec, "
+              f"{chain / seconds:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Contention benchmark: lock-striped pool vs a single global lock.
+
+Worker threads repeatedly check out a drone (blocking) and release it.
+Run from the Lab3 directory:
+
+    python -m benchmarks.bench_concurrent_pool
+"""
+import threading
+import time
+from typing import List, Optional
+
+from benchmarks.bench_drone_pool import make_fleet
+from drone_fleet.factory.concurrent_pool import ConcurrentDronePool
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import Drone
+
+THREADS = (1, 4, 16, 64)
+OPS_PER_THREAD = 5_000
+FLEET_SIZE = 24
+
+
+class GlobalLockDronePool(DronePool):
+    """Reference pool: every operation serialised on one condition lock."""
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__(max_size)
+        self._lock = threading.Condition()
+
+    def checkout(self, timeout: Optional[float] = None) -> Drone:
+        with self._lock:
+            if not self._lock.wait_for(lambda: self._available, timeout):
+                raise RuntimeError("No available drones in pool")
+            return super().checkout()
+
+    def release(self, drone: Drone) -> None:
+        with self._lock:
+            super().release(drone)
+            self._lock.notify()
+
+
+def run(pool: DronePool, threads: int) -> float:
+    """Operations (checkout + release) per second across all threads."""
+    pool.preload(make_fleet(FLEET_SIZE))
+
+    def worker() -> None:
+        for _ in range(OPS_PER_THREAD):
+            pool.release(pool.checkout(timeout=None))
+
+    workers: List[threading.Thread] = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return threads * OPS_PER_THREAD / (time.perf_counter() - start)
+
+
+def main() -> None:
+    print(f"{'threads':>8} {'global (ops/s)':>16} {'striped (ops/s)':>16}")
+    for threads in THREADS:
+        single = run(GlobalLockDronePool(FLEET_SIZE), threads)
+        striped = run(ConcurrentDronePool(FLEET_SIZE), threads)
+        print(f"{threads:>8} {single:>16,.0f} {striped:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
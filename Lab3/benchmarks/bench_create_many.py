@@ -0,0 +1,48 @@
+"""Fleet bring-up: per-drone factory instances vs cached bulk creation.
+
+Built-in factories create drones in a single pass and ignore `workers`;
+the thread pool only helps factories whose `create` waits on I/O.
+
+Run from the Lab3 directory:
+
+    python -m benchmarks.bench_create_many
+"""
+import gc
+import time
+from typing import Callable, List
+
+from drone_fleet.factory.drone_factory import SurveyDroneFactory
+from drone_fleet.factory.registry import default_registry
+from drone_fleet.models.drone import Drone
+
+COUNT = 100_000
+REPEAT = 5
+
+
+def best_of(fn: Callable[[], List[Drone]]) -> float:
+    """Fastest of REPEAT runs, each starting from a collected heap."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    ids = [f"S-{i}" for i in range(COUNT)]
+    expected = [d.identifier for d in default_registry.create_many("survey", ids)]
+    assert [d.identifier for d in default_registry.create_many("survey", ids, workers=4)] == expected
+
+    results = [("new factory per drone", best_of(lambda: [SurveyDroneFactory().create(i) for i in ids]))]
+    for workers in (0, 4):
+        results.append((f"create_many workers={workers}",
+                        best_of(lambda: default_registry.create_many("survey", ids, workers=workers))))
+
+    for label, seconds in results:
+        print(f"{label:>22}: {seconds * 1e3:7.1f} ms ({COUNT / seconds:>12,.0f} drones/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Scaling benchmark for DronePool checkout/release.
+
+Compares the indexed pool against the previous list-based implementation
+for growing fleet sizes. Run from the Lab3 directory:
+
+    python -m benchmarks.bench_drone_pool
+"""
+import time
+from typing import List
+
+from drone_fleet.factory.drone_factory import (
+    SurveyDroneFactory,
+    CargoDroneFactory,
+    CombatDroneFactory,
+)
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import Drone
+
+SIZES = (1_000, 10_000, 50_000)
+OPERATIONS = 2_000
+
+
+class ListDronePool:
+    """The original list-backed pool, kept here as the reference point."""
+
+    def __init__(self, max_size: int) -> None:
+        self._available: List[Drone] = []
+        self._in_use: List[Drone] = []
+        self._max_size = max_size
+
+    def preload(self, drones: List[Drone]) -> None:
+        for d in drones:
+            if len(self._available) + len(self._in_use) < self._max_size:
+                self._available.append(d)
+
+    def release(self, drone: Drone) -> None:
+        if drone in self._in_use:
+            drone.clear_mission()
+            self._in_use.remove(drone)
+            self._available.append(drone)
+
+    def checkout_specific(self, drone: Drone) -> Drone:
+        if drone in self._available:
+            self._available.remove(drone)
+            self._in_use.append(drone)
+            return drone
+        raise RuntimeError("Requested drone is not available")
+
+
+def make_fleet(size: int) -> List[Drone]:
+    factories = (SurveyDroneFactory(), CargoDroneFactory(), CombatDroneFactory())
+    return [factories[i % 3].create(f"D-{i}") for i in range(size)]
+
+
+def run(pool_cls, size: int) -> float:
+    """Average microseconds per checkout_specific + release round trip."""
+    fleet = make_fleet(size)
+    pool = pool_cls(max_size=size)
+    pool.preload(fleet)
+    # Pick drones from the back of the fleet: worst case for list scans.
+    ops = min(OPERATIONS, size // 2)
+    targets = fleet[-ops:]
+    start = time.perf_counter()
+    for d in targets:
+        pool.checkout_specific(d)
+    for d in targets:
+        pool.release(d)
+    elapsed = time.perf_counter() - start
+    return elapsed / ops * 1e6
+
+
+def main() -> None:
+    print(f"{'size':>8} {'list (us/op)':>14} {'indexed (us/op)':>16} {'speedup':>8}")
+    for size in SIZES:
+        legacy = run(ListDronePool, size)
+        indexed = run(DronePool, size)
+        print(f"{size:>8} {legacy:>14.2f} {indexed:>16.2f} {legacy / indexed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
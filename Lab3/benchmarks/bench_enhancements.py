@@ -0,0 +1,55 @@
+"""capabilities() cost: stacked decorators vs one flattened EnhancedDrone.
+
+Run from the Lab3 directory:
+
+    python -m benchmarks.bench_enhancements
+"""
+import time
+
+from drone_fleet.models.drone import Drone, SurveyDrone
+from drone_fleet.utilities.decorators import (
+    DroneDecorator,
+    EnhancedDrone,
+    ENHANCEMENTS,
+    register_enhancement,
+)
+
+DEPTHS = (2, 10, 25)
+CALLS = 20_000
+
+
+class NamedDecorator(DroneDecorator):
+    """Stacked-decorator equivalent of one enhancement (the old approach)."""
+
+    def __init__(self, wrapped: Drone, description: str) -> None:
+        super().__init__(wrapped)
+        self._description = description
+
+    def capabilities(self) -> str:
+        return self._wrapped.capabilities() + " + " + self._description
+
+
+def main() -> None:
+    for i in range(max(DEPTHS)):
+        register_enhancement(f"module-{i}", f"extra module {i}")
+    names = list(ENHANCEMENTS)
+
+    print(f"{'depth':>6} {'stacked (us)':>13} {'flattened (us)':>15}")
+    for depth in DEPTHS:
+        stacked: Drone = SurveyDrone("S-1")
+        for name in names[:depth]:
+            stacked = NamedDecorator(stacked, ENHANCEMENTS[name])
+        flat = EnhancedDrone(SurveyDrone("S-1"), names[:depth])
+        assert stacked.capabilities() == flat.capabilities()
+
+        timings = []
+        for drone in (stacked, flat):
+            start = time.perf_counter()
+            for _ in range(CALLS):
+                drone.capabilities()
+            timings.append((time.perf_counter() - start) / CALLS * 1e6)
+        print(f"{depth:>6} {timings[0]:>13.2f} {timings[1]:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Throughput of streaming legacy mission ingestion.
+
+Writes a synthetic JSON Lines archive (with a share of bad records) and
+ingests it serially, with a process pool (raw lines are parsed in the
+workers), and with a pool whose `parallel_threshold` covers the archive.
+Run from the Lab3 directory:
+
+    python -m benchmarks.bench_ingestion
+"""
+import json
+import os
+import random
+import tempfile
+
+from drone_fleet.utilities.ingestion import MissionIngestor, read_jsonl
+
+RECORDS = 200_000
+BAD_SHARE = 0.01
+
+
+def write_archive(path: str, seed: int = 11) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as fh:
+        for i in range(RECORDS):
+            if rng.random() < BAD_SHARE:
+                fh.write(rng.choice(['{"title": "broken"', '{"title": "x", "wps": [], "len": 5}']) + "\n")
+                continue
+            record = {"title": f"Legacy-{i}", "wps": [f"L{i}", f"L{i + 1}"],
+                      "len": rng.randint(5, 90), "prio": rng.randint(1, 5)}
+            if rng.random() < 0.3:
+                record["cargo"] = "Supplies"
+            fh.write(json.dumps(record) + "\n")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "legacy.jsonl")
+        write_archive(path)
+        for workers, threshold in ((0, 0), (2, 0), (4, 0), (4, RECORDS)):
+            errors = []
+            ingestor = MissionIngestor(batch_size=2_000, workers=workers,
+                                       error_sink=lambda record, problem: errors.append(problem),
+                                       parallel_threshold=threshold)
+            count = sum(1 for _ in ingestor.ingest(read_jsonl(path, raw=workers > 0)))
+            assert count == ingestor.report.converted
+            print(f"workers={workers}, parallel_threshold={threshold:,}: {ingestor.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Memory footprint of drones and missions: plain objects, __slots__, tables.
+
+Reports per-object size and the bulk footprint measured with tracemalloc.
+Run from the Lab3 directory:
+
+    python -m benchmarks.bench_memory
+"""
+import sys
+import tracemalloc
+from typing import Callable, List, Optional
+
+from drone_fleet.models.drone import SurveyDrone
+from drone_fleet.models.mission import Mission
+from drone_fleet.models.tables import DroneTable, MissionTable
+
+COUNT = 200_000
+
+
+class DictMission:
+    """Mission as it was before __slots__ (per-instance __dict__)."""
+
+    def __init__(self, name: str, waypoints: List[str], duration_minutes: int,
+                 priority: int = 3, payload: Optional[str] = None) -> None:
+        self._name = name
+        self._waypoints = list(waypoints)
+        self._duration_minutes = duration_minutes
+        self._priority = priority
+        self._payload = payload
+
+
+class DictDrone:
+    """Drone as it was before __slots__ (per-instance __dict__)."""
+
+    def __init__(self, identifier: str) -> None:
+        self._identifier = identifier
+        self._mission = None
+
+
+def deep_size(obj) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def bulk(build: Callable[[], object]) -> float:
+    """MiB allocated while building and holding the result of `build`."""
+    tracemalloc.start()
+    held = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return current / 2**20
+
+
+# Identifiers and names are shared across variants so only the containers differ.
+NAMES = [f"M-{i}" for i in range(COUNT)]
+WAYPOINTS = [["WP-1", "WP-2"]] * COUNT
+
+
+def build_missions(cls) -> Callable[[], list]:
+    return lambda: [cls(NAMES[i], WAYPOINTS[i], 30, 3, None) for i in range(COUNT)]
+
+
+def build_mission_table() -> MissionTable:
+    table = MissionTable()
+    for i in range(COUNT):
+        table.append(NAMES[i], WAYPOINTS[i], 30, 3, None)
+    return table
+
+
+def build_drone_table() -> DroneTable:
+    table = DroneTable()
+    for i in range(COUNT):
+        table.append(NAMES[i], SurveyDrone)
+    return table
+
+
+def main() -> None:
+    print("per-object bytes (object + __dict__):")
+    print(f"  DictMission {deep_size(DictMission('a', ['b'], 1)):>5}   "
+          f"Mission {deep_size(Mission('a', ['b'], 1)):>5}")
+    print(f"  DictDrone   {deep_size(DictDrone('a')):>5}   "
+          f"SurveyDrone {deep_size(SurveyDrone('a')):>5}")
+    print(f"bulk footprint for {COUNT:,} records (MiB):")
+    print(f"  missions: dict {bulk(build_missions(DictMission)):7.1f}  "
+          f"slots {bulk(build_missions(Mission)):7.1f}  "
+          f"table {bulk(build_mission_table):7.1f}")
+    print(f"  drones:   dict {bulk(lambda: [DictDrone(n) for n in NAMES]):7.1f}  "
+          f"slots {bulk(lambda: [SurveyDrone(n) for n in NAMES]):7.1f}  "
+          f"table {bulk(build_drone_table):7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Nearest-drone selection: scanning the fleet vs the pool's grid index.
+
+Drones are spread uniformly over a square map with about one drone per
+grid cell. Times `strategy.select(pool.available_drones, mission)` (a
+full scan) against `pool.select(strategy, mission)` and a 10-nearest
+query on the index. Run from the Lab3 directory:
+
+    python -m benchmarks.bench_nearest
+"""
+import math
+import random
+import time
+
+from benchmarks.bench_drone_pool import make_fleet
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.mission import Mission
+from drone_fleet.models.waypoints import WaypointRegistry
+from drone_fleet.utilities.strategies import NearestDroneStrategy
+
+SIZES = (1_000, 10_000, 50_000)
+CALLS = 200
+WAYPOINTS = 100
+
+
+def main() -> None:
+    print(f"{'size':>7} {'scan (us)':>10} {'grid (us)':>10} {'10-nearest (us)':>16}")
+    for size in SIZES:
+        rng = random.Random(size)
+        side = math.sqrt(size)
+        fleet = make_fleet(size)
+        for d in fleet:
+            d.move_to((rng.uniform(0, side), rng.uniform(0, side)))
+        waypoints = WaypointRegistry()
+        waypoints.register_many((f"WP-{i}", rng.uniform(0, side), rng.uniform(0, side))
+                                for i in range(WAYPOINTS))
+        missions = [Mission(f"M-{i}", [f"WP-{i}"], 30) for i in range(WAYPOINTS)]
+        strategy = NearestDroneStrategy(waypoints, cell_size=1.0)
+        pool = DronePool(max_size=size)
+        pool.preload(fleet)
+        index = pool.ensure_index(strategy.index)
+
+        scan_calls = max(CALLS * 1_000 // size, 5)
+        start = time.perf_counter()
+        for i in range(scan_calls):
+            strategy.select(pool.available_drones, missions[i % WAYPOINTS])
+        scan = (time.perf_counter() - start) / scan_calls * 1e6
+
+        start = time.perf_counter()
+        for i in range(CALLS):
+            pool.select(strategy, missions[i % WAYPOINTS])
+        grid = (time.perf_counter() - start) / CALLS * 1e6
+
+        start = time.perf_counter()
+        for i in range(CALLS):
+            strategy.nearest(index, missions[i % WAYPOINTS], 10)
+        knn = (time.perf_counter() - start) / CALLS * 1e6
+        print(f"{size:>7} {scan:>10.1f} {grid:>10.1f} {knn:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""MissionScheduler at 1M queued missions.
+
+Queues a million missions, cancels a tenth of them, then drains the
+queue with a small discrete-event loop where each drone flies for the
+mission's duration and its release dispatches the next mission.
+Run from the Lab3 directory:
+
+    python -m benchmarks.bench_scheduler
+"""
+import heapq
+import random
+import time
+
+from benchmarks.bench_drone_pool import make_fleet
+from drone_fleet.domain.fleet_manager import FleetManager
+from drone_fleet.domain.scheduler import MissionScheduler
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.strategies import SimpleSelectionStrategy
+
+MISSIONS = 1_000_000
+DRONES = 1_000
+CANCEL_SHARE = 0.1
+
+
+def main() -> None:
+    rng = random.Random(5)
+    missions = Mission.from_columns(
+        [f"M-{i}" for i in range(MISSIONS)],
+        [("WP",)] * MISSIONS,
+        [rng.randint(5, 120) for _ in range(MISSIONS)],
+        [rng.randint(1, 5) for _ in range(MISSIONS)],
+    )
+    fm = FleetManager.instance()
+    fm.set_pool(DronePool(max_size=DRONES))
+    fm.pool.preload(make_fleet(DRONES))
+    fm.set_selection_strategy(SimpleSelectionStrategy())
+
+    sim_now = [0.0]
+    completions = []
+    expired = []
+
+    def on_dispatch(mission: Mission, drone) -> None:
+        heapq.heappush(completions, (sim_now[0] + mission.duration_minutes, id(drone), drone))
+
+    scheduler = MissionScheduler(fm, on_dispatch=on_dispatch, on_expired=expired.append,
+                                 clock=lambda: sim_now[0])
+
+    start = time.perf_counter()
+    handles = [scheduler.submit(m, deadline=rng.choice((None, 10_000.0)), dispatch=False)
+               for m in missions]
+    submitted = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cancelled = sum(scheduler.cancel(h) for h in rng.sample(handles, int(MISSIONS * CANCEL_SHARE)))
+    cancelling = time.perf_counter() - start
+    del handles
+
+    start = time.perf_counter()
+    scheduler.dispatch()
+    while completions:
+        sim_now[0], _, drone = heapq.heappop(completions)
+        fm.release_drone(drone)  # the release listener dispatches the next mission
+    draining = time.perf_counter() - start
+
+    print(f"submit  {MISSIONS:>9,}: {submitted:6.2f} s ({MISSIONS / submitted:>10,.0f}/s)")
+    print(f"cancel  {cancelled:>9,}: {cancelling:6.2f} s ({cancelled / cancelling:>10,.0f}/s)")
+    print(f"drain   {MISSIONS - cancelled:>9,}: {draining:6.2f} s "
+          f"({(MISSIONS - cancelled) / draining:>10,.0f}/s), expired={len(expired):,}, "
+          f"simulated {sim_now[0] / 60:,.0f} h")
+
+
+if __name__ == "__main__":
+    main()
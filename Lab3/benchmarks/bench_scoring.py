@@ -0,0 +1,52 @@
+"""ScoringSelectionStrategy: scoring every drone vs scoring bucket heads.
+
+Times `strategy.select(pool.available_drones, mission)` (one score per
+drone) against `pool.select(strategy, mission)` (one score per
+type/enhancement bucket) for growing fleets with mixed enhancements.
+Run from the Lab3 directory:
+
+    python -m benchmarks.bench_scoring
+"""
+import time
+
+from benchmarks.bench_drone_pool import make_fleet
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import CargoDrone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.decorators import EnhancedDrone
+from drone_fleet.utilities.strategies import ScoringSelectionStrategy
+
+SIZES = (1_000, 10_000, 50_000)
+CALLS = 200
+MISSION = Mission("Recon", ["WP-1"], 30, priority=3, payload="HD Camera")
+ENHANCEMENT_SETS = ((), ("stealth",), ("range_extender",), ("stealth", "range_extender"))
+
+
+def main() -> None:
+    strategy = ScoringSelectionStrategy(
+        type_weights={CargoDrone: 1.0},
+        enhancement_weights={"stealth": 2.0, "range_extender": 1.0},
+        idle_weight=0.01,
+    )
+    print(f"{'size':>7} {'per drone (us)':>15} {'per bucket (us)':>16}")
+    for size in SIZES:
+        fleet = [EnhancedDrone(d, ENHANCEMENT_SETS[i % 4]) if i % 4 else d
+                 for i, d in enumerate(make_fleet(size))]
+        pool = DronePool(max_size=size)
+        pool.preload(fleet)
+        pool.ensure_index(strategy.index)
+
+        start = time.perf_counter()
+        for _ in range(CALLS // 20):
+            strategy.select(pool.available_drones, MISSION)
+        per_drone = (time.perf_counter() - start) / (CALLS // 20) * 1e6
+
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            pool.select(strategy, MISSION)
+        per_bucket = (time.perf_counter() - start) / CALLS * 1e6
+        print(f"{size:>7} {per_drone:>15.1f} {per_bucket:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""List-based vs index-based strategy selection.
+
+Times `strategy.select(pool.available_drones, mission)` (the old path)
+against `pool.select(strategy, mission)` for growing fleets.
+Run from the Lab3 directory:
+
+    python -m benchmarks.bench_selection
+"""
+import time
+
+from benchmarks.bench_drone_pool import make_fleet
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.strategies import (
+    PrioritySelectionStrategy,
+    SimpleSelectionStrategy,
+    LeastRecentlyUsedSelectionStrategy,
+)
+
+SIZES = (1_000, 10_000, 50_000)
+CALLS = 500
+MISSION = Mission("Recon", ["WP-1"], 30, priority=2, payload="HD Camera")
+
+
+def main() -> None:
+    print(f"{'strategy':>36} {'size':>7} {'list (us)':>10} {'indexed (us)':>13}")
+    for strategy in (SimpleSelectionStrategy(), PrioritySelectionStrategy(),
+                     LeastRecentlyUsedSelectionStrategy()):
+        for size in SIZES:
+            # Only cargo drones up front, so the camera rule scans the whole list.
+            fleet = sorted(make_fleet(size), key=lambda d: type(d).__name__ != "CargoDrone")
+            pool = DronePool(max_size=size)
+            pool.preload(fleet)
+            pool.ensure_index(strategy.index)
+
+            start = time.perf_counter()
+            for _ in range(CALLS):
+                strategy.select(pool.available_drones, MISSION)
+            listed = (time.perf_counter() - start) / CALLS * 1e6
+
+            start = time.perf_counter()
+            for _ in range(CALLS):
+                pool.select(strategy, MISSION)
+            indexed = (time.perf_counter() - start) / CALLS * 1e6
+            print(f"{type(strategy).__name__:>36} {size:>7} {listed:>10.1f} {indexed:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
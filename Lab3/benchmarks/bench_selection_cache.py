@@ -0,0 +1,75 @@
+"""Selection with and without CachingSelectionStrategy.
+
+Missions from a small set of signatures are assigned and released in a
+steady churn. Each strategy is timed per `pool.select()` call, uncached and
+wrapped in CachingSelectionStrategy, and the cache hit rate is reported.
+`ScanStrategy` stands in for a user-defined list strategy that scans the
+fleet; its cached decisions are reused only while the pool is unchanged,
+which the churn here tests with several selections per change.
+Run from the Lab3 directory:
+
+    python -m benchmarks.bench_selection_cache
+"""
+import random
+import time
+from typing import List
+
+from benchmarks.bench_drone_pool import make_fleet
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import Drone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.strategies import (
+    CachingSelectionStrategy,
+    LeastRecentlyUsedSelectionStrategy,
+    PrioritySelectionStrategy,
+    SelectionStrategy,
+    SimpleSelectionStrategy,
+)
+
+FLEET_SIZE = 10_000
+ROUNDS = 2_000
+# Selections per checkout: e.g. a dispatcher re-ranking its queue.
+PEEKS = 4
+MISSIONS = [Mission(f"M-{p}-{payload}", ["WP-1"], 30, priority=p, payload=payload)
+            for p in range(1, 6) for payload in (None, "HD Camera", "Cargo")]
+
+
+class ScanStrategy(SelectionStrategy):
+    """Picks the drone with the smallest identifier by scanning the list."""
+
+    def select(self, available: List[Drone], mission: Mission) -> Drone:  # type: ignore[override]
+        return min(available, key=lambda d: d.identifier)
+
+
+def run(strategy: SelectionStrategy) -> float:
+    """Average microseconds per `pool.select()` call."""
+    rng = random.Random(7)
+    pool = DronePool(max_size=FLEET_SIZE)
+    pool.preload(make_fleet(FLEET_SIZE))
+    held: List[Drone] = []
+    elapsed = 0.0
+    for _ in range(ROUNDS):
+        mission = rng.choice(MISSIONS)
+        start = time.perf_counter()
+        for _ in range(PEEKS):
+            drone = pool.select(strategy, mission)
+        elapsed += time.perf_counter() - start
+        held.append(pool.checkout_specific(drone))
+        if len(held) > 100:
+            pool.release(held.pop(rng.randrange(len(held))))
+    return elapsed / (ROUNDS * PEEKS) * 1e6
+
+
+def main() -> None:
+    print(f"{'strategy':>36} {'plain (us)':>11} {'cached (us)':>12} {'hit rate':>9}")
+    for strategy in (SimpleSelectionStrategy(), PrioritySelectionStrategy(),
+                     LeastRecentlyUsedSelectionStrategy(), ScanStrategy()):
+        plain = run(strategy)
+        cached_strategy = CachingSelectionStrategy(strategy)
+        cached = run(cached_strategy)
+        rate = cached_strategy.stats["hit_rate"]
+        print(f"{type(strategy).__name__:>36} {plain:>11.2f} {cached:>12.2f} {rate:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Throughput of a sharded fleet as worker processes are added.
+
+Each task assigns a batch of missions through the worker's FleetManager,
+holding every drone until the batch is done, then releases them; a drone
+handed to two holders at once would fail the run. Throughput can only
+grow with workers up to the number of CPUs. Run from the Lab3 directory:
+
+    python -m benchmarks.bench_sharded
+"""
+import os
+import time
+from typing import List
+
+from benchmarks.bench_drone_pool import make_fleet
+from drone_fleet.domain.fleet_manager import FleetManager
+from drone_fleet.domain.sharded_fleet import ShardedFleet
+from drone_fleet.models.mission import Mission
+
+WORKERS = (1, 2, 4)
+FLEET_SIZE = 10_000
+TASKS = 64
+BATCH = 500
+
+
+def assign_batch(fleet: FleetManager, task: int) -> int:
+    drones = [fleet.assign_mission_to_drone(Mission(f"M-{task}-{i}", ["WP-1"], 10))
+              for i in range(BATCH)]
+    if len({d.identifier for d in drones}) != len(drones):
+        raise RuntimeError("A drone was assigned twice")
+    for d in drones:
+        fleet.release_drone(d)
+    return len(drones)
+
+
+def run(workers: int) -> float:
+    """Assignments (plus releases) per second across all workers."""
+    with ShardedFleet(make_fleet(FLEET_SIZE), workers) as fleet:
+        fleet.map(assign_batch, range(workers))  # warm up: start workers, build drones
+        start = time.perf_counter()
+        done: List[int] = fleet.map(assign_batch, range(TASKS))
+        elapsed = time.perf_counter() - start
+        if fleet.pool.available_count() != FLEET_SIZE:
+            raise RuntimeError("Drones were lost")
+    return sum(done) / elapsed
+
+
+def main() -> None:
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'workers':>8} {'assign/s':>12} {'speedup':>8}")
+    base = None
+    for workers in WORKERS:
+        rate = run(workers)
+        base = base or rate
+        print(f"{workers:>8} {rate:>12,.0f} {rate / base:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
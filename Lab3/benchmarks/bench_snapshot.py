@@ -0,0 +1,55 @@
+"""Warm restart: rebuilding the fleet from factories vs restoring a snapshot.
+
+The cold path creates every drone through the registry, preloads the pool
+and re-assigns the in-flight missions; the warm path loads the snapshot
+file written from the same state. Run from the Lab3 directory:
+
+    python -m benchmarks.bench_snapshot
+"""
+import os
+import tempfile
+import time
+
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.factory.registry import default_registry
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.snapshot import load_snapshot, save_snapshot
+
+SIZES = (10_000, 100_000, 500_000)
+IN_FLIGHT = 0.1
+KINDS = ("survey", "cargo", "combat")
+
+
+def cold_start(size: int) -> DronePool:
+    pool = DronePool(max_size=size)
+    drones = []
+    for n, kind in enumerate(KINDS):
+        drones += default_registry.create_many(kind, [f"{kind}-{i}" for i in range(n, size, 3)])
+    pool.preload(drones)
+    for i, drone in enumerate(drones[:int(size * IN_FLIGHT)]):
+        pool.checkout_specific(drone).assign_mission(Mission(f"M-{i}", ["WP-1", "WP-2"], 30))
+    return pool
+
+
+def main() -> None:
+    print(f"{'size':>8} {'cold (ms)':>10} {'save (ms)':>10} {'restore (ms)':>13} {'file (MB)':>10}")
+    for size in SIZES:
+        start = time.perf_counter()
+        pool = cold_start(size)
+        cold = time.perf_counter() - start
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "fleet.snap")
+            start = time.perf_counter()
+            written = save_snapshot(path, pool)
+            saved = time.perf_counter() - start
+            start = time.perf_counter()
+            restored, _ = load_snapshot(path, lambda kind, ident: default_registry.create(kind, ident),
+                                         pause_gc=True)
+            warm = time.perf_counter() - start
+        assert restored.stats == pool.stats
+        print(f"{size:>8} {cold * 1e3:>10.0f} {saved * 1e3:>10.0f} {warm * 1e3:>13.0f} "
+              f"{written / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
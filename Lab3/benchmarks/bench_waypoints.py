@@ -0,0 +1,55 @@
+"""Allocation cost of reading Mission.waypoints in a render-style loop.
+
+Compares the previous copy-on-read behaviour with the tuple-backed
+Mission using tracemalloc. Run from the Lab3 directory:
+
+    python -m benchmarks.bench_waypoints
+"""
+import time
+import tracemalloc
+from typing import List
+
+from drone_fleet.factory.mission_builder import MissionBuilder
+
+READS = 200_000
+WAYPOINT_COUNT = 20
+
+
+class CopyingMission:
+    """Reference: copies waypoints on construction and on every read."""
+
+    def __init__(self, waypoints: List[str]) -> None:
+        self._waypoints = list(waypoints)
+
+    @property
+    def waypoints(self) -> List[str]:
+        return list(self._waypoints)
+
+
+def render(mission) -> tuple:
+    """Hold every read like a frame buffer would; return (MiB, seconds)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    frames = [mission.waypoints for _ in range(READS)]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del frames
+    return current / 2**20, elapsed
+
+
+def main() -> None:
+    builder = MissionBuilder().name("Route").duration(30)
+    for i in range(WAYPOINT_COUNT):
+        builder.add_waypoint(f"WP-{i}")
+    mission = builder.build()
+    copying = CopyingMission(list(mission.waypoints))
+
+    for label, target in (("copy-on-read", copying), ("tuple view", mission)):
+        mib, seconds = render(target)
+        print(f"{label:>13}: {mib:7.1f} MiB retained, {seconds * 1e3:7.1f} ms "
+              f"for {READS:,} reads of {WAYPOINT_COUNT} waypoints")
+
+
+if __name__ == "__main__":
+    main()
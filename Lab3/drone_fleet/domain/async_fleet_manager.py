@@ -0,0 +1,57 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from drone_fleet.domain.fleet_manager import FleetManager
+from drone_fleet.factory.async_pool import AsyncDronePool
+from drone_fleet.models.drone import Drone
+from drone_fleet.models.mission import Mission
+
+
+class AsyncFleetManager:
+    """asyncio facade over FleetManager that waits for drones instead of failing.
+
+    Shares the wrapped manager's pool and selection strategy, following
+    the manager when it swaps pools. Waiters are woken in FIFO order by
+    default, or by mission priority with ``order="priority"``.
+    """
+
+    def __init__(self, fleet: Optional[FleetManager] = None, order: str = "fifo") -> None:
+        self._fleet = fleet or FleetManager.instance()
+        self._pool = AsyncDronePool(self._fleet.pool, order)
+
+    @property
+    def fleet(self) -> FleetManager:
+        return self._fleet
+
+    def _current(self) -> AsyncDronePool:
+        pool = self._fleet.pool
+        if self._pool.pool is not pool:
+            self._pool.rebind(pool)
+        return self._pool
+
+    async def assign_mission(self, mission: Mission, timeout: Optional[float] = None) -> Drone:
+        """Wait for a drone chosen by the fleet's strategy and assign `mission`."""
+        strategy = self._fleet.selection_strategy
+        checkout = self._current().checkout(
+            lambda pool: pool.select(strategy, mission),
+            priority=mission.priority,
+        )
+        drone = await (checkout if timeout is None else asyncio.wait_for(checkout, timeout))
+        drone.assign_mission(mission)
+        return drone
+
+    async def release(self, drone: Drone) -> None:
+        pool = self._current()
+        if self._fleet.pool_of(drone) is pool.pool:
+            pool.release(drone)
+        else:
+            self._fleet.release_drone(drone)  # checked out before a pool swap
+
+    @asynccontextmanager
+    async def lease(self, mission: Mission) -> AsyncIterator[Drone]:
+        """Assign `mission` for the duration of the block, then release."""
+        drone = await self.assign_mission(mission)
+        try:
+            yield drone
+        finally:
+            await self.release(drone)
@@ -1,16 +1,19 @@
-from typing import Optional, Dict, Callable
-from drone_fleet.factory.drone_factory import (
-    SurveyDroneFactory,
-    CargoDroneFactory,
-    CombatDroneFactory,
-)
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Iterable, List, Sequence, Tuple
 from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.factory.elastic_pool import ElasticDronePool
 from drone_fleet.factory.mission_builder import MissionBuilder
+from drone_fleet.factory.registry import DroneFactoryRegistry, default_registry
 from drone_fleet.models.drone import Drone
 from drone_fleet.models.mission import Mission
 from drone_fleet.utilities.adapters import LegacyMissionAdapter
-from drone_fleet.utilities.decorators import StealthDecorator, RangeExtenderDecorator
+from drone_fleet.utilities.assignment import BatchAssigner
+from drone_fleet.utilities import instrumentation
+from drone_fleet.utilities.decorators import EnhancedDrone
 from drone_fleet.utilities.proxy import DroneProxy
+from drone_fleet.utilities.snapshot import load_snapshot, save_snapshot
 from drone_fleet.utilities.strategies import (
     SelectionStrategy,
     SimpleSelectionStrategy,
@@ -27,12 +30,11 @@ class FleetManager:
             raise RuntimeError("Use FleetManager.instance() to get the singleton instance")
         self._pool = DronePool(max_size=5)
         self._selection_strategy: SelectionStrategy = SimpleSelectionStrategy()
-        # Map for lazy drone creation (proxy) by kind string
-        self._lazy_factories: Dict[str, Callable[[str], Drone]] = {
-            'survey': lambda ident: SurveyDroneFactory().create(ident),
-            'cargo': lambda ident: CargoDroneFactory().create(ident),
-            'combat': lambda ident: CombatDroneFactory().create(ident),
-        }
+        # Replaced pools that still have drones checked out; see `release_drone`.
+        self._retired: List[DronePool] = []
+        self._retired_lock = threading.Lock()
+        # Drone kinds (survey, cargo, combat, plugins) -> cached factories
+        self._factories: DroneFactoryRegistry = default_registry
 
     @classmethod
     def instance(cls) -> 'FleetManager':
@@ -42,26 +44,165 @@ class FleetManager:
 
     def preload_drones(self) -> None:
         drones = [
-            SurveyDroneFactory().create('S-1'),
-            CargoDroneFactory().create('C-1'),
-            CombatDroneFactory().create('X-1'),
+            self._factories.create('survey', 'S-1'),
+            self._factories.create('cargo', 'C-1'),
+            self._factories.create('combat', 'X-1'),
         ]
         self._pool.preload(drones)
 
+    def create_drones(self, kind: str, identifiers: Sequence[str], workers: int = 0) -> List[Drone]:
+        """Bulk-create drones of one kind (see `DroneFactory.create_many`)."""
+        return self._factories.create_many(kind, identifiers, workers=workers)
+
     def create_mission(self, name: str) -> MissionBuilder:
         return MissionBuilder().name(name)
 
     def set_selection_strategy(self, strategy: SelectionStrategy) -> None:
         self._selection_strategy = strategy
 
-    def assign_mission_to_drone(self, mission: Mission) -> Drone:
-        drone_choice = self._selection_strategy.select(self._pool.available_drones, mission)
-        drone = self._pool.checkout_specific(drone_choice)
-        drone.assign_mission(mission)
-        return drone
+    @property
+    def selection_strategy(self) -> SelectionStrategy:
+        return self._selection_strategy
+
+    @property
+    def pool(self) -> DronePool:
+        return self._pool
+
+    def set_pool(self, pool: DronePool) -> None:
+        """Swap the backing pool, e.g. for a `ConcurrentDronePool` (see `_replace_pool`)."""
+        self._replace_pool(pool)
+
+    def _replace_pool(self, pool: DronePool) -> None:
+        """Swap in `pool`, stopping the old pool's replenisher and moving its release listeners.
+
+        Drones still checked out from the old pool are released back to it
+        by `release_drone`, so their missions are cleared and nothing leaks.
+        """
+        old = self._pool
+        if pool is old:
+            return
+        if isinstance(old, ElasticDronePool):
+            old.stop()
+        old.transfer_release_listeners(pool)
+        with self._retired_lock:
+            retired = [p for p in self._retired if p is not pool]
+            if old.in_use_count():
+                retired.append(old)
+            self._retired = retired
+        self._pool = pool
+
+    def save_snapshot(self, path: str, proxies: Iterable[DroneProxy] = ()) -> int:
+        """Save the pool (and detached lazy `proxies`) to `path`; returns the file size."""
+        return save_snapshot(path, self._pool, proxies)
+
+    def restore_snapshot(self, path: str) -> List[DroneProxy]:
+        """Replace the pool with the one saved at `path`; returns the saved detached proxies.
+
+        In-use drones come back checked out with their missions, so a warm
+        restart can skip `preload_drones()`.
+        """
+        pool, proxies = load_snapshot(path, lambda kind, ident: self.lazy_drone(kind, ident),
+                                      registry=self._factories)
+        self._replace_pool(pool)
+        return proxies
+
+    def enable_autoscaling(self, watermarks: Dict[str, Tuple[int, int]],
+                           idle_ttl: Optional[float] = None) -> ElasticDronePool:
+        """Switch to an elastic pool with per-kind (min_available, max_total) watermarks."""
+        makers = {kind: self._factories.get(kind).create for kind in watermarks}
+        pool = ElasticDronePool(watermarks, makers, idle_ttl=idle_ttl)
+        self._replace_pool(pool)
+        pool.start()
+        return pool
+
+    def assign_mission_to_drone(self, mission: Mission, timeout: Optional[float] = 0.0) -> Drone:
+        """Select and check out a drone for `mission`.
+
+        Safe to call from several threads when backed by a concurrent pool:
+        if another thread checks out the selected drone first, selection is
+        retried. When no drone is available, waits up to `timeout` seconds
+        (None = no limit) for a release; single-threaded pools never wait.
+        """
+        metrics = instrumentation.ACTIVE
+        if metrics is None:
+            return self._assign(mission, timeout)
+        with metrics.timer("drone_fleet_assign_seconds"):
+            try:
+                return self._assign(mission, timeout)
+            except RuntimeError:
+                metrics.count("drone_fleet_assign_failures_total")
+                raise
+
+    def _assign(self, mission: Mission, timeout: Optional[float]) -> Drone:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            generation, discards = self._pool.generation, self._pool.discards
+            metrics = instrumentation.ACTIVE
+            if metrics is None:
+                drone_choice = self._pool.select(self._selection_strategy, mission)
+            else:
+                with metrics.timer("drone_fleet_select_seconds",
+                                   strategy=type(self._selection_strategy).__name__):
+                    drone_choice = self._pool.select(self._selection_strategy, mission)
+            if drone_choice is not None:
+                drone = self._pool.try_checkout_specific(drone_choice)
+                if drone is not None:
+                    drone.assign_mission(mission)
+                    return drone
+                # Retry only if another caller took it (or an elastic pool
+                # evicted it); a strategy returning a drone the pool cannot
+                # hand out would otherwise loop forever.
+                if self._pool.generation != generation or self._pool.discards != discards \
+                        or self._pool.is_in_use(drone_choice):
+                    continue
+                raise RuntimeError("Requested drone is not available")
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise RuntimeError("No drones available")
+            if not self._pool.wait_for_release(generation, remaining):
+                raise RuntimeError("No drones available")
+
+    def assign_many(self, missions: Sequence[Mission]) -> List[Tuple[Mission, Drone]]:
+        """Assign a burst of missions against a single pool snapshot.
+
+        Higher-priority missions are matched first using the strategy's
+        `cost()`. Returns (mission, drone) pairs in input order; missions
+        that could not get a drone are left out.
+        """
+        strategy = self._selection_strategy
+        discards = self._pool.discards
+        pairs = BatchAssigner(strategy.cost, strategy.cost_key).solve(
+            missions, self._pool.available_by_type()
+        )
+        assigned = []
+        for mission, drone in pairs:
+            # Under a concurrent pool another thread may have taken it since.
+            if self._pool.try_checkout_specific(drone) is not None:
+                drone.assign_mission(mission)
+                assigned.append((mission, drone))
+            elif not self._pool.is_in_use(drone) and self._pool.discards == discards:
+                raise RuntimeError("Requested drone is not available")
+        return assigned
 
     def release_drone(self, drone: Drone) -> None:
-        self._pool.release(drone)
+        """Return `drone` to the pool it was checked out from."""
+        self.pool_of(drone).release(drone)
+        if self._retired:
+            with self._retired_lock:
+                self._retired = [p for p in self._retired if p.in_use_count()]
+
+    def pool_of(self, drone: Drone) -> DronePool:
+        """The pool `drone` is checked out from, defaulting to the current one.
+
+        Drones checked out before a pool swap belong to the pool they came from.
+        """
+        if self._retired and not self._pool.is_in_use(drone):
+            with self._retired_lock:
+                retired = list(self._retired)
+            for pool in retired:
+                if pool.is_in_use(drone):
+                    return pool
+        return self._pool
 
     def pool_stats(self) -> str:
         return self._pool.stats
@@ -70,14 +211,34 @@ class FleetManager:
         return LegacyMissionAdapter(legacy_dict).to_mission()
 
     def lazy_drone(self, kind: str, identifier: str) -> Drone:
-        factory = self._lazy_factories.get(kind.lower())
-        if not factory:
-            raise ValueError(f"Unknown drone kind: {kind}")
-        return DroneProxy(identifier, lambda: factory(identifier))
+        factory = self._factories.get(kind)
+        return DroneProxy(identifier, lambda: factory.create(identifier), kind=kind,
+                          drone_type=factory.product)
+
+    def prefetch(self, proxies: Iterable[DroneProxy], workers: int = 8) -> int:
+        """Realize lazy drones ahead of a known spike; returns how many were created."""
+        pending = [p for p in proxies if not p.is_realized]
+        if pending:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(DroneProxy.realize, pending))
+        return len(pending)
+
+    def demote_idle(self, proxies: Iterable[DroneProxy], max_idle: float) -> int:
+        """Return idle, mission-free proxies to the unrealized state; returns the count."""
+        return sum(1 for p in proxies if p.demote_if_idle(max_idle))
 
-    def enhance_drone(self, drone: Drone, *, stealth: bool = False, range_extender: bool = False) -> Drone:
+    def enhance_drone(self, drone: Drone, *, stealth: bool = False, range_extender: bool = False,
+                      extra: Iterable[str] = ()) -> Drone:
+        """Add enhancements, flattening them into a single EnhancedDrone wrapper."""
+        names = list(extra)
         if stealth:
-            drone = StealthDecorator(drone)
+            names.append("stealth")
         if range_extender:
-            drone = RangeExtenderDecorator(drone)
-        return drone
+            names.append("range_extender")
+        if not names:
+            return drone
+        if isinstance(drone, EnhancedDrone):
+            drone.add(*names)
+            self._pool.refresh(drone)
+            return drone
+        return EnhancedDrone(drone, names)
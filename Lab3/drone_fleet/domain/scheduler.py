@@ -0,0 +1,172 @@
+import itertools
+import math
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+from drone_fleet.domain.fleet_manager import FleetManager
+from drone_fleet.models.drone import Drone
+from drone_fleet.models.mission import Mission
+
+
+class ScheduledMission:
+    """Handle for a queued mission; pass it to `MissionScheduler.cancel()`."""
+
+    __slots__ = ("mission", "deadline", "_key", "_position")
+
+    def __init__(self, mission: Mission, deadline: Optional[float], seq: int) -> None:
+        self.mission = mission
+        self.deadline = deadline
+        # Highest priority first, then earliest deadline, then submission order.
+        self._key = (-mission.priority, math.inf if deadline is None else deadline, seq)
+        self._position = -1
+
+    @property
+    def queued(self) -> bool:
+        return self._position >= 0
+
+    def __repr__(self) -> str:
+        return f"ScheduledMission({self.mission.name!r}, deadline={self.deadline})"
+
+
+class MissionScheduler:
+    """Priority/deadline queue that dispatches missions as drones free up.
+
+    Missions wait in an indexed binary heap ordered by priority, then
+    deadline. Each entry knows its heap position, so `cancel()` is
+    O(log n). The scheduler listens to the fleet pool's releases and
+    dispatches through `FleetManager.assign_mission_to_drone` whenever a
+    drone comes back. Missions whose deadline has passed when they reach
+    the front are dropped and reported to `on_expired`; missions the
+    selection strategy fails on are dropped and reported to `on_error`
+    (or, without one, the first failure is raised once dispatch is done).
+    Deadlines use the same clock as `clock` (monotonic seconds by default).
+    """
+
+    def __init__(self, fleet: Optional[FleetManager] = None,
+                 on_dispatch: Optional[Callable[[Mission, Drone], None]] = None,
+                 on_expired: Optional[Callable[[Mission], None]] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 on_error: Optional[Callable[[Mission, Exception], None]] = None) -> None:
+        self._fleet = fleet or FleetManager.instance()
+        self._on_dispatch = on_dispatch
+        self._on_expired = on_expired
+        self._on_error = on_error
+        self._clock = clock
+        self._heap: List[ScheduledMission] = []
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
+        self._fleet.pool.add_release_listener(self._on_release)
+
+    def close(self) -> None:
+        """Stop reacting to pool releases."""
+        self._fleet.pool.remove_release_listener(self._on_release)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def submit(self, mission: Mission, deadline: Optional[float] = None,
+               dispatch: bool = True) -> ScheduledMission:
+        """Queue `mission`; dispatches right away if a drone is free."""
+        entry = ScheduledMission(mission, deadline, next(self._seq))
+        with self._lock:
+            entry._position = len(self._heap)
+            self._heap.append(entry)
+            self._sift_up(entry._position)
+        if dispatch:
+            self.dispatch()
+        return entry
+
+    def cancel(self, entry: ScheduledMission) -> bool:
+        """Remove a queued mission in O(log n); False if it is not queued here."""
+        with self._lock:
+            position = entry._position
+            if not 0 <= position < len(self._heap) or self._heap[position] is not entry:
+                return False
+            self._remove_at(entry._position)
+            return True
+
+    def peek(self) -> Optional[ScheduledMission]:
+        with self._lock:
+            return self._heap[0] if self._heap else None
+
+    def dispatch(self) -> List[Tuple[Mission, Drone]]:
+        """Assign queued missions while drones are available."""
+        dispatched = []
+        failed: List[Tuple[Mission, Exception]] = []
+        with self._lock:
+            while self._heap and self._fleet.pool.available_count():
+                entry = self._heap[0]
+                if entry.deadline is not None and entry.deadline < self._clock():
+                    self._remove_at(0)
+                    if self._on_expired is not None:
+                        self._on_expired(entry.mission)
+                    continue
+                try:
+                    drone = self._fleet.assign_mission_to_drone(entry.mission)
+                except RuntimeError:
+                    break  # another caller took the last drone
+                except Exception as exc:
+                    # The strategy failed on this mission; drop it so it
+                    # cannot block the missions queued behind it.
+                    self._remove_at(0)
+                    failed.append((entry.mission, exc))
+                    continue
+                self._remove_at(0)
+                dispatched.append((entry.mission, drone))
+        if self._on_dispatch is not None:
+            for mission, drone in dispatched:
+                self._on_dispatch(mission, drone)
+        if failed:
+            if self._on_error is None:
+                raise failed[0][1]
+            for mission, exc in failed:
+                self._on_error(mission, exc)
+        return dispatched
+
+    def _on_release(self, drone: Drone) -> None:
+        if self._heap:
+            self.dispatch()
+
+    # -- indexed heap -------------------------------------------------------
+
+    def _remove_at(self, position: int) -> None:
+        heap = self._heap
+        removed = heap[position]
+        last = heap.pop()
+        removed._position = -1
+        if position < len(heap):
+            heap[position] = last
+            last._position = position
+            self._sift_down(position)
+            self._sift_up(last._position)
+
+    def _sift_up(self, position: int) -> None:
+        heap = self._heap
+        entry = heap[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            if heap[parent]._key <= entry._key:
+                break
+            heap[position] = heap[parent]
+            heap[position]._position = position
+            position = parent
+        heap[position] = entry
+        entry._position = position
+
+    def _sift_down(self, position: int) -> None:
+        heap = self._heap
+        size = len(heap)
+        entry = heap[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1]._key < heap[child]._key:
+                child += 1
+            if entry._key <= heap[child]._key:
+                break
+            heap[position] = heap[child]
+            heap[position]._position = position
+            position = child
+        heap[position] = entry
+        entry._position = position
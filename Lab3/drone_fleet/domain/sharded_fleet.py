@@ -0,0 +1,83 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Sequence, TypeVar
+from drone_fleet.domain.fleet_manager import FleetManager
+from drone_fleet.factory.sharded_pool import SharedAvailability, ShardedDronePool, ShardLayout
+from drone_fleet.models.drone import Drone
+from drone_fleet.utilities.strategies import SelectionStrategy
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_worker_pool: Optional[ShardedDronePool] = None
+
+
+class ShardedFleet:
+    """Runs fleet work in several processes that share one pool of drones.
+
+    Each worker process gets its own `FleetManager` whose pool is a
+    `ShardedDronePool` over the same shared availability bitmap, so missions
+    assigned in different processes never get the same drone. Workers start
+    their searches in different parts of the fleet to keep contention low.
+    `map(fn, items)` calls ``fn(fleet_manager, item)`` in the workers;
+    `fn` must be picklable (a module-level function).
+    """
+
+    def __init__(self, drones: Sequence[Drone], workers: int,
+                 strategy: Optional[SelectionStrategy] = None, stripes: int = 64) -> None:
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        self._shared = SharedAvailability.create(drones, stripes)
+        self._pool = ShardedDronePool(self._shared)
+        counter = multiprocessing.Value("i", 0)
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._shared.layout, self._shared.locks, counter, workers, strategy),
+        )
+
+    @property
+    def pool(self) -> ShardedDronePool:
+        """This process's view of the shared pool."""
+        return self._pool
+
+    def map(self, fn: Callable[[FleetManager, T], R], items: Iterable[T],
+            chunksize: int = 1) -> List[R]:
+        items = list(items)
+        return list(self._executor.map(_call, [fn] * len(items), items, chunksize=chunksize))
+
+    def submit(self, fn: Callable[[FleetManager, T], R], item: T) -> Any:
+        """Schedule ``fn(fleet_manager, item)`` in a worker; returns a Future."""
+        return self._executor.submit(_call, fn, item)
+
+    def release(self, drone: Drone) -> None:
+        """Return a drone checked out by any worker, e.g. one a task sent back."""
+        self._pool.release(drone)
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory."""
+        self._executor.shutdown()
+        self._shared.close()
+
+    def __enter__(self) -> 'ShardedFleet':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _init_worker(layout: ShardLayout, locks: list, counter: Any, workers: int,
+                 strategy: Optional[SelectionStrategy]) -> None:
+    global _worker_pool
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    _worker_pool = ShardedDronePool(SharedAvailability.attach(layout, locks), home=index / workers)
+    fleet = FleetManager.instance()
+    fleet.set_pool(_worker_pool)
+    if strategy is not None:
+        fleet.set_selection_strategy(strategy)
+
+
+def _call(fn: Callable[[FleetManager, T], R], item: T) -> R:
+    return fn(FleetManager.instance(), item)
@@ -0,0 +1,109 @@
+import asyncio
+import heapq
+import itertools
+from typing import Callable, List, Optional, Tuple
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import Drone
+
+Selector = Callable[[DronePool], Optional[Drone]]
+
+
+class AsyncDronePool:
+    """asyncio-aware wrapper around a DronePool.
+
+    `checkout()` awaits a drone instead of failing when the pool is empty.
+    Each waiter parks on its own future, and `release()` hands the returned
+    drone straight to the next waiter, so no task ever polls. Waiters are
+    served in arrival order (``order="fifo"``) or highest priority first
+    (``order="priority"``). Must be used from a single event loop, and
+    releases must go through this wrapper to wake waiters.
+    """
+
+    def __init__(self, pool: DronePool, order: str = "fifo") -> None:
+        if order not in ("fifo", "priority"):
+            raise ValueError(f"Unknown waiter order: {order}")
+        self._pool = pool
+        self._order = order
+        self._waiters: List[Tuple[int, int, Tuple[asyncio.Future, Optional[Selector]]]] = []
+        self._seq = itertools.count()
+
+    @property
+    def pool(self) -> DronePool:
+        return self._pool
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, (fut, _) in self._waiters if not fut.done())
+
+    def rebind(self, pool: DronePool) -> None:
+        """Serve checkouts from `pool` instead, e.g. after the fleet swapped pools.
+
+        Parked waiters carry over and are woken if `pool` has drones free.
+        """
+        self._pool = pool
+        self._wake()
+
+    def preload(self, drones: List[Drone]) -> None:
+        self._pool.preload(drones)
+        self._wake()
+
+    async def checkout(self, select: Optional[Selector] = None, priority: int = 0) -> Drone:
+        """Check out a drone, waiting for a release if none is available.
+
+        `select` picks an available drone from the pool (defaults to the
+        pool's LIFO `checkout()`); `priority` only matters with ``order="priority"``.
+        """
+        if not self._has_waiters():
+            drone = self._try_checkout(select)
+            if drone is not None:
+                return drone
+        fut = asyncio.get_running_loop().create_future()
+        key = -priority if self._order == "priority" else 0
+        heapq.heappush(self._waiters, (key, next(self._seq), (fut, select)))
+        try:
+            return await fut
+        except asyncio.CancelledError:
+            # Cancelled after a drone was handed over: give it back.
+            if fut.done() and not fut.cancelled():
+                self.release(fut.result())
+            raise
+
+    def release(self, drone: Drone) -> None:
+        self._pool.release(drone)
+        self._wake()
+
+    def _has_waiters(self) -> bool:
+        while self._waiters and self._waiters[0][2][0].done():
+            heapq.heappop(self._waiters)
+        return bool(self._waiters)
+
+    def _try_checkout(self, select: Optional[Selector]) -> Optional[Drone]:
+        while self._pool.available_count():
+            if select is None:
+                drone = self._pool.try_checkout()
+            else:
+                choice = select(self._pool)
+                if choice is None:
+                    return None
+                drone = self._pool.try_checkout_specific(choice)
+                if drone is None and not self._pool.is_in_use(choice):
+                    # Not taken by someone else: retrying would never succeed.
+                    raise RuntimeError("Requested drone is not available")
+            if drone is not None:
+                return drone
+        return None
+
+    def _wake(self) -> None:
+        while self._has_waiters() and self._pool.available_count():
+            entry = heapq.heappop(self._waiters)
+            fut, select = entry[2]
+            try:
+                drone = self._try_checkout(select)
+            except RuntimeError as exc:
+                # The waiter's selector is broken; fail that waiter, not the releaser.
+                fut.set_exception(exc)
+                continue
+            if drone is None:
+                heapq.heappush(self._waiters, entry)
+                return
+            fut.set_result(drone)
@@ -0,0 +1,298 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Type
+from drone_fleet.factory.drone_index import DroneIndex, IndexSpec
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import Drone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities import instrumentation
+
+if TYPE_CHECKING:
+    from drone_fleet.utilities.strategies import SelectionStrategy
+
+
+class _Stripe:
+    """One lock plus the sub-pool holding every drone of a single type."""
+
+    __slots__ = ("lock", "pool")
+
+    def __init__(self, max_size: int) -> None:
+        self.lock = threading.Lock()
+        self.pool = DronePool(max_size)
+
+
+class ConcurrentDronePool(DronePool):
+    """Thread-safe DronePool with one lock stripe per drone type.
+
+    Operations on different drone types never contend for the same lock.
+    `checkout(timeout=...)` blocks on a condition variable until a drone is
+    released; the default `timeout=0` keeps the non-blocking behaviour of
+    `DronePool.checkout()`, and `timeout=None` waits indefinitely.
+
+    Pool-wide indexes from `ensure_index()` are updated under the stripe
+    lock of each change, so they never disagree with the stripes; reading
+    one while other threads check drones out gives a point-in-time view.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        # State lives in the per-type stripes; the base dicts are not used.
+        self._max_size = max_size
+        self._stripes: Dict[Type[Drone], _Stripe] = {}
+        self._stripes_lock = threading.Lock()
+        self._size = 0
+        self._size_lock = threading.Lock()
+        # Availability order across stripes, used to merge snapshots.
+        self._order: Dict[str, int] = {}
+        self._counter = itertools.count()
+        self._released = threading.Condition(threading.Lock())
+        self._generation = 0
+        self._discards = 0
+        self._release_listeners: List[Callable[[Drone], None]] = []
+        # Pool-wide indexes, replaced (never mutated) when one is added.
+        self._indexes: Dict[str, DroneIndex] = {}
+        self._index_lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    def _reindex(self, drone: Drone, available: bool) -> None:
+        # Called with the drone's stripe lock held.
+        indexes = self._indexes
+        if indexes:
+            with self._index_lock:
+                for index in indexes.values():
+                    if available:
+                        index.add(drone)
+                    else:
+                        index.discard(drone)
+
+    def _stripe(self, drone_type: Type[Drone], create: bool = False) -> Optional[_Stripe]:
+        stripe = self._stripes.get(drone_type)
+        if stripe is None and create:
+            with self._stripes_lock:
+                stripe = self._stripes.setdefault(drone_type, _Stripe(self._max_size))
+        return stripe
+
+    def _notify_released(self, count: int = 1) -> None:
+        with self._released:
+            self._generation += 1
+            self._released.notify(count)
+
+    def preload(self, drones: List[Drone]) -> None:
+        added = 0
+        with self._size_lock:
+            for d in drones:
+                if self._size >= self._max_size:
+                    break
+                stripe = self._stripe(type(d), create=True)
+                with stripe.lock:
+                    if stripe.pool.is_available(d) or stripe.pool.is_in_use(d):
+                        continue
+                    self._order[d.identifier] = next(self._counter)
+                    stripe.pool.preload([d])
+                    self._reindex(d, True)
+                self._size += 1
+                added += 1
+        if added:
+            self._notify_released(added)
+
+    def restore(self, available: Dict[str, Drone], in_use: Dict[str, Drone]) -> None:
+        groups: Dict[Type[Drone], Tuple[Dict[str, Drone], Dict[str, Drone]]] = {}
+        for state, drones in ((0, available), (1, in_use)):
+            for ident, d in drones.items():
+                groups.setdefault(type(d), ({}, {}))[state][ident] = d
+        with self._size_lock, self._stripes_lock:
+            self._stripes = {}
+            for drone_type, (free, busy) in groups.items():
+                stripe = self._stripes[drone_type] = _Stripe(self._max_size)
+                stripe.pool.restore(free, busy)
+            self._counter = itertools.count()
+            self._order = dict(zip(available, self._counter))
+            self._size = len(available) + len(in_use)
+            self._indexes = {}
+        self._notify_released(len(available))
+
+    def try_checkout(self) -> Optional[Drone]:
+        for stripe in list(self._stripes.values()):
+            with stripe.lock:
+                # Skip empty stripes so a checkout records one hit or miss, not one per stripe.
+                if not stripe.pool.available_count():
+                    continue
+                d = stripe.pool.checkout()
+                self._reindex(d, False)
+            return d
+        metrics = instrumentation.ACTIVE
+        if metrics is not None:
+            metrics.count("drone_fleet_pool_checkouts_total", result="miss")
+        return None
+
+    def checkout(self, timeout: Optional[float] = 0.0) -> Drone:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            generation = self._generation
+            d = self.try_checkout()
+            if d is not None:
+                return d
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise RuntimeError("No available drones in pool")
+            self.wait_for_release(generation, remaining)
+
+    def try_checkout_specific(self, drone: Drone) -> Optional[Drone]:
+        stripe = self._stripe(type(drone))
+        if stripe is None:
+            metrics = instrumentation.ACTIVE
+            if metrics is not None:
+                metrics.count("drone_fleet_pool_checkouts_total", result="miss")
+            return None
+        with stripe.lock:
+            d = stripe.pool.try_checkout_specific(drone)
+            if d is not None:
+                self._reindex(d, False)
+            return d
+
+    def select(self, strategy: 'SelectionStrategy', mission: Mission) -> Optional[Drone]:
+        """Let `strategy` pick an available drone without a pool-wide lock.
+
+        Index-declaring strategies pick one candidate per stripe, then choose
+        among those candidates (in availability order, each with its
+        stripe's index) with `select_among()`.
+        """
+        if strategy.index is None:
+            available = self.available_drones
+            return strategy.select(available, mission) if available else None
+        ranked = []
+        order = self._order
+        for stripe in list(self._stripes.values()):
+            with stripe.lock:
+                d = stripe.pool.select(strategy, mission)
+                # Read the order under the stripe lock: discard() may drop it right after.
+                if d is not None:
+                    ranked.append((order.get(d.identifier, -1), d,
+                                   stripe.pool.ensure_index(strategy.index)))
+        if not ranked:
+            return None
+        ranked.sort(key=lambda entry: entry[0])
+        return strategy.select_among([(d, index) for _, d, index in ranked], mission)
+
+    def release(self, drone: Drone) -> None:
+        stripe = self._stripe(type(drone))
+        if stripe is None:
+            return
+        with stripe.lock:
+            if not stripe.pool.is_in_use(drone):
+                return
+            self._order[drone.identifier] = next(self._counter)
+            stripe.pool.release(drone)
+            self._reindex(drone, True)
+        self._notify_released()
+        self._notify_listeners(drone)
+
+    def discard(self, drone: Drone) -> bool:
+        stripe = self._stripe(type(drone))
+        if stripe is None:
+            return False
+        with stripe.lock:
+            if not stripe.pool.discard(drone):
+                return False
+            self._reindex(drone, False)
+            self._order.pop(drone.identifier, None)
+        with self._size_lock:
+            self._size -= 1
+            self._discards += 1
+        return True
+
+    def refresh(self, drone: Drone) -> None:
+        stripe = self._stripe(type(drone))
+        if stripe is None:
+            return
+        with stripe.lock:
+            if stripe.pool.is_available(drone):
+                self._reindex(drone, False)
+                self._reindex(drone, True)
+
+    def wait_for_release(self, generation: int, timeout: Optional[float] = None) -> bool:
+        with self._released:
+            return self._released.wait_for(lambda: self._generation != generation, timeout)
+
+    def is_available(self, drone: Drone) -> bool:
+        stripe = self._stripe(type(drone))
+        return stripe is not None and stripe.pool.is_available(drone)
+
+    def is_in_use(self, drone: Drone) -> bool:
+        stripe = self._stripe(type(drone))
+        return stripe is not None and stripe.pool.is_in_use(drone)
+
+    def available_count(self, drone_type: Optional[Type[Drone]] = None) -> int:
+        if drone_type is None:
+            return sum(s.pool.available_count() for s in list(self._stripes.values()))
+        stripe = self._stripe(drone_type)
+        return stripe.pool.available_count() if stripe is not None else 0
+
+    def in_use_count(self) -> int:
+        count = 0
+        for stripe in list(self._stripes.values()):
+            with stripe.lock:
+                count += stripe.pool.in_use_count()
+        return count
+
+    def ensure_index(self, spec: IndexSpec) -> DroneIndex:
+        """Return the pool-wide index described by `spec`, building it on first use."""
+        index = self._indexes.get(spec.name)
+        if index is not None:
+            return index
+        with self._build_lock, self._size_lock:
+            index = self._indexes.get(spec.name)
+            if index is None:
+                # Hold every stripe so no change slips in between the fill and registration.
+                stripes = list(self._stripes.values())
+                for stripe in stripes:
+                    stripe.lock.acquire()
+                try:
+                    index = spec.create()
+                    order = self._order
+                    for d in heapq.merge(*(s.pool.available_drones for s in stripes),
+                                         key=lambda d: order.get(d.identifier, -1)):
+                        index.add(d)
+                    with self._index_lock:
+                        self._indexes = {**self._indexes, spec.name: index}
+                finally:
+                    for stripe in stripes:
+                        stripe.lock.release()
+        return index
+
+    def available_by_type(self) -> Dict[Type[Drone], List[Drone]]:
+        snapshot: Dict[Type[Drone], List[Drone]] = {}
+        for stripe in list(self._stripes.values()):
+            with stripe.lock:
+                snapshot.update(stripe.pool.available_by_type())
+        return snapshot
+
+    @property
+    def available_drones(self) -> List[Drone]:
+        """Snapshot of available drones in global availability order."""
+        snapshots = []
+        order = self._order
+        for stripe in list(self._stripes.values()):
+            with stripe.lock:
+                # Pair each drone with its order while the stripe cannot change.
+                snapshots.append([(order.get(d.identifier, -1), d)
+                                  for d in stripe.pool.available_drones])
+        return [d for _, d in heapq.merge(*snapshots, key=lambda pair: pair[0])]
+
+    @property
+    def in_use_drones(self) -> List[Drone]:
+        drones = []
+        for stripe in list(self._stripes.values()):
+            with stripe.lock:
+                drones.extend(stripe.pool.in_use_drones)
+        return drones
+
+    @property
+    def stats(self) -> str:
+        available = in_use = 0
+        for stripe in list(self._stripes.values()):
+            with stripe.lock:
+                available += stripe.pool.available_count()
+                in_use += stripe.pool.in_use_count()
+        return f"available={available}, in_use={in_use}"
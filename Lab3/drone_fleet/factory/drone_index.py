@@ -0,0 +1,209 @@
+import heapq
+import math
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from drone_fleet.models.drone import Drone, Position
+
+
+class DroneIndex:
+    """Groups available drones into buckets by one or more keys per drone.
+
+    Buckets keep drones in the order they became available, so the first
+    drone of a bucket is the least recently used one and the last is the
+    most recently released. All operations are O(1) per key.
+
+    `version` changes on every add or discard; `shape_version` only when a
+    bucket appears or empties, i.e. when the set of non-empty keys changes.
+    """
+
+    def __init__(self, keys: Callable[[Drone], Iterable[Hashable]]) -> None:
+        self._keys = keys
+        self._buckets: Dict[Hashable, Dict[str, Drone]] = {}
+        self._keys_of: Dict[str, Tuple[Hashable, ...]] = {}
+        self.version = 0
+        self.shape_version = 0
+
+    def add(self, drone: Drone) -> None:
+        keys = tuple(self._keys(drone))
+        self._keys_of[drone.identifier] = keys
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = {}
+                self.shape_version += 1
+            bucket[drone.identifier] = drone
+        self.version += 1
+
+    def discard(self, drone: Drone) -> None:
+        keys = self._keys_of.pop(drone.identifier, None)
+        if keys is None:
+            return
+        for key in keys:
+            bucket = self._buckets[key]
+            del bucket[drone.identifier]
+            if not bucket:
+                del self._buckets[key]
+                self.shape_version += 1
+        self.version += 1
+
+    def first(self, key: Hashable) -> Optional[Drone]:
+        bucket = self._buckets.get(key)
+        return next(iter(bucket.values())) if bucket else None
+
+    def last(self, key: Hashable) -> Optional[Drone]:
+        bucket = self._buckets.get(key)
+        return next(reversed(bucket.values())) if bucket else None
+
+    def count(self, key: Hashable) -> int:
+        return len(self._buckets.get(key, ()))
+
+    def drones(self, key: Hashable) -> List[Drone]:
+        """The drones of one bucket, least recently used first."""
+        return list(self._buckets.get(key, {}).values())
+
+    def keys(self) -> List[Hashable]:
+        """Keys that currently have at least one available drone."""
+        return list(self._buckets)
+
+
+class GridIndex(DroneIndex):
+    """DroneIndex bucketing drones by the grid cell of their position.
+
+    Cells are squares of side `cell_size`; drones without a position go to
+    the `None` bucket. Positions are read when a drone becomes available,
+    so a drone should not be moved while it sits in the pool.
+
+    `nearest()` searches rings of cells outward from the query point and
+    stops once no unvisited cell can hold a closer drone, so for a fleet
+    spread over the map a query visits O(k) drones instead of all of them.
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        super().__init__(self._cell_keys)
+        self._cell_size = cell_size
+        self._positions: Dict[str, Position] = {}
+
+    def _cell(self, position: Position) -> Tuple[int, int]:
+        return (math.floor(position[0] / self._cell_size),
+                math.floor(position[1] / self._cell_size))
+
+    def _cell_keys(self, drone: Drone) -> Iterable[Hashable]:
+        position = drone.position
+        return (None if position is None else self._cell(position),)
+
+    def add(self, drone: Drone) -> None:
+        position = drone.position
+        if position is not None:
+            self._positions[drone.identifier] = position
+        super().add(drone)
+
+    def discard(self, drone: Drone) -> None:
+        super().discard(drone)
+        self._positions.pop(drone.identifier, None)
+
+    def position_of(self, drone: Drone) -> Optional[Position]:
+        """The position `drone` had when it became available."""
+        return self._positions.get(drone.identifier)
+
+    def nearest(self, point: Position, k: int = 1) -> List[Drone]:
+        """Up to `k` available drones with a position, closest to `point` first.
+
+        Equal distances are ordered by identifier.
+        """
+        if k <= 0:
+            return []
+        occupied = len(self._buckets) - (None in self._buckets)
+        if not occupied:
+            return []
+        cx, cy = self._cell(point)
+        best: List[Tuple[float, str, Drone]] = []  # max-heap via negated distances
+
+        def visit(cell: Tuple[int, int]) -> None:
+            bucket = self._buckets.get(cell)
+            if not bucket:
+                return
+            for ident, drone in bucket.items():
+                x, y = self._positions[ident]
+                entry = (-math.hypot(x - point[0], y - point[1]), _Desc(ident), drone)
+                if len(best) < k:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+
+        ring = 0
+        while True:
+            if (2 * ring + 1) ** 2 >= occupied:
+                # Rings now cover more cells than are occupied: scan the unvisited ones.
+                for cell in list(self._buckets):
+                    if cell is not None and max(abs(cell[0] - cx), abs(cell[1] - cy)) >= ring:
+                        visit(cell)
+                break
+            for cell in _ring(cx, cy, ring):
+                visit(cell)
+            # Unvisited cells are at least `ring` whole cells away from `point`.
+            if len(best) == k and -best[0][0] <= ring * self._cell_size:
+                break
+            ring += 1
+        return [drone for _, _, drone in sorted(best, reverse=True)]
+
+
+class _Desc(str):
+    """Identifier that sorts in reverse, so the heap evicts larger identifiers first."""
+
+    __slots__ = ()
+
+    def __lt__(self, other: str) -> bool:  # type: ignore[override]
+        return str.__gt__(self, other)
+
+    def __gt__(self, other: str) -> bool:  # type: ignore[override]
+        return str.__lt__(self, other)
+
+
+def _ring(cx: int, cy: int, r: int) -> Iterable[Tuple[int, int]]:
+    """Cells at Chebyshev distance exactly `r` from (cx, cy)."""
+    if r == 0:
+        yield cx, cy
+        return
+    for x in range(cx - r, cx + r + 1):
+        yield x, cy - r
+        yield x, cy + r
+    for y in range(cy - r + 1, cy + r):
+        yield cx - r, y
+        yield cx + r, y
+
+
+class IndexSpec:
+    """Names an index a SelectionStrategy needs and knows how to build it."""
+
+    def __init__(self, name: str, keys: Callable[[Drone], Iterable[Hashable]]) -> None:
+        self.name = name
+        self._keys = keys
+
+    def create(self) -> DroneIndex:
+        return DroneIndex(self._keys)
+
+
+def _class_keys(drone: Drone) -> Iterable[Hashable]:
+    # Every Drone class in the MRO of the underlying type (decorators and
+    # proxies are filed under what they wrap), so isinstance-style lookups work.
+    return [c for c in drone.drone_type.__mro__ if isinstance(c, type) and issubclass(c, Drone)]
+
+
+# Drones bucketed by each of their classes; the `Drone` bucket holds all of them.
+BY_CLASS = IndexSpec("class", _class_keys)
+# Drones bucketed by their capability description.
+BY_CAPABILITY = IndexSpec("capability", lambda d: (d.capabilities(),))
+# A single bucket (key None) ordered from least to most recently used.
+BY_LAST_USED = IndexSpec("last_used", lambda d: (None,))
+
+
+class GridSpec(IndexSpec):
+    """Spatial index of available drones on a grid of `cell_size` squares."""
+
+    def __init__(self, cell_size: float) -> None:
+        super().__init__(f"grid-{cell_size:g}", lambda d: ())
+        self.cell_size = cell_size
+
+    def create(self) -> DroneIndex:
+        return GridIndex(self.cell_size)
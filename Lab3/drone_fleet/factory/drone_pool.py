@@ -1,44 +1,230 @@
-from typing import List, Optional
+from itertools import compress
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Type
+from drone_fleet.factory.drone_index import DroneIndex, IndexSpec
 from drone_fleet.models.drone import Drone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities import instrumentation
+
+if TYPE_CHECKING:
+    from drone_fleet.utilities.strategies import SelectionStrategy
 
 
 class DronePool:
-    """Holds reusable Drone instances and manages in-use tracking."""
+    """Holds reusable Drone instances and manages in-use tracking.
+
+    Drones are kept in identifier-keyed dicts (one per state) plus a per-type
+    index of available drones, so checkout, release and membership checks
+    run in constant time. Dict insertion order doubles as availability order:
+    released drones go to the end, and `checkout()` takes the last one.
+
+    Strategies may declare extra indexes (see `IndexSpec`); the pool builds
+    them on first use and keeps them in step with checkouts and releases.
+    """
 
     def __init__(self, max_size: int) -> None:
-        self._available: List[Drone] = []
-        self._in_use: List[Drone] = []
+        self._available: Dict[str, Drone] = {}
+        self._in_use: Dict[str, Drone] = {}
+        self._by_type: Dict[Type[Drone], Dict[str, Drone]] = {}
+        self._indexes: Dict[str, DroneIndex] = {}
         self._max_size = max_size
+        self._generation = 0
+        self._discards = 0
+        self._release_listeners: List[Callable[[Drone], None]] = []
 
     def preload(self, drones: List[Drone]) -> None:
+        """Add drones up to `max_size`; identifiers already tracked are skipped."""
         for d in drones:
-            if len(self._available) + len(self._in_use) < self._max_size:
-                self._available.append(d)
+            if len(self._available) + len(self._in_use) >= self._max_size:
+                break
+            if d.identifier in self._available or d.identifier in self._in_use:
+                continue
+            self._add_available(d)
+            self._generation += 1
+
+    def restore(self, available: Dict[str, Drone], in_use: Dict[str, Drone]) -> None:
+        """Replace the pool's contents in bulk, e.g. from a snapshot.
+
+        Both dicts map identifier to drone; `available` is in availability
+        order. Indexes are rebuilt on their next use.
+        """
+        items = list(available.items())
+        types = [type(d) for _, d in items]
+        by_type = {t: dict(compress(items, [x is t for x in types])) for t in set(types)}
+        self._available = dict(available)
+        self._in_use = dict(in_use)
+        self._by_type = by_type
+        self._indexes = {}
+        self._generation += 1
 
     def checkout(self) -> Drone:
-        if self._available:
-            d = self._available.pop()
-            self._in_use.append(d)
-            return d
-        raise RuntimeError("No available drones in pool")
+        d = self.try_checkout()
+        if d is None:
+            raise RuntimeError("No available drones in pool")
+        return d
+
+    def try_checkout(self) -> Optional[Drone]:
+        """Like `checkout()` but returns None instead of raising."""
+        if not self._available:
+            metrics = instrumentation.ACTIVE
+            if metrics is not None:
+                metrics.count("drone_fleet_pool_checkouts_total", result="miss")
+            return None
+        d = next(reversed(self._available.values()))
+        self._remove_available(d)
+        self._in_use[d.identifier] = d
+        metrics = instrumentation.ACTIVE
+        if metrics is not None:
+            metrics.count("drone_fleet_pool_checkouts_total", result="hit")
+        return d
 
     def release(self, drone: Drone) -> None:
-        if drone in self._in_use:
+        if self.is_in_use(drone):
             drone.clear_mission()
-            self._in_use.remove(drone)
-            self._available.append(drone)
+            del self._in_use[drone.identifier]
+            self._add_available(drone)
+            self._generation += 1
+            metrics = instrumentation.ACTIVE
+            if metrics is not None:
+                metrics.count("drone_fleet_pool_releases_total")
+            self._notify_listeners(drone)
 
     def checkout_specific(self, drone: Drone) -> Drone:
         """Checkout an explicitly chosen available drone."""
-        if drone in self._available:
-            self._available.remove(drone)
-            self._in_use.append(drone)
-            return drone
-        raise RuntimeError("Requested drone is not available")
+        d = self.try_checkout_specific(drone)
+        if d is None:
+            raise RuntimeError("Requested drone is not available")
+        return d
+
+    def try_checkout_specific(self, drone: Drone) -> Optional[Drone]:
+        """Like `checkout_specific()` but returns None instead of raising."""
+        if not self.is_available(drone):
+            metrics = instrumentation.ACTIVE
+            if metrics is not None:
+                metrics.count("drone_fleet_pool_checkouts_total", result="miss")
+            return None
+        self._remove_available(drone)
+        self._in_use[drone.identifier] = drone
+        metrics = instrumentation.ACTIVE
+        if metrics is not None:
+            metrics.count("drone_fleet_pool_checkouts_total", result="hit")
+        return drone
+
+    def add_release_listener(self, listener: Callable[[Drone], None]) -> None:
+        """Call `listener(drone)` after each drone is released back to the pool."""
+        self._release_listeners.append(listener)
+
+    def remove_release_listener(self, listener: Callable[[Drone], None]) -> None:
+        self._release_listeners.remove(listener)
+
+    def transfer_release_listeners(self, target: 'DronePool') -> None:
+        """Move every release listener to `target`, e.g. when it replaces this pool."""
+        listeners, self._release_listeners = self._release_listeners, []
+        for listener in listeners:
+            target.add_release_listener(listener)
+
+    def _notify_listeners(self, drone: Drone) -> None:
+        for listener in list(self._release_listeners):
+            listener(drone)
+
+    def discard(self, drone: Drone) -> bool:
+        """Remove an available drone from the pool for good; in-use drones stay."""
+        if not self.is_available(drone):
+            return False
+        self._remove_available(drone)
+        self._discards += 1
+        return True
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped every time a drone becomes available (preload or release)."""
+        return self._generation
+
+    @property
+    def discards(self) -> int:
+        """Counter bumped every time `discard()` takes a drone out of the pool."""
+        return self._discards
+
+    def wait_for_release(self, generation: int, timeout: Optional[float] = None) -> bool:
+        """Return True if a drone became available since `generation` was read.
+
+        A single-threaded pool cannot change while the caller waits, so this
+        never blocks; `ConcurrentDronePool` overrides it to wait on a condition.
+        """
+        return self._generation != generation
+
+    def is_available(self, drone: Drone) -> bool:
+        return self._available.get(drone.identifier) is drone
+
+    def is_in_use(self, drone: Drone) -> bool:
+        return self._in_use.get(drone.identifier) is drone
+
+    def available_count(self, drone_type: Optional[Type[Drone]] = None) -> int:
+        """Number of available drones, optionally of exactly `drone_type`."""
+        if drone_type is None:
+            return len(self._available)
+        return len(self._by_type.get(drone_type, ()))
+
+    def in_use_count(self) -> int:
+        return len(self._in_use)
+
+    def ensure_index(self, spec: IndexSpec) -> DroneIndex:
+        """Return the index described by `spec`, building it on first use."""
+        index = self._indexes.get(spec.name)
+        if index is None:
+            index = spec.create()
+            for d in self._available.values():
+                index.add(d)
+            self._indexes[spec.name] = index
+        return index
+
+    def refresh(self, drone: Drone) -> None:
+        """Re-key an available drone after it was changed in place.
+
+        Indexes read a drone's keys when it becomes available, so a drone
+        updated while in the pool (e.g. `EnhancedDrone.add()`) must be
+        refreshed for selection to see the change.
+        """
+        if drone.identifier not in self._available:
+            return
+        for index in self._indexes.values():
+            index.discard(drone)
+            index.add(drone)
+
+    def select(self, strategy: 'SelectionStrategy', mission: Mission) -> Optional[Drone]:
+        """Let `strategy` pick an available drone; None if the pool is empty.
+
+        Strategies that declare an index are handed that index instead of a
+        copy of the available list.
+        """
+        if not self._available:
+            return None
+        if strategy.index is None:
+            return strategy.select(self.available_drones, mission)
+        return strategy.select_indexed(self.ensure_index(strategy.index), mission)
+
+    def _add_available(self, drone: Drone) -> None:
+        self._available[drone.identifier] = drone
+        self._by_type.setdefault(type(drone), {})[drone.identifier] = drone
+        for index in self._indexes.values():
+            index.add(drone)
+
+    def _remove_available(self, drone: Drone) -> None:
+        del self._available[drone.identifier]
+        del self._by_type[type(drone)][drone.identifier]
+        for index in self._indexes.values():
+            index.discard(drone)
+
+    def available_by_type(self) -> Dict[Type[Drone], List[Drone]]:
+        """Snapshot of available drones grouped by exact type, in availability order."""
+        return {t: list(bucket.values()) for t, bucket in self._by_type.items() if bucket}
 
     @property
     def available_drones(self) -> List[Drone]:
-        return list(self._available)
+        return list(self._available.values())
+
+    @property
+    def in_use_drones(self) -> List[Drone]:
+        return list(self._in_use.values())
 
     @property
     def stats(self) -> str:
@@ -0,0 +1,186 @@
+import itertools
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple, Type
+from drone_fleet.factory.concurrent_pool import ConcurrentDronePool
+from drone_fleet.models.drone import Drone
+from drone_fleet.models.mission import Mission
+
+if TYPE_CHECKING:
+    from drone_fleet.utilities.strategies import SelectionStrategy
+
+DroneMaker = Callable[[str], Drone]
+
+
+class ElasticDronePool(ConcurrentDronePool):
+    """Concurrent pool that grows and shrinks between per-kind watermarks.
+
+    `watermarks` maps a drone kind to ``(min_available, max_total)``. A
+    background replenisher keeps at least `min_available` idle drones of
+    each kind (never exceeding `max_total`) by calling the kind's factory
+    ahead of demand; a miss wakes it immediately. Idle drones beyond the
+    minimum are evicted after `idle_ttl` seconds. Pool size, hit/miss
+    counts and wait times are exposed through `metrics`.
+    """
+
+    def __init__(self, watermarks: Dict[str, Tuple[int, int]], factories: Dict[str, DroneMaker],
+                 idle_ttl: Optional[float] = None, interval: float = 0.5) -> None:
+        for kind, (low, high) in watermarks.items():
+            if kind not in factories:
+                raise ValueError(f"Unknown drone kind: {kind}")
+            if not 0 <= low <= high:
+                raise ValueError(f"Invalid watermarks for {kind}: {(low, high)}")
+        super().__init__(max_size=sum(high for _, high in watermarks.values()))
+        self._watermarks = dict(watermarks)
+        self._factories = factories
+        self._idle_ttl = idle_ttl
+        self._interval = interval
+        self._types: Dict[str, Type[Drone]] = {}
+        self._population: Dict[str, int] = {kind: 0 for kind in watermarks}
+        self._kind_of: Dict[str, str] = {}
+        self._idle_since: Dict[str, float] = {}
+        self._ids = itertools.count(1)
+        self._scale_lock = threading.Lock()
+        self._demand = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._metrics_lock = threading.Lock()
+        self._hits = self._misses = self._created = self._evicted = 0
+        self._wait_total = self._wait_max = 0.0
+        self.replenish()
+
+    # -- background scaling -------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="drone-replenisher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._demand.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._demand.wait(self._interval)
+            self._demand.clear()
+            if not self._stop.is_set():
+                self.replenish()
+                self.evict_idle()
+
+    def replenish(self) -> int:
+        """Top up every kind to its low watermark; returns drones created."""
+        created = 0
+        with self._scale_lock:
+            for kind, (low, high) in self._watermarks.items():
+                drone_type = self._types.get(kind)
+                idle = self.available_count(drone_type) if drone_type else 0
+                missing = min(low - idle, high - self._population[kind])
+                if missing <= 0:
+                    continue
+                make = self._factories[kind]
+                drones = [make(f"{kind}-{next(self._ids)}") for _ in range(missing)]
+                self._types[kind] = type(drones[0])
+                for d in drones:
+                    self._kind_of[d.identifier] = kind
+                    self._idle_since[d.identifier] = time.monotonic()
+                self._population[kind] += missing
+                self.preload(drones)
+                created += missing
+        with self._metrics_lock:
+            self._created += created
+        return created
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Drop drones idle longer than `idle_ttl` down to the low watermarks."""
+        if self._idle_ttl is None:
+            return 0
+        now = time.monotonic() if now is None else now
+        evicted = 0
+        with self._scale_lock:
+            for kind, (low, _) in self._watermarks.items():
+                drone_type = self._types.get(kind)
+                if drone_type is None:
+                    continue
+                surplus = self.available_count(drone_type) - low
+                stripe = self._stripe(drone_type)
+                if surplus <= 0 or stripe is None:
+                    continue
+                with stripe.lock:
+                    oldest_first = stripe.pool.available_drones
+                for d in oldest_first[:surplus]:
+                    if now - self._idle_since.get(d.identifier, now) < self._idle_ttl:
+                        break
+                    if self.discard(d):
+                        self._population[kind] -= 1
+                        self._kind_of.pop(d.identifier, None)
+                        self._idle_since.pop(d.identifier, None)
+                        evicted += 1
+        with self._metrics_lock:
+            self._evicted += evicted
+        return evicted
+
+    # -- instrumented pool operations --------------------------------------
+
+    def _record(self, hit: bool) -> None:
+        with self._metrics_lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+        if not hit:
+            self._demand.set()
+
+    def try_checkout(self) -> Optional[Drone]:
+        drone = super().try_checkout()
+        self._record(drone is not None)
+        return drone
+
+    def try_checkout_specific(self, drone: Drone) -> Optional[Drone]:
+        got = super().try_checkout_specific(drone)
+        if got is not None:
+            self._record(True)
+        return got
+
+    def select(self, strategy: 'SelectionStrategy', mission: Mission) -> Optional[Drone]:
+        choice = super().select(strategy, mission)
+        if choice is None:
+            self._record(False)
+        return choice
+
+    def release(self, drone: Drone) -> None:
+        self._idle_since[drone.identifier] = time.monotonic()
+        super().release(drone)
+
+    def wait_for_release(self, generation: int, timeout: Optional[float] = None) -> bool:
+        start = time.perf_counter()
+        try:
+            return super().wait_for_release(generation, timeout)
+        finally:
+            waited = time.perf_counter() - start
+            with self._metrics_lock:
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        with self._metrics_lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": sum(self._population.values()),
+                "available": self.available_count(),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "created": self._created,
+                "evicted": self._evicted,
+                "wait_seconds_total": self._wait_total,
+                "wait_seconds_max": self._wait_max,
+            }
+
+    def population(self) -> Dict[str, int]:
+        return dict(self._population)
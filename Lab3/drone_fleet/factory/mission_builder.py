@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Iterable, List, Mapping, Optional
 from drone_fleet.models.mission import Mission
 
 
@@ -39,8 +39,35 @@ class MissionBuilder:
             raise ValueError("Mission duration not set")
         return Mission(
             name=self._name,
-            waypoints=self._waypoints,
+            waypoints=tuple(self._waypoints),
             duration_minutes=self._duration,
             priority=self._priority,
             payload=self._payload
         )
+
+    @staticmethod
+    def build_many(records: Iterable[Mapping[str, Any]], pause_gc: bool = False) -> List[Mission]:
+        """Build missions in bulk from mappings keyed like Mission's arguments.
+
+        Keys: name, waypoints, duration_minutes, priority (default 3) and
+        payload (optional). The batch is validated once via
+        `Mission.from_columns` (which also takes `pause_gc`) instead of
+        going through a builder per record.
+        """
+        rows = list(records)
+        try:
+            names = [r["name"] for r in rows]
+        except KeyError:
+            raise ValueError("Mission name not set") from None
+        try:
+            durations = [r["duration_minutes"] for r in rows]
+        except KeyError:
+            raise ValueError("Mission duration not set") from None
+        return Mission.from_columns(
+            names,
+            [r.get("waypoints", ()) for r in rows],
+            durations,
+            [r.get("priority", 3) for r in rows],
+            [r.get("payload") for r in rows],
+            pause_gc=pause_gc,
+        )
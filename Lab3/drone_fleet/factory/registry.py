@@ -0,0 +1,103 @@
+import threading
+from importlib.metadata import entry_points
+from typing import Dict, Iterable, List, Type, Union
+from drone_fleet.factory.drone_factory import (
+    DroneFactory,
+    SurveyDroneFactory,
+    CargoDroneFactory,
+    CombatDroneFactory,
+)
+from drone_fleet.models.drone import Drone
+
+ENTRY_POINT_GROUP = "drone_fleet.factories"
+
+
+class DroneFactoryRegistry:
+    """Maps drone kind names to cached DroneFactory instances.
+
+    Factories can be registered as classes (instantiated once, on first
+    use) or as ready instances. Unknown kinds trigger a one-time scan of
+    the ``drone_fleet.factories`` entry point group, so plugins can add
+    kinds by declaring e.g. ``drone_fleet.factories = {recon = pkg:ReconFactory}``.
+    """
+
+    def __init__(self) -> None:
+        self._registered: Dict[str, Union[Type[DroneFactory], DroneFactory]] = {}
+        self._instances: Dict[str, DroneFactory] = {}
+        self._lock = threading.Lock()
+        self._plugins_loaded = False
+        self._drone_classes: Dict[str, Type[Drone]] = {}
+
+    def register(self, kind: str, factory: Union[Type[DroneFactory], DroneFactory]) -> None:
+        kind = kind.lower()
+        with self._lock:
+            self._registered[kind] = factory
+            self._instances.pop(kind, None)
+
+    def get(self, kind: str) -> DroneFactory:
+        kind = kind.lower()
+        factory = self._instances.get(kind)
+        if factory is not None:
+            return factory
+        if kind not in self._registered and not self._plugins_loaded:
+            self.load_entry_points()
+        with self._lock:
+            registered = self._registered.get(kind)
+            if registered is None:
+                raise ValueError(f"Unknown drone kind: {kind}")
+            factory = self._instances.get(kind)
+            if factory is None:
+                factory = registered() if isinstance(registered, type) else registered
+                self._instances[kind] = factory
+            return factory
+
+    def register_drone_class(self, cls: Type[Drone]) -> None:
+        """Let `drone_class()` resolve `cls`; factory products are known already."""
+        with self._lock:
+            self._drone_classes[class_name(cls)] = cls
+
+    def drone_class(self, name: str) -> Type[Drone]:
+        """The drone class named "module:qualname", e.g. in a snapshot.
+
+        Only classes registered here or built by a registered factory (its
+        `product`) are resolved; nothing is imported by name.
+        """
+        cls = self._drone_classes.get(name) or self._products().get(name)
+        if cls is None and not self._plugins_loaded:
+            self.load_entry_points()
+            cls = self._products().get(name)
+        if cls is None:
+            raise ValueError(f"Unknown drone class: {name}")
+        return cls
+
+    def _products(self) -> Dict[str, Type[Drone]]:
+        products = (self.get(kind).product for kind in list(self._registered))
+        return {class_name(p): p for p in products if p is not None}
+
+    def kinds(self) -> List[str]:
+        return sorted(self._registered)
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> int:
+        """Register every factory advertised under `group`; returns the count."""
+        found = entry_points(group=group)
+        for ep in found:
+            self.register(ep.name, ep.load())
+        self._plugins_loaded = True
+        return len(found)
+
+    def create(self, kind: str, identifier: str) -> Drone:
+        return self.get(kind).create(identifier)
+
+    def create_many(self, kind: str, identifiers: Iterable[str], workers: int = 0) -> List[Drone]:
+        return self.get(kind).create_many(identifiers, workers=workers)
+
+
+def class_name(cls: type) -> str:
+    """The "module:qualname" form used to name drone classes."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+default_registry = DroneFactoryRegistry()
+default_registry.register("survey", SurveyDroneFactory)
+default_registry.register("cargo", CargoDroneFactory)
+default_registry.register("combat", CombatDroneFactory)
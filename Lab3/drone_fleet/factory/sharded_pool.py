@@ -0,0 +1,347 @@
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+from multiprocessing.synchronize import Lock
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple, Type
+from drone_fleet.factory.drone_index import DroneIndex, IndexSpec
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.factory.registry import class_name
+from drone_fleet.models.drone import Drone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities import instrumentation
+from drone_fleet.utilities.snapshot import _resolve
+
+if TYPE_CHECKING:
+    from drone_fleet.utilities.strategies import SelectionStrategy
+
+_WORD_BITS = 64
+_POLL_INTERVAL = 0.001
+
+
+class ShardLayout:
+    """Picklable description of a shared fleet, handed to every worker.
+
+    Slots are grouped by drone type; each type owns the contiguous slot
+    range ``ranges[t]``, padded to whole 64-bit words so a bitmap word
+    never mixes types. `identifiers[slot]` is None for padding slots.
+    """
+
+    def __init__(self, drones: Sequence[Drone], stripes: int) -> None:
+        groups: Dict[Type[Drone], List[str]] = {}
+        for d in drones:
+            groups.setdefault(type(d), []).append(d.identifier)
+        self.type_names: List[str] = []
+        self.ranges: List[Tuple[int, int]] = []
+        self.identifiers: List[Optional[str]] = []
+        for drone_type, idents in groups.items():
+            start = len(self.identifiers)
+            self.identifiers.extend(idents)
+            self.ranges.append((start, len(self.identifiers)))
+            self.identifiers.extend([None] * (-len(self.identifiers) % _WORD_BITS))
+            self.type_names.append(class_name(drone_type))
+        self.words = len(self.identifiers) // _WORD_BITS
+        self.stripes = stripes
+        self.shm_name = ""
+
+    @property
+    def nbytes(self) -> int:
+        # Bitmap words, free counters per (type, stripe), release counters per stripe.
+        return 8 * (self.words + (len(self.ranges) + 1) * self.stripes)
+
+
+class SharedAvailability:
+    """Availability bitmap and per-type free counters in shared memory.
+
+    A set bit means the slot's drone is free. Claims and releases are
+    compare-and-set operations on one bitmap word, made atomic across
+    processes by a striped lock (word index modulo the stripe count);
+    each stripe also owns its own slice of every type counter and its own
+    release counter, so operations on different stripes never share a lock.
+    """
+
+    def __init__(self, layout: ShardLayout, locks: Sequence[Lock],
+                 shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self.layout = layout
+        self._locks = list(locks)
+        self._shm = shm
+        self._owner = owner
+        self._words = shm.buf[:8 * layout.words].cast("Q")
+        counters = shm.buf[8 * layout.words:layout.nbytes].cast("q")
+        self._counts = counters[:len(layout.ranges) * layout.stripes]
+        self._releases = counters[len(layout.ranges) * layout.stripes:]
+        self._counters = counters
+
+    @classmethod
+    def create(cls, drones: Sequence[Drone], stripes: int = 64) -> 'SharedAvailability':
+        """Allocate the shared block with every drone marked free."""
+        layout = ShardLayout(drones, stripes)
+        shm = shared_memory.SharedMemory(create=True, size=max(layout.nbytes, 8))
+        layout.shm_name = shm.name
+        locks = [multiprocessing.Lock() for _ in range(stripes)]
+        state = cls(layout, locks, shm, owner=True)
+        for t, (start, end) in enumerate(layout.ranges):
+            for slot in range(start, end):
+                state._words[slot // _WORD_BITS] |= 1 << (slot % _WORD_BITS)
+                state._counts[t * stripes + (slot // _WORD_BITS) % stripes] += 1
+        return state
+
+    @classmethod
+    def attach(cls, layout: ShardLayout, locks: Sequence[Lock]) -> 'SharedAvailability':
+        """Open the block created by `create()` from another process."""
+        return cls(layout, locks, shared_memory.SharedMemory(name=layout.shm_name), owner=False)
+
+    @property
+    def locks(self) -> List[Lock]:
+        return self._locks
+
+    def type_of(self, slot: int) -> int:
+        for t, (start, end) in enumerate(self.layout.ranges):
+            if start <= slot < end:
+                return t
+        raise IndexError("slot out of range")
+
+    def try_claim(self, slot: int) -> bool:
+        """Atomically flip `slot` from free to taken; False if it was not free."""
+        word, bit = divmod(slot, _WORD_BITS)
+        mask = 1 << bit
+        stripe = word % self.layout.stripes
+        with self._locks[stripe]:
+            value = self._words[word]
+            if not value & mask:
+                return False
+            self._words[word] = value & ~mask
+            self._counts[self.type_of(slot) * self.layout.stripes + stripe] -= 1
+        return True
+
+    def release(self, slot: int) -> bool:
+        """Atomically flip `slot` back to free; False if it already was."""
+        word, bit = divmod(slot, _WORD_BITS)
+        mask = 1 << bit
+        stripe = word % self.layout.stripes
+        with self._locks[stripe]:
+            value = self._words[word]
+            if value & mask:
+                return False
+            self._words[word] = value | mask
+            self._counts[self.type_of(slot) * self.layout.stripes + stripe] += 1
+            self._releases[stripe] += 1
+        return True
+
+    def is_free(self, slot: int) -> bool:
+        return bool(self._words[slot // _WORD_BITS] >> (slot % _WORD_BITS) & 1)
+
+    def find_free(self, type_index: int, home: float = 0.0) -> Optional[int]:
+        """A slot of type `type_index` that looked free when read, without claiming it.
+
+        The search starts at fraction `home` of the type's range (each
+        worker uses its own, so workers rarely race for the same word)
+        and wraps around. No lock is taken; callers claim the slot with
+        `try_claim()` and retry if another process got there first.
+        """
+        start, end = self.layout.ranges[type_index]
+        first, last = start // _WORD_BITS, (end - 1) // _WORD_BITS + 1
+        span = last - first
+        offset = int(home * span) % span if span > 0 else 0
+        words = self._words
+        for i in range(span):
+            word = first + (offset + i) % span
+            value = words[word]
+            if value:
+                return word * _WORD_BITS + (value & -value).bit_length() - 1
+        return None
+
+    def claim_any(self, type_index: int, home: float = 0.0) -> Optional[int]:
+        """Claim some free slot of type `type_index`, or return None if none is left."""
+        while True:
+            slot = self.find_free(type_index, home)
+            if slot is None or self.try_claim(slot):
+                return slot
+
+    def available(self, type_index: Optional[int] = None) -> int:
+        stripes = self.layout.stripes
+        if type_index is None:
+            return sum(self._counts)
+        return sum(self._counts[type_index * stripes:(type_index + 1) * stripes])
+
+    @property
+    def releases(self) -> int:
+        """Total releases by every process; changes whenever a drone is freed."""
+        return sum(self._releases)
+
+    def close(self) -> None:
+        """Detach; the creating process also frees the shared block."""
+        for view in (self._words, self._counts, self._releases, self._counters):
+            view.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+class ShardedDronePool(DronePool):
+    """One process's view of a fleet whose availability lives in shared memory.
+
+    Every process rebuilds the same drones from the layout (lazily, on
+    first use) and claims them through `SharedAvailability`, so a drone
+    checked out in one worker is unavailable to all the others. Selection
+    offers the strategy one free candidate per drone type, as
+    `ConcurrentDronePool` does per stripe; if another process claims it
+    first, `FleetManager` retries. In-use state is shared too: any process
+    can release a drone, whichever process checked it out.
+
+    Drone classes are resolved through the factory registry, like snapshot
+    classes (see `DroneFactoryRegistry.drone_class`).
+    """
+
+    def __init__(self, shared: SharedAvailability, home: float = 0.0) -> None:
+        layout = shared.layout
+        self._shared = shared
+        self._home = home
+        self._max_size = sum(end - start for start, end in layout.ranges)
+        self._types: List[Type[Drone]] = [
+            _resolve(name) for name in layout.type_names  # type: ignore[misc]
+        ]
+        self._slots: Dict[str, int] = {
+            ident: slot for slot, ident in enumerate(layout.identifiers) if ident is not None
+        }
+        self._drones: Dict[int, Drone] = {}
+        self._discards = 0
+        self._release_listeners: List[Callable[[Drone], None]] = []
+
+    @property
+    def shared(self) -> SharedAvailability:
+        return self._shared
+
+    def _drone(self, slot: int) -> Drone:
+        d = self._drones.get(slot)
+        if d is None:
+            drone_type = self._types[self._shared.type_of(slot)]
+            d = self._drones[slot] = drone_type(self._shared.layout.identifiers[slot])
+        return d
+
+    def _claimed(self, slot: int) -> Drone:
+        d = self._drone(slot)
+        metrics = instrumentation.ACTIVE
+        if metrics is not None:
+            metrics.count("drone_fleet_pool_checkouts_total", result="hit")
+        return d
+
+    def _missed(self) -> None:
+        metrics = instrumentation.ACTIVE
+        if metrics is not None:
+            metrics.count("drone_fleet_pool_checkouts_total", result="miss")
+
+    def preload(self, drones: List[Drone]) -> None:
+        raise RuntimeError("Sharded pools are populated by SharedAvailability.create()")
+
+    def restore(self, available: Dict[str, Drone], in_use: Dict[str, Drone]) -> None:
+        raise RuntimeError("Sharded pools are populated by SharedAvailability.create()")
+
+    def ensure_index(self, spec: IndexSpec) -> DroneIndex:
+        raise RuntimeError("Sharded pools do not keep per-process indexes")
+
+    def refresh(self, drone: Drone) -> None:
+        pass  # no indexes to update
+
+    def try_checkout(self) -> Optional[Drone]:
+        for t in range(len(self._types)):
+            slot = self._shared.claim_any(t, self._home)
+            if slot is not None:
+                return self._claimed(slot)
+        self._missed()
+        return None
+
+    def try_checkout_specific(self, drone: Drone) -> Optional[Drone]:
+        slot = self._slots.get(drone.identifier)
+        if slot is None or self._drone(slot) is not drone or not self._shared.try_claim(slot):
+            self._missed()
+            return None
+        return self._claimed(slot)
+
+    def release(self, drone: Drone) -> None:
+        """Free `drone`'s slot, whichever process checked it out."""
+        slot = self._slots.get(drone.identifier)
+        if slot is None or self._shared.is_free(slot):
+            return
+        drone.clear_mission()
+        local = self._drones.get(slot)
+        if local is not None and local is not drone:
+            local.clear_mission()
+        if not self._shared.release(slot):
+            return
+        metrics = instrumentation.ACTIVE
+        if metrics is not None:
+            metrics.count("drone_fleet_pool_releases_total")
+        self._notify_listeners(drone)
+
+    def discard(self, drone: Drone) -> bool:
+        """Take an available drone out of service in every process.
+
+        The drone's slot is claimed as if checked out, so `release()` puts it back.
+        """
+        slot = self._slots.get(drone.identifier)
+        if slot is None or not self._shared.try_claim(slot):
+            return False
+        self._discards += 1
+        return True
+
+    @property
+    def generation(self) -> int:
+        return self._shared.releases
+
+    def wait_for_release(self, generation: int, timeout: Optional[float] = None) -> bool:
+        """Poll the shared release counter; other processes cannot signal us directly."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._shared.releases == generation:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(_POLL_INTERVAL)
+        return True
+
+    def select(self, strategy: 'SelectionStrategy', mission: Mission) -> Optional[Drone]:
+        candidates = []
+        for t in range(len(self._types)):
+            slot = self._shared.find_free(t, self._home)
+            if slot is not None:
+                candidates.append(self._drone(slot))
+        if not candidates:
+            return None
+        return strategy.select(candidates, mission)
+
+    def is_available(self, drone: Drone) -> bool:
+        slot = self._slots.get(drone.identifier)
+        return slot is not None and self._shared.is_free(slot)
+
+    def is_in_use(self, drone: Drone) -> bool:
+        slot = self._slots.get(drone.identifier)
+        return slot is not None and not self._shared.is_free(slot)
+
+    def in_use_count(self) -> int:
+        return len(self._slots) - self._shared.available()
+
+    def available_count(self, drone_type: Optional[Type[Drone]] = None) -> int:
+        if drone_type is None:
+            return self._shared.available()
+        if drone_type not in self._types:
+            return 0
+        return self._shared.available(self._types.index(drone_type))
+
+    def available_by_type(self) -> Dict[Type[Drone], List[Drone]]:
+        grouped: Dict[Type[Drone], List[Drone]] = {}
+        for d in self.available_drones:
+            grouped.setdefault(type(d), []).append(d)
+        return grouped
+
+    @property
+    def available_drones(self) -> List[Drone]:
+        is_free = self._shared.is_free
+        return [self._drone(slot) for slot in self._slots.values() if is_free(slot)]
+
+    @property
+    def in_use_drones(self) -> List[Drone]:
+        """Drones checked out in any process, as this process's objects."""
+        is_free = self._shared.is_free
+        return [self._drone(slot) for slot in self._slots.values() if not is_free(slot)]
+
+    @property
+    def stats(self) -> str:
+        return f"available={self._shared.available()}, in_use={self.in_use_count()}"
@@ -1,19 +1,37 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
+
+Position = Tuple[float, float]
 
 
 class Drone(ABC):
     """Abstract base class for all drones."""
 
-    def __init__(self, identifier: str) -> None:
+    __slots__ = ("_identifier", "_mission", "_position")
+
+    def __init__(self, identifier: str, position: Optional[Position] = None) -> None:
         self._identifier = identifier
         self._mission = None
+        self._position = position
 
     @property
     def identifier(self) -> str:
         return self._identifier
 
+    @property
+    def position(self) -> Optional[Position]:
+        """(x, y) coordinates, or None if the drone's location is unknown."""
+        return self._position
+
+    def move_to(self, position: Optional[Position]) -> None:
+        self._position = position
+
+    @property
+    def drone_type(self) -> type:
+        """The concrete drone class, seen through any decorator or proxy."""
+        return type(self)
+
     @property
     def active_mission(self):
         return self._mission
@@ -34,15 +52,21 @@ class Drone(ABC):
 
 
 class SurveyDrone(Drone):
+    __slots__ = ()
+
     def capabilities(self) -> str:
         return "High-resolution imaging and terrain mapping"
 
 
 class CargoDrone(Drone):
+    __slots__ = ()
+
     def capabilities(self) -> str:
         return "Medium payload transport"
 
 
 class CombatDrone(Drone):
+    __slots__ = ()
+
     def capabilities(self) -> str:
         return "Defensive countermeasures and target tracking"
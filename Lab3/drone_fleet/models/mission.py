@@ -1,10 +1,21 @@
-from typing import List, Optional
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+from drone_fleet.utilities.gc_pause import gc_paused
+
+if TYPE_CHECKING:
+    from drone_fleet.models.waypoints import WaypointRegistry
 
 
 class Mission:
-    """Immutable mission object built via MissionBuilder."""
+    """Immutable mission object built via MissionBuilder.
+
+    Waypoints are stored as a tuple and returned as-is, so reading them
+    never copies.
+    """
 
-    def __init__(self, name: str, waypoints: List[str], duration_minutes: int,
+    __slots__ = ("_name", "_waypoints", "_duration_minutes", "_priority", "_payload")
+
+    def __init__(self, name: str, waypoints: Sequence[str], duration_minutes: int,
                  priority: int = 3, payload: Optional[str] = None) -> None:
         if not name:
             raise ValueError("Mission name is required")
@@ -13,18 +24,66 @@ class Mission:
         if not waypoints:
             raise ValueError("Mission requires at least one waypoint")
         self._name = name
-        self._waypoints = list(waypoints)
+        self._waypoints = tuple(waypoints)  # no-op for tuples
         self._duration_minutes = duration_minutes
         self._priority = priority
         self._payload = payload
 
+    @classmethod
+    def from_columns(cls, names: Sequence[str], waypoints: Sequence[Sequence[str]],
+                     durations: Sequence[int], priorities: Optional[Sequence[int]] = None,
+                     payloads: Optional[Sequence[Optional[str]]] = None,
+                     pause_gc: bool = False) -> List['Mission']:
+        """Build many missions from parallel columns, validating the batch once.
+
+        Each column is checked with a single builtin pass (``all``/``min``);
+        rows are then created without repeating per-object validation.
+        `pause_gc=True` pauses the cyclic garbage collector meanwhile (see
+        `gc_paused`), which speeds up very large batches.
+        """
+        count = len(names)
+        priorities = priorities if priorities is not None else [3] * count
+        payloads = payloads if payloads is not None else [None] * count
+        if not len(waypoints) == len(durations) == len(priorities) == len(payloads) == count:
+            raise ValueError("Mission columns must have equal lengths")
+        if not count:
+            return []
+        if not all(names):
+            raise ValueError(f"Mission name is required (row {_first(names, lambda n: not n)})")
+        if not set(map(type, durations)) <= {int, float}:
+            bad = _first(durations, lambda d: isinstance(d, bool) or not isinstance(d, (int, float)))
+            if bad >= 0:
+                raise ValueError(f"Mission duration must be a number (row {bad})")
+        if min(durations) <= 0:
+            raise ValueError(
+                f"Mission duration must be positive (row {_first(durations, lambda d: d <= 0)})"
+            )
+        if not all(waypoints):
+            raise ValueError(
+                f"Mission requires at least one waypoint (row {_first(waypoints, lambda w: not w)})"
+            )
+        with gc_paused() if pause_gc else nullcontext():
+            new = object.__new__
+            missions = []
+            append = missions.append
+            for name, wps, duration, priority, payload in zip(
+                    names, waypoints, durations, priorities, payloads):
+                m = new(cls)
+                m._name = name
+                m._waypoints = tuple(wps)
+                m._duration_minutes = duration
+                m._priority = priority
+                m._payload = payload
+                append(m)
+        return missions
+
     @property
     def name(self) -> str:
         return self._name
 
     @property
-    def waypoints(self) -> List[str]:
-        return list(self._waypoints)
+    def waypoints(self) -> Tuple[str, ...]:
+        return self._waypoints
 
     @property
     def duration_minutes(self) -> int:
@@ -38,9 +97,17 @@ class Mission:
     def payload(self) -> Optional[str]:
         return self._payload
 
+    def coordinates(self, registry: 'WaypointRegistry') -> Tuple[Tuple[float, float], ...]:
+        """The (x, y) of every waypoint, in order; raises ValueError for unknown names."""
+        return tuple(registry.resolve(name) for name in self._waypoints)
+
     def __repr__(self) -> str:
         return (
-            f"Mission(name={self._name!r}, waypoints={self._waypoints!r}, "
+            f"Mission(name={self._name!r}, waypoints={list(self._waypoints)!r}, "
             f"duration_minutes={self._duration_minutes}, priority={self._priority}, "
             f"payload={self._payload!r})"
         )
+
+
+def _first(column: Sequence, bad) -> int:
+    return next((i for i, value in enumerate(column) if bad(value)), -1)
@@ -0,0 +1,213 @@
+import math
+from array import array
+from typing import Iterator, List, Optional, Sequence, Tuple, Type, Union
+from drone_fleet.models.drone import Drone, Position
+from drone_fleet.models.mission import Mission
+
+NO_MISSION = -1
+
+
+class MissionTable:
+    """Columnar store for large numbers of missions.
+
+    Numeric fields live in typed arrays and the rest in parallel lists, so a
+    row costs a few machine words instead of a full object. Rows are read
+    through lightweight `MissionView` objects.
+
+    Durations are stored as doubles, so fractional minutes are accepted as
+    by `Mission.from_columns`; whole values read back as int.
+    """
+
+    def __init__(self) -> None:
+        self._names: List[str] = []
+        self._waypoints: List[Tuple[str, ...]] = []
+        self._durations = array("d")
+        self._priorities = array("l")
+        self._payloads: List[Optional[str]] = []
+
+    def append(self, name: str, waypoints: Sequence[str], duration_minutes: Union[int, float],
+               priority: int = 3, payload: Optional[str] = None) -> int:
+        """Validate and store one mission; returns its row number."""
+        if not name:
+            raise ValueError("Mission name is required")
+        if isinstance(duration_minutes, bool) or not isinstance(duration_minutes, (int, float)):
+            raise ValueError("Mission duration must be a number")
+        if isinstance(priority, bool) or not isinstance(priority, int):
+            raise ValueError("Mission priority must be an integer")
+        if duration_minutes <= 0:
+            raise ValueError("Mission duration must be positive")
+        if not waypoints:
+            raise ValueError("Mission requires at least one waypoint")
+        self._names.append(name)
+        self._waypoints.append(tuple(waypoints))
+        self._durations.append(duration_minutes)
+        self._priorities.append(priority)
+        self._payloads.append(payload)
+        return len(self._names) - 1
+
+    def add(self, mission: Mission) -> int:
+        return self.append(mission.name, mission.waypoints, mission.duration_minutes,
+                           mission.priority, mission.payload)
+
+    @property
+    def durations(self) -> array:
+        return self._durations
+
+    @property
+    def priorities(self) -> array:
+        return self._priorities
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, row: int) -> 'MissionView':
+        if not -len(self) <= row < len(self):
+            raise IndexError("mission row out of range")
+        return MissionView(self, row % len(self))
+
+    def __iter__(self) -> Iterator['MissionView']:
+        return (MissionView(self, row) for row in range(len(self)))
+
+
+class MissionView:
+    """Read-only view of one MissionTable row with Mission's properties."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: MissionTable, row: int) -> None:
+        self._table = table
+        self._row = row
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    @property
+    def name(self) -> str:
+        return self._table._names[self._row]
+
+    @property
+    def waypoints(self) -> Tuple[str, ...]:
+        return self._table._waypoints[self._row]
+
+    @property
+    def duration_minutes(self) -> Union[int, float]:
+        value = self._table._durations[self._row]
+        return int(value) if value.is_integer() else value
+
+    @property
+    def priority(self) -> int:
+        return self._table._priorities[self._row]
+
+    @property
+    def payload(self) -> Optional[str]:
+        return self._table._payloads[self._row]
+
+    def to_mission(self) -> Mission:
+        return Mission(self.name, self.waypoints, self.duration_minutes,
+                       self.priority, self.payload)
+
+    def __repr__(self) -> str:
+        return f"MissionView(row={self._row}, name={self.name!r})"
+
+
+class DroneTable:
+    """Columnar store for drone identity, type, position and assigned mission row.
+
+    Drone types are stored as small integer codes into a shared type list;
+    assignments reference rows of the associated MissionTable. Positions
+    are two double columns, NaN when unknown.
+    """
+
+    def __init__(self, missions: Optional[MissionTable] = None) -> None:
+        self._missions = missions if missions is not None else MissionTable()
+        self._identifiers: List[str] = []
+        self._kinds = array("B")
+        self._mission_rows = array("l")
+        self._xs = array("d")
+        self._ys = array("d")
+        self._types: List[Type[Drone]] = []
+
+    @property
+    def missions(self) -> MissionTable:
+        return self._missions
+
+    def append(self, identifier: str, drone_type: Type[Drone],
+               position: Optional[Position] = None) -> int:
+        try:
+            code = self._types.index(drone_type)
+        except ValueError:
+            code = len(self._types)
+            self._types.append(drone_type)
+        self._identifiers.append(identifier)
+        self._kinds.append(code)
+        self._mission_rows.append(NO_MISSION)
+        x, y = (math.nan, math.nan) if position is None else position
+        self._xs.append(x)
+        self._ys.append(y)
+        return len(self._identifiers) - 1
+
+    def add(self, drone: Drone) -> int:
+        return self.append(drone.identifier, type(drone), drone.position)
+
+    def __len__(self) -> int:
+        return len(self._identifiers)
+
+    def __getitem__(self, row: int) -> 'DroneView':
+        if not -len(self) <= row < len(self):
+            raise IndexError("drone row out of range")
+        return DroneView(self, row % len(self))
+
+    def __iter__(self) -> Iterator['DroneView']:
+        return (DroneView(self, row) for row in range(len(self)))
+
+
+class DroneView:
+    """View of one DroneTable row exposing Drone's public properties."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: DroneTable, row: int) -> None:
+        self._table = table
+        self._row = row
+
+    @property
+    def identifier(self) -> str:
+        return self._table._identifiers[self._row]
+
+    @property
+    def drone_type(self) -> Type[Drone]:
+        return self._table._types[self._table._kinds[self._row]]
+
+    @property
+    def position(self) -> Optional[Position]:
+        x = self._table._xs[self._row]
+        return None if math.isnan(x) else (x, self._table._ys[self._row])
+
+    def move_to(self, position: Optional[Position]) -> None:
+        x, y = (math.nan, math.nan) if position is None else position
+        self._table._xs[self._row] = x
+        self._table._ys[self._row] = y
+
+    @property
+    def active_mission(self) -> Optional[MissionView]:
+        mission_row = self._table._mission_rows[self._row]
+        return None if mission_row == NO_MISSION else self._table.missions[mission_row]
+
+    def assign_mission(self, mission: MissionView) -> None:
+        if mission._table is not self._table.missions:
+            raise ValueError("Mission belongs to a different table")
+        self._table._mission_rows[self._row] = mission.row
+
+    def clear_mission(self) -> None:
+        self._table._mission_rows[self._row] = NO_MISSION
+
+    def capabilities(self) -> str:
+        return self.to_drone().capabilities()
+
+    def to_drone(self) -> Drone:
+        """Materialise a full Drone object (without the mission)."""
+        return self.drone_type(self.identifier, self.position)
+
+    def __repr__(self) -> str:
+        return f"DroneView(id={self.identifier}, type={self.drone_type.__name__})"
@@ -0,0 +1,38 @@
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+from drone_fleet.models.drone import Position
+
+
+class WaypointRegistry:
+    """Maps waypoint names, as used in missions, to (x, y) coordinates."""
+
+    def __init__(self) -> None:
+        self._points: Dict[str, Position] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, x: float, y: float) -> None:
+        with self._lock:
+            self._points[name] = (float(x), float(y))
+
+    def register_many(self, points: Iterable[Tuple[str, float, float]]) -> None:
+        with self._lock:
+            self._points.update((name, (float(x), float(y))) for name, x, y in points)
+
+    def get(self, name: str) -> Optional[Position]:
+        return self._points.get(name)
+
+    def resolve(self, name: str) -> Position:
+        point = self._points.get(name)
+        if point is None:
+            raise ValueError(f"Unknown waypoint: {name}")
+        return point
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._points
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+
+# Shared registry used by FleetManager and NearestDroneStrategy by default.
+default_waypoints = WaypointRegistry()
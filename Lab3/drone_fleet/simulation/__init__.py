@@ -0,0 +1 @@
+# simulation package
\ No newline at end of file
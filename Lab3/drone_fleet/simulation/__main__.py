@@ -0,0 +1,60 @@
+"""Command-line entry point: ``python -m drone_fleet.simulation --help``."""
+import argparse
+import json
+from typing import Dict
+from drone_fleet.simulation.simulator import FleetSimulator
+from drone_fleet.utilities.strategies import (
+    PrioritySelectionStrategy,
+    SimpleSelectionStrategy,
+    LeastRecentlyUsedSelectionStrategy,
+)
+
+STRATEGIES = {
+    "simple": SimpleSelectionStrategy,
+    "priority": PrioritySelectionStrategy,
+    "lru": LeastRecentlyUsedSelectionStrategy,
+}
+
+
+def parse_fleet(spec: str) -> Dict[str, int]:
+    """Parse ``survey=10,cargo=10,combat=5``."""
+    fleet = {}
+    for part in spec.split(","):
+        kind, _, count = part.partition("=")
+        fleet[kind.strip()] = int(count)
+    return fleet
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Discrete-event load test for FleetManager.")
+    parser.add_argument("--minutes", type=float, default=24 * 60, help="simulated minutes")
+    parser.add_argument("--rate", type=float, default=1.0, help="mean mission arrivals per minute")
+    parser.add_argument("--arrival", choices=("poisson", "bursty"), default="poisson")
+    parser.add_argument("--burst-size", type=float, default=20.0, help="mean missions per burst")
+    parser.add_argument("--fleet", type=parse_fleet, default=parse_fleet("survey=10,cargo=10,combat=5"),
+                        help="drones per kind, e.g. survey=10,cargo=10,combat=5")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="simple")
+    parser.add_argument("--max-wait", type=float, default=None,
+                        help="drop missions still queued after this many minutes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    try:
+        simulator = FleetSimulator(
+            drones=args.fleet,
+            rate_per_minute=args.rate,
+            arrival=args.arrival,
+            burst_size=args.burst_size,
+            max_wait=args.max_wait,
+            strategy=STRATEGIES[args.strategy](),
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    report = simulator.run(args.minutes)
+    print(json.dumps(report.as_dict(), indent=2) if args.json else report)
+
+
+if __name__ == "__main__":
+    main()
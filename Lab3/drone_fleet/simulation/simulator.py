@@ -0,0 +1,218 @@
+import heapq
+import itertools
+import math
+import random
+import time
+from typing import Dict, List, Optional
+from drone_fleet.domain.fleet_manager import FleetManager
+from drone_fleet.domain.scheduler import MissionScheduler
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import Drone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.strategies import SelectionStrategy
+
+PAYLOADS = (None, "HD Camera", "Thermal Camera", "Medical kit", "Supplies")
+
+_ARRIVAL = 0
+_COMPLETION = 1
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of `values` (0.0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class SimulationReport:
+    """Outcome of one simulated run."""
+
+    def __init__(self, seed: int, sim_minutes: float, arrived: int, dispatched: int, completed: int,
+                 expired: int, queue_waits: List[float], latencies: List[float],
+                 busy_drone_minutes: float, fleet_size: int, wall_seconds: float) -> None:
+        self.seed = seed
+        self.sim_minutes = sim_minutes
+        self.arrived = arrived
+        self.dispatched = dispatched
+        self.completed = completed
+        self.expired = expired
+        self.queue_wait_p50 = percentile(queue_waits, 50)
+        self.queue_wait_p99 = percentile(queue_waits, 99)
+        self.latency_p50_us = percentile(latencies, 50) * 1e6
+        self.latency_p99_us = percentile(latencies, 99) * 1e6
+        capacity = fleet_size * sim_minutes
+        self.utilisation = busy_drone_minutes / capacity if capacity else 0.0
+        self.throughput_per_hour = completed / (sim_minutes / 60) if sim_minutes else 0.0
+        self.wall_seconds = wall_seconds
+        self.dispatch_per_sec = dispatched / wall_seconds if wall_seconds else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return dict(vars(self))
+
+    def __str__(self) -> str:
+        return (
+            f"seed={self.seed} simulated={self.sim_minutes:,.0f} min\n"
+            f"  missions: arrived={self.arrived:,} dispatched={self.dispatched:,} "
+            f"completed={self.completed:,} expired={self.expired:,}\n"
+            f"  queue wait (sim min): p50={self.queue_wait_p50:.1f} p99={self.queue_wait_p99:.1f}\n"
+            f"  assignment latency (wall): p50={self.latency_p50_us:.1f} us "
+            f"p99={self.latency_p99_us:.1f} us\n"
+            f"  utilisation={self.utilisation:.1%} throughput={self.throughput_per_hour:,.1f} missions/h\n"
+            f"  wall={self.wall_seconds:.2f} s ({self.dispatch_per_sec:,.0f} dispatches/s)"
+        )
+
+
+class _TimedFleet:
+    """FleetManager view for the scheduler that times each assignment."""
+
+    def __init__(self, fleet: FleetManager, latencies: List[float]) -> None:
+        self._fleet = fleet
+        self._latencies = latencies
+
+    @property
+    def pool(self) -> DronePool:
+        return self._fleet.pool
+
+    def assign_mission_to_drone(self, mission: Mission) -> Drone:
+        tick = time.perf_counter()
+        drone = self._fleet.assign_mission_to_drone(mission)
+        self._latencies.append(time.perf_counter() - tick)
+        return drone
+
+
+class FleetSimulator:
+    """Discrete-event load generator driving a FleetManager.
+
+    Missions arrive as a Poisson stream (``arrival="poisson"``) or in
+    Poisson-timed bursts with the same mean rate (``arrival="bursty"``).
+    They are queued in a MissionScheduler, and each dispatched drone flies
+    for the mission's `duration_minutes` of simulated time before it is
+    released. All randomness comes from `seed`, so runs are reproducible.
+    The fleet's pool and selection strategy are swapped in for a run and
+    restored afterwards.
+    """
+
+    def __init__(self, fleet: Optional[FleetManager] = None,
+                 drones: Optional[Dict[str, int]] = None, rate_per_minute: float = 1.0,
+                 arrival: str = "poisson", burst_size: float = 20.0,
+                 max_wait: Optional[float] = None, strategy: Optional[SelectionStrategy] = None,
+                 seed: int = 0) -> None:
+        if arrival not in ("poisson", "bursty"):
+            raise ValueError(f"Unknown arrival process: {arrival}")
+        if not rate_per_minute > 0:
+            raise ValueError("rate_per_minute must be positive")
+        if arrival == "bursty" and not burst_size > 1:
+            raise ValueError("burst_size must be greater than 1")
+        self._fleet = fleet or FleetManager.instance()
+        self._drones = drones or {"survey": 10, "cargo": 10, "combat": 5}
+        self._rate = rate_per_minute
+        self._arrival = arrival
+        self._burst_size = burst_size
+        self._max_wait = max_wait
+        self._strategy = strategy
+        self._seed = seed
+
+    def _setup_fleet(self) -> int:
+        size = sum(self._drones.values())
+        pool = DronePool(max_size=size)
+        for kind, count in self._drones.items():
+            pool.preload(self._fleet.create_drones(kind, [f"{kind}-{i}" for i in range(count)]))
+        self._fleet.set_pool(pool)
+        if self._strategy is not None:
+            self._fleet.set_selection_strategy(self._strategy)
+        return size
+
+    def _arrival_gaps(self, rng: random.Random):
+        """Yield (gap_minutes, mission_count) pairs for the arrival process."""
+        if self._arrival == "poisson":
+            while True:
+                yield rng.expovariate(self._rate), 1
+        burst_rate = self._rate / self._burst_size
+        while True:
+            # Geometric burst size with mean `burst_size`.
+            count = 1 + int(math.log(1.0 - rng.random()) / math.log(1 - 1 / self._burst_size))
+            yield rng.expovariate(burst_rate), count
+
+    def run(self, minutes: float) -> SimulationReport:
+        pool, strategy = self._fleet.pool, self._fleet.selection_strategy
+        try:
+            return self._run(minutes)
+        finally:
+            self._fleet.set_pool(pool)
+            self._fleet.set_selection_strategy(strategy)
+
+    def _run(self, minutes: float) -> SimulationReport:
+        rng = random.Random(self._seed)
+        fleet_size = self._setup_fleet()
+        now = 0.0
+        events: list = []
+        seq = itertools.count()
+        arrived_at: Dict[int, float] = {}
+        queue_waits: List[float] = []
+        latencies: List[float] = []
+        counters = {"arrived": 0, "dispatched": 0, "completed": 0, "expired": 0}
+        busy = 0
+        busy_minutes = 0.0
+        last_change = 0.0
+
+        def on_dispatch(mission: Mission, drone: Drone) -> None:
+            nonlocal busy, busy_minutes, last_change
+            busy_minutes += busy * (now - last_change)
+            last_change = now
+            busy += 1
+            counters["dispatched"] += 1
+            queue_waits.append(now - arrived_at.pop(id(mission)))
+            heapq.heappush(events, (now + mission.duration_minutes, next(seq), _COMPLETION, drone))
+
+        def on_expired(mission: Mission) -> None:
+            arrived_at.pop(id(mission), None)
+            counters["expired"] += 1
+
+        scheduler = MissionScheduler(_TimedFleet(self._fleet, latencies),  # type: ignore[arg-type]
+                                     on_dispatch=on_dispatch,
+                                     on_expired=on_expired, clock=lambda: now)
+        gaps = self._arrival_gaps(rng)
+        gap, count = next(gaps)
+        heapq.heappush(events, (gap, next(seq), _ARRIVAL, count))
+        started = time.perf_counter()
+        try:
+            while events and events[0][0] <= minutes:
+                now, _, kind, payload = heapq.heappop(events)
+                if kind == _ARRIVAL:
+                    for _ in range(payload):
+                        mission = self._make_mission(rng, counters["arrived"])
+                        counters["arrived"] += 1
+                        arrived_at[id(mission)] = now
+                        deadline = None if self._max_wait is None else now + self._max_wait
+                        scheduler.submit(mission, deadline=deadline)
+                    gap, count = next(gaps)
+                    heapq.heappush(events, (now + gap, next(seq), _ARRIVAL, count))
+                else:
+                    busy_minutes += busy * (now - last_change)
+                    last_change = now
+                    busy -= 1
+                    counters["completed"] += 1
+                    self._fleet.release_drone(payload)
+        finally:
+            scheduler.close()
+            # Land drones still flying so the simulated pool is left idle.
+            for _, _, kind, payload in events:
+                if kind == _COMPLETION:
+                    self._fleet.release_drone(payload)
+        busy_minutes += busy * (minutes - last_change)
+        return SimulationReport(
+            self._seed, minutes, counters["arrived"], counters["dispatched"], counters["completed"],
+            counters["expired"], queue_waits, latencies, busy_minutes, fleet_size,
+            time.perf_counter() - started,
+        )
+
+    def _make_mission(self, rng: random.Random, number: int) -> Mission:
+        return Mission(
+            f"SIM-{number}",
+            (f"WP-{rng.randrange(1000)}",),
+            max(1, int(rng.expovariate(1 / 30))),
+            priority=rng.randint(1, 5),
+            payload=rng.choice(PAYLOADS),
+        )
@@ -1,6 +1,7 @@
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from drone_fleet.factory.mission_builder import MissionBuilder
 from drone_fleet.models.mission import Mission
+from drone_fleet.utilities import instrumentation
 
 
 class LegacyMissionAdapter:
@@ -18,8 +19,17 @@ class LegacyMissionAdapter:
         self._data = legacy_data
 
     def to_mission(self) -> Mission:
+        metrics = instrumentation.ACTIVE
+        if metrics is None:
+            return self._convert()
+        with metrics.timer("drone_fleet_adapter_seconds", mode="single"):
+            mission = self._convert()
+        metrics.count("drone_fleet_adapter_conversions_total", mode="single")
+        return mission
+
+    def _convert(self) -> Mission:
         builder = MissionBuilder().name(self._data.get("title", "Unnamed"))
-        for wp in self._data.get("wps", []):
+        for wp in _waypoints(self._data):
             builder.add_waypoint(wp)
         duration = int(self._data.get("len", 0))
         prio = int(self._data.get("prio", 3))
@@ -28,3 +38,54 @@ class LegacyMissionAdapter:
         if cargo:
             builder.payload(cargo)
         return builder.build()
+
+    @staticmethod
+    def to_missions(records: Iterable[Dict[str, Any]],
+                    on_error: Optional[Callable[[Dict[str, Any], str], None]] = None) -> List[Mission]:
+        """Convert many legacy dicts at once via `Mission.from_columns`.
+
+        Without `on_error` an invalid record raises ValueError/TypeError for
+        the whole batch. With it, invalid records are reported as
+        ``on_error(record, reason)`` and skipped; each record is checked
+        before the batch is built, so one bad record never fails the rest.
+        """
+        metrics = instrumentation.ACTIVE
+        if metrics is None:
+            return LegacyMissionAdapter._convert_many(records, on_error)
+        with metrics.timer("drone_fleet_adapter_seconds", mode="bulk"):
+            missions = LegacyMissionAdapter._convert_many(records, on_error)
+        metrics.count("drone_fleet_adapter_conversions_total", len(missions), mode="bulk")
+        return missions
+
+    @staticmethod
+    def _convert_many(records: Iterable[Dict[str, Any]],
+                      on_error: Optional[Callable[[Dict[str, Any], str], None]]) -> List[Mission]:
+        names, waypoints, durations, priorities, payloads = [], [], [], [], []
+        for r in records:
+            try:
+                name = r.get("title", "Unnamed")
+                wps = _waypoints(r)
+                duration = int(r.get("len", 0))
+                prio = int(r.get("prio", 3))
+                if on_error is not None and not (name and wps and duration > 0):
+                    # Rare path: let the single-record conversion explain why.
+                    LegacyMissionAdapter(r)._convert()
+            except (ValueError, TypeError) as exc:
+                if on_error is None:
+                    raise
+                on_error(r, str(exc))
+                continue
+            names.append(name)
+            waypoints.append(wps)
+            durations.append(duration)
+            priorities.append(prio)
+            payloads.append(r.get("cargo") or None)
+        return Mission.from_columns(names, waypoints, durations, priorities, payloads)
+
+
+def _waypoints(record: Dict[str, Any]) -> Tuple[str, ...]:
+    """The record's waypoints as a tuple; TypeError unless "wps" is a non-string iterable."""
+    wps = record.get("wps", ())
+    if isinstance(wps, (str, bytes)):
+        raise TypeError("wps must be a list of waypoints, not a string")
+    return tuple(wps)
@@ -0,0 +1,66 @@
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Type
+from drone_fleet.models.drone import Drone
+from drone_fleet.models.mission import Mission
+
+CostFunction = Callable[[Mission, Type[Drone]], float]
+
+
+class BatchAssigner:
+    """Matches a burst of missions to a snapshot of available drones in one pass.
+
+    Drones of the same type are interchangeable for scoring, so the cost
+    matrix is missions x drone types rather than missions x drones. Missions
+    are served greedily in descending priority (ties keep input order); each
+    takes a drone from the cheapest non-empty type bucket, preferring the
+    larger bucket on equal cost so scarce types stay free for missions that
+    prefer them. With a `cost_key`, missions sharing a key share one row of
+    costs, ranked once.
+    """
+
+    def __init__(self, cost: CostFunction,
+                 cost_key: Optional[Callable[[Mission], Hashable]] = None) -> None:
+        self._cost = cost
+        self._cost_key = cost_key
+
+    def solve(self, missions: Sequence[Mission],
+              buckets: Dict[Type[Drone], List[Drone]]) -> List[Tuple[Mission, Drone]]:
+        """Return (mission, drone) pairs in input order.
+
+        `buckets` may be keyed by exact class; decorated drones are regrouped
+        under their underlying `drone_type` so they compete with plain drones
+        of that type. Missions left without a drone are omitted.
+        """
+        grouped: Dict[Type[Drone], List[Drone]] = {}
+        for drones in buckets.values():
+            for d in drones:
+                grouped.setdefault(d.drone_type, []).append(d)
+        types = list(grouped)
+        stock = [grouped[t] for t in types]
+        remaining = sum(len(drones) for drones in stock)
+        chosen: List[Optional[Drone]] = [None] * len(missions)
+        order = sorted(range(len(missions)), key=lambda i: -missions[i].priority)
+        tiers_by_key: Dict[Hashable, List[List[int]]] = {}
+        for i in order:
+            if not remaining:
+                break
+            mission = missions[i]
+            key = mission if self._cost_key is None else self._cost_key(mission)
+            tiers = tiers_by_key.get(key)
+            if tiers is None:
+                tiers = self._tiers(mission, types)
+                if self._cost_key is not None:
+                    tiers_by_key[key] = tiers
+            for tier in tiers:
+                best = tier[0] if len(tier) == 1 else max(tier, key=lambda j: len(stock[j]))
+                if stock[best]:
+                    break
+            chosen[i] = stock[best].pop()
+            remaining -= 1
+        return [(m, d) for m, d in zip(missions, chosen) if d is not None]
+
+    def _tiers(self, mission: Mission, types: List[Type[Drone]]) -> List[List[int]]:
+        """Type positions grouped by equal cost, cheapest group first."""
+        tiers: Dict[float, List[int]] = {}
+        for j, t in enumerate(types):
+            tiers.setdefault(self._cost(mission, t), []).append(j)
+        return [tiers[cost] for cost in sorted(tiers)]
@@ -1,6 +1,18 @@
 from abc import ABC
+from typing import Dict, FrozenSet, Iterable, Optional
 from drone_fleet.models.drone import Drone
 
+# Known enhancements in display order: name -> capability description.
+ENHANCEMENTS: Dict[str, str] = {
+    "stealth": "low-visibility stealth",
+    "range_extender": "extended flight range",
+}
+
+
+def register_enhancement(name: str, description: str) -> None:
+    """Make a new enhancement available to `EnhancedDrone`."""
+    ENHANCEMENTS[name] = description
+
 
 class DroneDecorator(Drone, ABC):
     """Wraps a Drone to extend capabilities."""
@@ -19,6 +31,17 @@ class DroneDecorator(Drone, ABC):
     def active_mission(self):  # type: ignore[override]
         return self._wrapped.active_mission
 
+    @property
+    def drone_type(self) -> type:
+        return self._wrapped.drone_type
+
+    @property
+    def position(self):  # type: ignore[override]
+        return self._wrapped.position
+
+    def move_to(self, position) -> None:
+        self._wrapped.move_to(position)
+
 
 class StealthDecorator(DroneDecorator):
     def capabilities(self) -> str:
@@ -28,3 +51,51 @@ class StealthDecorator(DroneDecorator):
 class RangeExtenderDecorator(DroneDecorator):
     def capabilities(self) -> str:
         return self._wrapped.capabilities() + " + extended flight range"
+
+
+class EnhancedDrone(DroneDecorator):
+    """One flat wrapper holding a set of enhancement flags.
+
+    Unlike stacked decorators, any number of enhancements costs a single
+    level of delegation. The capability string is built once and cached;
+    `add()`/`remove()` invalidate it when the set actually changes.
+    Wrapping another EnhancedDrone merges into a single wrapper.
+    """
+
+    def __init__(self, wrapped: Drone, enhancements: Iterable[str] = ()) -> None:
+        flags = frozenset(enhancements)
+        if isinstance(wrapped, EnhancedDrone):
+            flags |= wrapped.enhancements
+            wrapped = wrapped._wrapped
+        super().__init__(wrapped)
+        self._enhancements = self._checked(flags)
+        self._capabilities: Optional[str] = None
+
+    @staticmethod
+    def _checked(flags: FrozenSet[str]) -> FrozenSet[str]:
+        unknown = flags.difference(ENHANCEMENTS)
+        if unknown:
+            raise ValueError(f"Unknown enhancement(s): {', '.join(sorted(unknown))}")
+        return flags
+
+    @property
+    def enhancements(self) -> FrozenSet[str]:
+        return self._enhancements
+
+    def add(self, *names: str) -> None:
+        self._set(self._enhancements.union(names))
+
+    def remove(self, *names: str) -> None:
+        self._set(self._enhancements.difference(names))
+
+    def _set(self, flags: FrozenSet[str]) -> None:
+        if flags != self._enhancements:
+            self._enhancements = self._checked(flags)
+            self._capabilities = None
+
+    def capabilities(self) -> str:
+        if self._capabilities is None:
+            parts = [self._wrapped.capabilities()]
+            parts.extend(desc for name, desc in ENHANCEMENTS.items() if name in self._enhancements)
+            self._capabilities = " + ".join(parts)
+        return self._capabilities
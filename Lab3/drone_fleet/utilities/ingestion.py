@@ -0,0 +1,190 @@
+import csv
+import json
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from collections import deque
+from itertools import chain, islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.adapters import LegacyMissionAdapter
+
+Record = Dict[str, Any]
+ErrorSink = Callable[[Any, str], None]
+BatchResult = Tuple[List[Mission], List[Tuple[Any, str]]]
+
+
+def read_jsonl(path: str, raw: bool = False) -> Iterator[Any]:
+    """Lazily yield legacy mission records from a JSON Lines file.
+
+    With `raw=True` the stripped lines are yielded unparsed, leaving JSON
+    decoding to `convert_batch` (and so to the worker processes).
+    """
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                yield line if raw else _parse_json(line)
+
+
+def _parse_json(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return line  # left as text; conversion reports it as invalid
+
+
+def read_csv(path: str, waypoint_separator: str = ";") -> Iterator[Record]:
+    """Lazily yield legacy mission dicts from a CSV file.
+
+    Expects a header with the legacy keys (title, wps, len, prio, cargo);
+    the wps column holds waypoints joined by `waypoint_separator`.
+    """
+    with open(path, newline="", encoding="utf-8") as fh:
+        for row in csv.DictReader(fh):
+            record: Record = {k: v for k, v in row.items() if v not in (None, "")}
+            wps = record.get("wps")
+            if isinstance(wps, str):
+                record["wps"] = [wp for wp in wps.split(waypoint_separator) if wp]
+            yield record
+
+
+def convert_batch(batch: List[Any]) -> BatchResult:
+    """Convert a batch of legacy records, collecting failures instead of raising.
+
+    Valid records go through the bulk `LegacyMissionAdapter.to_missions`
+    fast path; invalid ones are collected with the reason. Should the bulk
+    path still fail, the batch is converted record by record so a single
+    bad record never loses the rest.
+    """
+    records: List[Record] = []
+    failed: List[Tuple[Any, str]] = []
+    for record in batch:
+        if isinstance(record, str):
+            record = _parse_json(record)
+            if isinstance(record, str):
+                failed.append((record, "invalid JSON"))
+                continue
+        if not isinstance(record, dict):
+            failed.append((record, "record is not a mapping"))
+            continue
+        records.append(record)
+    rejected: List[Tuple[Any, str]] = []
+    try:
+        missions = LegacyMissionAdapter.to_missions(
+            records, on_error=lambda record, problem: rejected.append((record, problem))
+        )
+    except (ValueError, TypeError):
+        return _convert_each(records, failed)
+    return missions, failed + rejected
+
+
+def _convert_each(records: List[Record], failed: List[Tuple[Any, str]]) -> BatchResult:
+    missions: List[Mission] = []
+    for record in records:
+        try:
+            missions.append(LegacyMissionAdapter(record).to_mission())
+        except (ValueError, TypeError) as exc:
+            failed.append((record, str(exc)))
+    return missions, failed
+
+
+class IngestionReport:
+    """Counters and throughput for one ingestion run."""
+
+    def __init__(self) -> None:
+        self.converted = 0
+        self.failed = 0
+        self._started = time.perf_counter()
+        self._finished: Optional[float] = None
+
+    @property
+    def processed(self) -> int:
+        return self.converted + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        end = self._finished if self._finished is not None else time.perf_counter()
+        return end - self._started
+
+    @property
+    def records_per_sec(self) -> float:
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def finish(self) -> None:
+        self._finished = time.perf_counter()
+
+    def __str__(self) -> str:
+        return (
+            f"processed={self.processed}, converted={self.converted}, failed={self.failed}, "
+            f"{self.records_per_sec:,.0f} records/sec"
+        )
+
+
+class MissionIngestor:
+    """Streams legacy records into Missions in bounded-memory batches.
+
+    Records (dicts, or raw JSON lines) are pulled lazily from any iterable
+    (see `read_jsonl` and `read_csv`), converted `batch_size` at a time and yielded in input
+    order. Bad records go to `error_sink` rather than aborting the run.
+    With `workers` > 0 batches are converted in a process pool, keeping
+    at most `max_pending` batches in flight. Shipping Missions back from
+    the workers costs more than converting them, so the first
+    `parallel_threshold` records are always converted in-process and the
+    pool is only started for streams longer than that.
+    """
+
+    def __init__(self, batch_size: int = 1000, workers: int = 0,
+                 max_pending: Optional[int] = None, error_sink: Optional[ErrorSink] = None,
+                 parallel_threshold: int = 250_000) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if parallel_threshold < 0:
+            raise ValueError("parallel_threshold must not be negative")
+        self._batch_size = batch_size
+        self._workers = workers
+        self._parallel_threshold = parallel_threshold
+        self._max_pending = max_pending or max(2 * workers, 1)
+        self._error_sink = error_sink
+        self.report = IngestionReport()
+
+    def ingest(self, records: Iterable[Any]) -> Iterator[Mission]:
+        self.report = IngestionReport()
+        results = self._results(self._batches(records))
+        try:
+            for missions, failed in results:
+                self.report.converted += len(missions)
+                self.report.failed += len(failed)
+                if self._error_sink is not None:
+                    for record, problem in failed:
+                        self._error_sink(record, problem)
+                yield from missions
+        finally:
+            self.report.finish()
+
+    def _batches(self, records: Iterable[Any]) -> Iterator[List[Any]]:
+        it = iter(records)
+        while True:
+            batch = list(islice(it, self._batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _results(self, batches: Iterator[List[Any]]) -> Iterator[BatchResult]:
+        if self._workers <= 0:
+            yield from map(convert_batch, batches)
+            return
+        serial = -(-self._parallel_threshold // self._batch_size)
+        yield from map(convert_batch, islice(batches, serial))
+        first = next(batches, None)
+        if first is not None:
+            yield from self._parallel(chain([first], batches))
+
+    def _parallel(self, batches: Iterator[List[Any]]) -> Iterator[BatchResult]:
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            pending: Deque[Future] = deque()
+            for batch in batches:
+                pending.append(executor.submit(convert_batch, batch))
+                if len(pending) >= self._max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
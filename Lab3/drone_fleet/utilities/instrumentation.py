@@ -0,0 +1,221 @@
+"""Optional metrics for the fleet's hot paths.
+
+Instrumentation is off by default. Instrumented code reads the module-level
+`ACTIVE` and does nothing else while it is None, so the disabled cost is a
+single attribute check:
+
+    metrics = instrumentation.ACTIVE
+    if metrics is not None:
+        metrics.count("drone_fleet_pool_releases_total")
+
+`enable()` installs an `Instrumentation` that collects counters and
+histograms and exports them in the Prometheus text format, either to a
+file (`write`) or over HTTP (`serve`). `profile(name)` times ad-hoc
+sections of code.
+"""
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ContextManager, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Seconds; suited to calls between a few microseconds and a second.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# HELP text for the metrics recorded by drone_fleet itself.
+BUILTIN_METRICS: Dict[str, str] = {
+    "drone_fleet_assign_seconds": "Time spent in FleetManager.assign_mission_to_drone.",
+    "drone_fleet_assign_failures_total": "Assignments that ended with no drone available.",
+    "drone_fleet_select_seconds": "Time spent selecting a drone, by strategy.",
+    "drone_fleet_pool_checkouts_total": "Pool checkout attempts, by result (hit or miss).",
+    "drone_fleet_pool_releases_total": "Drones released back to a pool.",
+    "drone_fleet_proxy_realize_seconds": "Time spent creating the real drone behind a DroneProxy.",
+    "drone_fleet_adapter_seconds": "Time spent converting legacy missions, by mode (single or bulk).",
+    "drone_fleet_adapter_conversions_total": "Legacy missions converted, by mode (single or bulk).",
+    "drone_fleet_selection_cache_total": "CachingSelectionStrategy lookups, by result (hit or miss).",
+    "drone_fleet_section_seconds": "Time spent in sections wrapped with instrumentation.profile().",
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values."""
+
+    __slots__ = ("bounds", "bucket_counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        self.bucket_counts = [0] * len(self.bounds)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        i = bisect.bisect_left(self.bounds, value)
+        if i < len(self.bucket_counts):
+            self.bucket_counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[int]:
+        total, out = 0, []
+        for n in self.bucket_counts:
+            total += n
+            out.append(total)
+        return out
+
+
+class Instrumentation:
+    """Thread-safe collection of counters and histograms, keyed by name and labels."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._help: Dict[str, str] = dict(BUILTIN_METRICS)
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, help_text: str) -> None:
+        """Set the HELP line exported for metric `name`."""
+        self._help[name] = help_text
+
+    def count(self, name: str, amount: float = 1, **labels: str) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self._buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        """Observe the wall-clock seconds spent in the block into histogram `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter_value(self, name: str, **labels: str) -> float:
+        return self._counters.get(name, {}).get(_labels(labels), 0)
+
+    def histogram(self, name: str, **labels: str) -> Optional[Histogram]:
+        return self._histograms.get(name, {}).get(_labels(labels))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def to_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                self._header(lines, name, "counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_render(key)} {_number(value)}")
+            for name in sorted(self._histograms):
+                self._header(lines, name, "histogram")
+                for key, h in sorted(self._histograms[name].items()):
+                    for bound, total in zip(h.bounds, h.cumulative()):
+                        lines.append(f"{name}_bucket{_render(key + (('le', _number(bound)),))} {total}")
+                    lines.append(f"{name}_bucket{_render(key + (('le', '+Inf'),))} {h.count}")
+                    lines.append(f"{name}_sum{_render(key)} {_number(h.sum)}")
+                    lines.append(f"{name}_count{_render(key)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def _header(self, lines: List[str], name: str, kind: str) -> None:
+        if name in self._help:
+            lines.append(f"# HELP {name} {self._help[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    def write(self, path: str) -> None:
+        """Write the metrics to `path` atomically (e.g. for a textfile collector)."""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(self.to_prometheus())
+        os.replace(tmp, path)
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve the metrics at http://host:port/metrics from a daemon thread.
+
+        Returns the server; call `shutdown()` on it to stop. Port 0 picks a
+        free port (see `server.server_address`).
+        """
+        instrumentation = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = instrumentation.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), _Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+
+ACTIVE: Optional[Instrumentation] = None
+
+
+def enable(instrumentation: Optional[Instrumentation] = None) -> Instrumentation:
+    """Turn instrumentation on (with a fresh collector unless one is given)."""
+    global ACTIVE
+    ACTIVE = instrumentation if instrumentation is not None else Instrumentation()
+    return ACTIVE
+
+
+def disable() -> None:
+    global ACTIVE
+    ACTIVE = None
+
+
+def profile(section: str) -> ContextManager[None]:
+    """Time a block into `drone_fleet_section_seconds{section=...}` while enabled.
+
+        with instrumentation.profile("nightly-import"):
+            ...
+    """
+    metrics = ACTIVE
+    if metrics is None:
+        return nullcontext()
+    return metrics.timer("drone_fleet_section_seconds", section=section)
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items())) if labels else ()
+
+
+def _render(key: Labels) -> str:
+    if not key:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, v in key)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(key, escaped)) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
@@ -1,25 +1,81 @@
+import threading
+import time
 from drone_fleet.models.drone import Drone
-from typing import Callable, Optional
+from drone_fleet.utilities import instrumentation
+from typing import Callable, Optional, Type
 
 
 class DroneProxy(Drone):
-    """Lazy creation of a concrete Drone via a factory callable."""
+    """Lazy creation of a concrete Drone via a factory callable.
 
-    def __init__(self, identifier: str, factory: Callable[[], Drone]) -> None:
+    Realization uses double-checked locking, so the factory runs at most
+    once even when several threads touch the proxy at the same time. An
+    idle, mission-free proxy can be demoted back to the unrealized state
+    with `demote_if_idle()` to free the real drone.
+
+    Pass `drone_type` when the factory's product class is known, so type
+    checks (selection, batch assignment) do not realize the proxy.
+    """
+
+    def __init__(self, identifier: str, factory: Callable[[], Drone],
+                 kind: Optional[str] = None, drone_type: Optional[Type[Drone]] = None) -> None:
         super().__init__(identifier)
         self._factory = factory
+        self.kind = kind  # registry kind, when known; lets snapshots recreate the proxy
+        self._drone_type = drone_type
         self._real: Optional[Drone] = None
+        self._lock = threading.Lock()
+        self._last_used = time.monotonic()
 
     def _ensure_realized(self) -> Drone:
+        real = self._real
+        if real is None:
+            with self._lock:
+                real = self._realize_locked()
+        self._last_used = time.monotonic()
+        return real
+
+    def _realize_locked(self) -> Drone:
         if self._real is None:
-            self._real = self._factory()
+            metrics = instrumentation.ACTIVE
+            if metrics is None:
+                real = self._factory()
+            else:
+                with metrics.timer("drone_fleet_proxy_realize_seconds"):
+                    real = self._factory()
+            if self._position is not None:
+                real.move_to(self._position)
+            self._real = real
         return self._real
 
+    @property
+    def is_realized(self) -> bool:
+        return self._real is not None
+
+    def realize(self) -> Drone:
+        """Create the real drone now (no-op if it already exists)."""
+        return self._ensure_realized()
+
+    def demote_if_idle(self, max_idle: float) -> bool:
+        """Drop the real drone if it has no mission and was unused for `max_idle` seconds."""
+        with self._lock:
+            real = self._real
+            if real is None or real.active_mission is not None:
+                return False
+            if time.monotonic() - self._last_used < max_idle:
+                return False
+            self._position = real.position
+            self._real = None
+            return True
+
     def capabilities(self) -> str:
         return self._ensure_realized().capabilities()
 
     def assign_mission(self, mission) -> None:  # type: ignore[override]
-        self._ensure_realized().assign_mission(mission)
+        # Under the lock so a concurrent demotion cannot drop the mission.
+        with self._lock:
+            self._realize_locked().assign_mission(mission)
+            self._last_used = time.monotonic()
 
     def clear_mission(self) -> None:  # type: ignore[override]
         if self._real:
@@ -28,3 +84,22 @@ class DroneProxy(Drone):
     @property
     def active_mission(self):  # type: ignore[override]
         return self._real.active_mission if self._real else None
+
+    @property
+    def drone_type(self) -> type:
+        if self._drone_type is not None:
+            return self._drone_type
+        return self._ensure_realized().drone_type
+
+    @property
+    def position(self):  # type: ignore[override]
+        # Known without realizing: kept here while unrealized, handed over on realize.
+        real = self._real
+        return real.position if real is not None else self._position
+
+    def move_to(self, position) -> None:
+        with self._lock:
+            if self._real is not None:
+                self._real.move_to(position)
+            else:
+                self._position = position
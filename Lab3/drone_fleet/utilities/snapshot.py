@@ -0,0 +1,311 @@
+"""Compact binary snapshots of a drone pool for fast warm restarts.
+
+Layout (little-endian; every section padded to 4 bytes):
+
+    header       magic, version, pool kind and size, crc32 of the body, section sizes
+    strings      every distinct string once, NUL-separated UTF-8
+    classes      string ids of the drone classes ("module:qualname")
+    enhancements string ids of the enhancement names used
+    drones       per-drone columns in availability order: identifier, class,
+                 enhancement mask, mission (-1: none), x and y (f64, NaN: no
+                 position) and flags (u8)
+    missions     one record per assigned mission
+    waypoints    string ids, referenced by (start, count) from missions
+    proxies      identifier and kind of detached DroneProxy descriptors
+
+Loading maps the file and decodes each section with a single bulk call
+(one `str.split` for the strings, `struct` for the records), so
+the only per-drone work is creating the objects themselves.
+"""
+import math
+import mmap
+import os
+import struct
+import traceback
+import zlib
+from contextlib import nullcontext
+from functools import partial
+from itertools import compress
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
+from drone_fleet.factory.concurrent_pool import ConcurrentDronePool
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.factory.registry import DroneFactoryRegistry, class_name, default_registry
+from drone_fleet.models.drone import Drone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.decorators import (
+    DroneDecorator,
+    EnhancedDrone,
+    RangeExtenderDecorator,
+    StealthDecorator,
+)
+from drone_fleet.utilities.gc_pause import gc_paused
+from drone_fleet.utilities.proxy import DroneProxy
+
+MAGIC = b"DFSN"
+VERSION = 2
+# magic, version, pool kind, max size, crc32, string blob length, then the
+# count of strings, classes, enhancements, drones, missions, waypoints and proxies.
+_HEADER = struct.Struct("<4sHHIIIIIIIIII")
+# name, duration, priority, payload (-1: none), first waypoint, waypoint count
+_MISSION = struct.Struct("<IiiiII")
+_PROXY = struct.Struct("<II")
+
+_POOL_KINDS: Dict[int, Type[DronePool]] = {0: DronePool, 1: ConcurrentDronePool}
+# Drone flags
+_IN_USE, _ENHANCED, _PROXIED = 1, 2, 4
+# Stacked legacy decorators are saved as the equivalent enhancement flag.
+_LEGACY_DECORATORS: Dict[type, str] = {
+    StealthDecorator: "stealth",
+    RangeExtenderDecorator: "range_extender",
+}
+
+DroneMaker = Callable[[str, str], Drone]
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+
+    def __call__(self, value: str) -> int:
+        sid = self.ids.get(value)
+        if sid is None:
+            if "\0" in value:
+                raise ValueError(f"Cannot snapshot string containing NUL: {value!r}")
+            sid = self.ids[value] = len(self.ids)
+        return sid
+
+    def encode(self) -> bytes:
+        return "\0".join(self.ids).encode("utf-8")
+
+
+def save_snapshot(path: str, pool: DronePool, proxies: Iterable[DroneProxy] = ()) -> int:
+    """Write `pool` (and detached `proxies`) to `path`; returns the file size.
+
+    Captures availability order, in-use drones with their missions,
+    enhancements and lazy proxies (as their kind, without realizing them).
+    Elastic pools are saved as plain concurrent pools. The file is
+    replaced atomically.
+    """
+    strings = _StringTable()
+    classes: Dict[str, int] = {}
+    class_ids: List[int] = []
+    enhancements: Dict[str, int] = {}
+    missions: Dict[int, int] = {}
+    drone_idents: List[int] = []
+    drone_classes: List[int] = []
+    drone_masks: List[int] = []
+    drone_missions: List[int] = []
+    drone_x: List[float] = []
+    drone_y: List[float] = []
+    drone_flags = bytearray()
+    mission_rows: List[bytes] = []
+    waypoints: List[int] = []
+
+    def encode_drone(drone: Drone, flag: int) -> None:
+        flags: List[str] = []
+        while isinstance(drone, DroneDecorator):
+            if isinstance(drone, EnhancedDrone):
+                flags.extend(drone.enhancements)
+            elif type(drone) in _LEGACY_DECORATORS:
+                flags.append(_LEGACY_DECORATORS[type(drone)])
+            else:
+                raise ValueError(f"Cannot snapshot decorator {type(drone).__name__}")
+            drone = drone._wrapped
+        if flags:
+            flag |= _ENHANCED
+        mask = 0
+        for name in flags:
+            if name not in enhancements:
+                if len(enhancements) == 32:
+                    raise ValueError("Snapshots support at most 32 distinct enhancements")
+                enhancements[name] = len(enhancements)
+            mask |= 1 << enhancements[name]
+        mission = drone.active_mission
+        if isinstance(drone, DroneProxy):
+            if drone.kind is None:
+                raise ValueError(f"Cannot snapshot proxy {drone.identifier} without a kind")
+            flag |= _PROXIED
+            cls = drone.kind
+        else:
+            cls = class_name(type(drone))
+        if cls not in classes:
+            classes[cls] = len(classes)
+            class_ids.append(strings(cls))
+        drone_idents.append(strings(drone.identifier))
+        drone_classes.append(classes[cls])
+        drone_masks.append(mask)
+        drone_missions.append(encode_mission(mission))
+        position = drone.position
+        x, y = (math.nan, math.nan) if position is None else position
+        drone_x.append(x)
+        drone_y.append(y)
+        drone_flags.append(flag)
+
+    def encode_mission(mission) -> int:
+        if mission is None:
+            return -1
+        if not isinstance(mission, Mission):
+            raise ValueError(f"Cannot snapshot mission of type {type(mission).__name__}")
+        row = missions.get(id(mission))
+        if row is None:
+            payload = -1 if mission.payload is None else strings(mission.payload)
+            mission_rows.append(_MISSION.pack(strings(mission.name), mission.duration_minutes,
+                                              mission.priority, payload, len(waypoints),
+                                              len(mission.waypoints)))
+            waypoints.extend(strings(wp) for wp in mission.waypoints)
+            row = missions[id(mission)] = len(mission_rows) - 1
+        return row
+
+    for drone in pool.available_drones:
+        encode_drone(drone, 0)
+    for drone in pool.in_use_drones:
+        encode_drone(drone, _IN_USE)
+    proxy_rows = []
+    for proxy in proxies:
+        if proxy.kind is None:
+            raise ValueError(f"Cannot snapshot proxy {proxy.identifier} without a kind")
+        proxy_rows.append(_PROXY.pack(strings(proxy.identifier), strings(proxy.kind)))
+
+    enhancement_ids = [strings(name) for name in enhancements]
+    blob = strings.encode()
+    body = b"".join((
+        _padded(blob),
+        _u32(class_ids),
+        _u32(enhancement_ids),
+        _u32(drone_idents),
+        _u32(drone_classes),
+        _u32(drone_masks),
+        struct.pack(f"<{len(drone_missions)}i", *drone_missions),
+        struct.pack(f"<{len(drone_x)}d", *drone_x),
+        struct.pack(f"<{len(drone_y)}d", *drone_y),
+        _padded(bytes(drone_flags)),
+        b"".join(mission_rows),
+        _u32(waypoints),
+        b"".join(proxy_rows),
+    ))
+    pool_kind = 1 if isinstance(pool, ConcurrentDronePool) else 0
+    header = _HEADER.pack(MAGIC, VERSION, pool_kind, pool._max_size, zlib.crc32(body),
+                          len(blob), len(strings.ids), len(classes), len(enhancements),
+                          len(drone_idents), len(mission_rows), len(waypoints), len(proxy_rows))
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(header)
+        fh.write(body)
+    os.replace(tmp, path)
+    return len(header) + len(body)
+
+
+def load_snapshot(path: str, make_proxy: DroneMaker, pause_gc: bool = False,
+                  registry: DroneFactoryRegistry = default_registry
+                  ) -> Tuple[DronePool, List[DroneProxy]]:
+    """Rebuild the pool saved by `save_snapshot`; returns (pool, detached proxies).
+
+    `make_proxy(kind, identifier)` recreates lazy drones (see
+    `FleetManager.lazy_drone`); drone classes are looked up in `registry`
+    (see `DroneFactoryRegistry.drone_class`). `pause_gc=True` pauses the
+    cyclic garbage collector while the objects are created (see
+    `gc_paused`). Raises ValueError for files that are not snapshots, were
+    written by another version, are corrupt or name unknown classes.
+    """
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if len(mm) < _HEADER.size:
+            raise ValueError("Not a drone fleet snapshot")
+        header = _HEADER.unpack_from(mm)
+        try:
+            with gc_paused() if pause_gc else nullcontext():
+                # Sections are decoded straight from the mapping, without copying the body.
+                return _decode(header, memoryview(mm)[_HEADER.size:], make_proxy, registry)
+        except BaseException as exc:
+            # Drop the decoder's views into the map so it can be closed.
+            traceback.clear_frames(exc.__traceback__)
+            raise
+
+
+def _decode(header: tuple, body: memoryview, make_proxy: DroneMaker,
+            registry: DroneFactoryRegistry) -> Tuple[DronePool, List[DroneProxy]]:
+    (magic, version, pool_kind, max_size, crc, blob_size, n_strings, n_classes, n_enhancements,
+     n_drones, n_missions, n_waypoints, n_proxies) = header
+    if magic != MAGIC:
+        raise ValueError("Not a drone fleet snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+    if zlib.crc32(body) != crc:
+        raise ValueError("Snapshot is corrupt (checksum mismatch)")
+
+    strings = str(body[:blob_size], "utf-8").split("\0") if n_strings else []
+    if len(strings) != n_strings:
+        raise ValueError("Snapshot is corrupt (string table)")
+    offset = blob_size + -blob_size % 4
+
+    def section(count: int, size: int) -> memoryview:
+        nonlocal offset
+        chunk = body[offset:offset + count * size]
+        offset += count * size
+        return chunk
+
+    classes = [strings[i] for i in _unpack_u32(section(n_classes, 4))]
+    enhancement_names = [strings[i] for i in _unpack_u32(section(n_enhancements, 4))]
+    ident_col = _unpack_u32(section(n_drones, 4))
+    class_col = _unpack_u32(section(n_drones, 4))
+    masks = _unpack_u32(section(n_drones, 4))
+    mission_col = struct.unpack(f"<{n_drones}i", section(n_drones, 4))
+    xs = struct.unpack(f"<{n_drones}d", section(n_drones, 8))
+    ys = struct.unpack(f"<{n_drones}d", section(n_drones, 8))
+    flags = bytes(section(n_drones, 1))
+    offset += -n_drones % 4
+    mission_rows = section(n_missions, _MISSION.size)
+    waypoint_ids = _unpack_u32(section(n_waypoints, 4))
+    proxy_rows = section(n_proxies, _PROXY.size)
+
+    names, wps, durations, priorities, payloads = [], [], [], [], []
+    for name, duration, priority, payload, start, count in _MISSION.iter_unpack(mission_rows):
+        names.append(strings[name])
+        wps.append(tuple(strings[i] for i in waypoint_ids[start:start + count]))
+        durations.append(duration)
+        priorities.append(priority)
+        payloads.append(None if payload < 0 else strings[payload])
+    missions = Mission.from_columns(names, wps, durations, priorities, payloads)
+
+    # Every class entry becomes a one-argument maker: a drone class or a proxy kind.
+    makers = [_resolve(name, registry) or partial(make_proxy, name) for name in classes]
+    identifiers = [strings[i] for i in ident_col]
+    drones = [makers[c](ident) for c, ident in zip(class_col, identifiers)]
+    for i in compress(range(n_drones), [x == x for x in xs]):  # NaN: no position
+        drones[i].move_to((xs[i], ys[i]))
+    for i in compress(range(n_drones), [f & _ENHANCED for f in flags]):
+        mask = masks[i]
+        drones[i] = EnhancedDrone(drones[i], [name for bit, name in enumerate(enhancement_names)
+                                              if mask >> bit & 1])
+    proxies = [make_proxy(strings[kind], strings[ident])
+               for ident, kind in _PROXY.iter_unpack(proxy_rows)]
+
+    busy = [f & _IN_USE for f in flags]
+    free = [not b for b in busy]
+    pool = _POOL_KINDS.get(pool_kind, DronePool)(max_size)
+    pool.restore(dict(zip(compress(identifiers, free), compress(drones, free))),
+                 dict(zip(compress(identifiers, busy), compress(drones, busy))))
+    for drone, mission in zip(compress(drones, busy), compress(mission_col, busy)):
+        if mission >= 0:
+            drone.assign_mission(missions[mission])
+    return pool, proxies
+
+
+def _resolve(name: str,
+             registry: DroneFactoryRegistry = default_registry) -> Optional[Type[Drone]]:
+    """The registered drone class named "module:qualname", or None for proxy kinds."""
+    if ":" not in name:
+        return None
+    return registry.drone_class(name)
+
+
+def _u32(values: Iterable[int]) -> bytes:
+    data = list(values)
+    return struct.pack(f"<{len(data)}I", *data)
+
+
+def _unpack_u32(data: memoryview) -> Tuple[int, ...]:
+    return struct.unpack(f"<{len(data) // 4}I", data)
+
+
+def _padded(data: bytes) -> bytes:
+    return data + b"\0" * (-len(data) % 4)
@@ -1,29 +1,88 @@
 from __future__ import annotations
+import itertools
+import math
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import List
-from drone_fleet.models.drone import Drone, SurveyDrone, CombatDrone
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Mapping, Optional, Tuple, Type
+from drone_fleet.factory.drone_index import (
+    BY_CLASS,
+    BY_LAST_USED,
+    DroneIndex,
+    GridSpec,
+    IndexSpec,
+)
+from drone_fleet.models.drone import Drone, Position, SurveyDrone, CombatDrone
 from drone_fleet.models.mission import Mission
+from drone_fleet.models.waypoints import WaypointRegistry, default_waypoints
+from drone_fleet.utilities import instrumentation
+from drone_fleet.utilities.decorators import (
+    DroneDecorator,
+    EnhancedDrone,
+    RangeExtenderDecorator,
+    StealthDecorator,
+)
+
+
+def mission_signature(mission: Mission) -> Hashable:
+    """The mission attributes the built-in strategies decide on: priority and payload."""
+    return mission.priority, (mission.payload or "").lower()
 
 
 class SelectionStrategy(ABC):
     """Defines the drone selection behavior.
 
     A strategy chooses one drone from the available pool for a mission.
+    Strategies that set `index` are given that pool index through
+    `select_indexed()` instead of a full list; `select()` is still used on
+    small candidate lists, so both must agree. Type rules look at a drone's
+    `drone_type`, so decorated and lazy drones count as what they wrap, in
+    `select()`, `select_indexed()` and `cost()` alike.
+
+    Strategies whose `cost()` depends only on some key of the mission set
+    `cost_key` to it; batch assignment then scores each distinct key once.
     """
 
+    index: Optional[IndexSpec] = None
+    cost_key: Optional[Callable[[Mission], Hashable]] = None
+
     @abstractmethod
     def select(self, available: List[Drone], mission: Mission) -> Drone:
         raise NotImplementedError
 
+    def select_indexed(self, index: DroneIndex, mission: Mission) -> Drone:
+        raise NotImplementedError
+
+    def select_among(self, candidates: List[Tuple[Drone, DroneIndex]], mission: Mission) -> Drone:
+        """Choose among drones picked from several indexes, e.g. one per pool stripe.
+
+        `candidates` pairs each drone with the index it was picked from, in
+        availability order; the default runs `select()` over the drones.
+        """
+        return self.select([d for d, _ in candidates], mission)
+
+    def cost(self, mission: Mission, drone_type: Type[Drone]) -> float:
+        """Cost of giving `mission` a drone of `drone_type` (lower is better).
+
+        Used by batch assignment; the default has no type preference.
+        """
+        return 0.0
+
 
 class SimpleSelectionStrategy(SelectionStrategy):
     """Takes the last available drone (LIFO)."""
 
+    index = BY_CLASS
+
     def select(self, available: List[Drone], mission: Mission) -> Drone:  # type: ignore[override]
         if not available:
             raise RuntimeError("No drones available")
         return available[-1]
 
+    def select_indexed(self, index: DroneIndex, mission: Mission) -> Drone:  # type: ignore[override]
+        return _required(index.last(Drone))
+
 
 class PrioritySelectionStrategy(SelectionStrategy):
     """Prefers certain drone types based on mission attributes.
@@ -33,18 +92,410 @@ class PrioritySelectionStrategy(SelectionStrategy):
     - Fallback to last available.
     """
 
+    index = BY_CLASS
+    cost_key = staticmethod(mission_signature)
+
     def select(self, available: List[Drone], mission: Mission) -> Drone:  # type: ignore[override]
         if not available:
             raise RuntimeError("No drones available")
         # Try priority rule
         if mission.priority >= 4:
             for d in available:
-                if isinstance(d, CombatDrone):
+                if issubclass(d.drone_type, CombatDrone):
                     return d
         # Try imaging rule
         payload = (mission.payload or "").lower()
         if "camera" in payload:
             for d in available:
-                if isinstance(d, SurveyDrone):
+                if issubclass(d.drone_type, SurveyDrone):
                     return d
         return available[-1]
+
+    def select_indexed(self, index: DroneIndex, mission: Mission) -> Drone:  # type: ignore[override]
+        if mission.priority >= 4:
+            d = index.first(CombatDrone)
+            if d is not None:
+                return d
+        if "camera" in (mission.payload or "").lower():
+            d = index.first(SurveyDrone)
+            if d is not None:
+                return d
+        return _required(index.last(Drone))
+
+    def cost(self, mission: Mission, drone_type: Type[Drone]) -> float:  # type: ignore[override]
+        if mission.priority >= 4 and issubclass(drone_type, CombatDrone):
+            return 0.0
+        if "camera" in (mission.payload or "").lower() and issubclass(drone_type, SurveyDrone):
+            return 1.0
+        return 2.0
+
+
+class LeastRecentlyUsedSelectionStrategy(SelectionStrategy):
+    """Takes the drone that has been idle the longest (FIFO)."""
+
+    index = BY_LAST_USED
+
+    def select(self, available: List[Drone], mission: Mission) -> Drone:  # type: ignore[override]
+        if not available:
+            raise RuntimeError("No drones available")
+        return available[0]
+
+    def select_indexed(self, index: DroneIndex, mission: Mission) -> Drone:  # type: ignore[override]
+        return _required(index.first(None))
+
+
+class NearestDroneStrategy(SelectionStrategy):
+    """Takes the available drone closest to the mission's first waypoint.
+
+    Waypoints are resolved through `waypoints` (ValueError if unknown).
+    The pool keeps a `GridIndex` of available drones; `cell_size` should
+    be around the typical spacing between drones. Drones without a
+    position are used only when no positioned drone is available.
+    """
+
+    def __init__(self, waypoints: WaypointRegistry = default_waypoints,
+                 cell_size: float = 1.0) -> None:
+        self._waypoints = waypoints
+        self.index = GridSpec(cell_size)
+
+    def target(self, mission: Mission) -> Position:
+        return self._waypoints.resolve(mission.waypoints[0])
+
+    def select(self, available: List[Drone], mission: Mission) -> Drone:  # type: ignore[override]
+        if not available:
+            raise RuntimeError("No drones available")
+        tx, ty = self.target(mission)
+        positioned = [d for d in available if d.position is not None]
+        if not positioned:
+            return available[0]
+        return min(positioned, key=lambda d: (
+            math.hypot(d.position[0] - tx, d.position[1] - ty), d.identifier))
+
+    def select_indexed(self, index: DroneIndex, mission: Mission) -> Drone:  # type: ignore[override]
+        found = self.nearest(index, mission, 1)
+        return found[0] if found else _required(index.first(None))
+
+    def nearest(self, index: DroneIndex, mission: Mission, k: int) -> List[Drone]:
+        """The `k` available drones closest to the mission's first waypoint.
+
+        `index` is the pool's index for this strategy:
+        ``strategy.nearest(pool.ensure_index(strategy.index), mission, k)``.
+        """
+        return index.nearest(self.target(mission), k)  # type: ignore[attr-defined]
+
+
+def drone_profile(drone: Drone) -> Tuple[Type[Drone], FrozenSet[str]]:
+    """The undecorated drone class and the enhancement names applied to it."""
+    names: List[str] = []
+    while isinstance(drone, DroneDecorator):
+        if isinstance(drone, EnhancedDrone):
+            names.extend(drone.enhancements)
+        elif isinstance(drone, StealthDecorator):
+            names.append("stealth")
+        elif isinstance(drone, RangeExtenderDecorator):
+            names.append("range_extender")
+        drone = drone._wrapped
+    return drone.drone_type, frozenset(names)
+
+
+def _profile_key(drone: Drone) -> Tuple[Hashable]:
+    return (drone_profile(drone),)
+
+
+class _AvailabilityIndex(DroneIndex):
+    """Buckets drones by profile and records when each became available.
+
+    `since` maps identifier to (time it became available, sequence number)
+    for the drones in this index, i.e. in the pool that owns it.
+    """
+
+    def __init__(self, clock: Callable[[], float]) -> None:
+        super().__init__(_profile_key)
+        self.since: Dict[str, Tuple[float, int]] = {}
+        self._clock = clock
+        self._counter = itertools.count()
+
+    def add(self, drone: Drone) -> None:
+        self.since[drone.identifier] = (self._clock(), next(self._counter))
+        super().add(drone)
+
+    def discard(self, drone: Drone) -> None:
+        super().discard(drone)
+        self.since.pop(drone.identifier, None)
+
+
+class _AvailabilitySpec(IndexSpec):
+    def __init__(self, name: str, clock: Callable[[], float]) -> None:
+        super().__init__(name, _profile_key)
+        self._clock = clock
+
+    def create(self) -> DroneIndex:
+        return _AvailabilityIndex(self._clock)
+
+
+# The index depends only on drone profiles and the clock, not on any weights,
+# so a pool builds one for every scoring strategy on the default clock.
+_AVAILABILITY = _AvailabilitySpec("availability", time.monotonic)
+_custom_clocks = itertools.count(1)
+
+
+class ScoringSelectionStrategy(SelectionStrategy):
+    """Picks the available drone with the highest weighted score.
+
+    score = type_weights[type] + sum(enhancement_weights[e])
+            + idle_weight * seconds since the drone became available
+            + mission.priority * priority_weights[type]
+            + payload_weights[word][type] for each word found in the payload
+
+    Type weights apply to subclasses too. Drones with the same type and
+    enhancements differ only in idle time, so the pool index buckets them
+    by (type, enhancements) in availability order and only each bucket's
+    head (oldest, or newest for a negative `idle_weight`) is scored: a
+    selection costs O(number of buckets), not O(fleet size). Ties go to
+    the drone that has been available longest.
+
+    Availability times are kept by each pool's index, so `select()` on a
+    bare list (with no index to read them from) counts every drone as
+    just released.
+    """
+
+    cost_key = staticmethod(mission_signature)
+
+    def __init__(self, type_weights: Optional[Mapping[Type[Drone], float]] = None,
+                 enhancement_weights: Optional[Mapping[str, float]] = None,
+                 idle_weight: float = 0.0,
+                 priority_weights: Optional[Mapping[Type[Drone], float]] = None,
+                 payload_weights: Optional[Mapping[str, Mapping[Type[Drone], float]]] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self._type_weights = dict(type_weights or {})
+        self._enhancement_weights = dict(enhancement_weights or {})
+        self._idle_weight = idle_weight
+        self._priority_weights = dict(priority_weights or {CombatDrone: 1.0})
+        self._payload_weights = {
+            word.lower(): dict(weights)
+            for word, weights in (payload_weights or {"camera": {SurveyDrone: 5.0}}).items()
+        }
+        self._clock = clock
+        self.index = _AVAILABILITY if clock is time.monotonic else _AvailabilitySpec(
+            f"availability-{next(_custom_clocks)}", clock
+        )
+        self._static: Dict[Tuple[Type[Drone], FrozenSet[str]], Tuple[float, float]] = {}
+
+    def _profile_weights(self, profile: Tuple[Type[Drone], FrozenSet[str]]) -> Tuple[float, float]:
+        """(static score, priority multiplier) of a drone profile, memoized."""
+        weights = self._static.get(profile)
+        if weights is None:
+            drone_type, enhancements = profile
+            static = _class_weight(self._type_weights, drone_type)
+            static += sum(self._enhancement_weights.get(e, 0.0) for e in enhancements)
+            weights = self._static[profile] = (
+                static, _class_weight(self._priority_weights, drone_type)
+            )
+        return weights
+
+    def _mission_terms(self, mission: Mission) -> Tuple[int, List[Mapping[Type[Drone], float]]]:
+        payload = (mission.payload or "").lower()
+        return mission.priority, [w for word, w in self._payload_weights.items() if word in payload]
+
+    def _key(self, drone: Drone, profile: Tuple[Type[Drone], FrozenSet[str]], priority: int,
+             payload: List[Mapping[Type[Drone], float]], now: float,
+             available_since: Mapping[str, Tuple[float, int]]) -> Tuple[float, int]:
+        static, per_priority = self._profile_weights(profile)
+        score = static + priority * per_priority
+        for weights in payload:
+            score += _class_weight(weights, profile[0])
+        since, seq = available_since.get(drone.identifier, (now, 1 << 62))
+        score += self._idle_weight * (now - since)
+        return score, (seq if self._idle_weight < 0 else -seq)
+
+    def select(self, available: List[Drone], mission: Mission) -> Drone:  # type: ignore[override]
+        if not available:
+            raise RuntimeError("No drones available")
+        priority, payload = self._mission_terms(mission)
+        now = self._clock()
+        return max(available,
+                   key=lambda d: self._key(d, drone_profile(d), priority, payload, now, {}))
+
+    def select_indexed(self, index: DroneIndex, mission: Mission) -> Drone:  # type: ignore[override]
+        priority, payload = self._mission_terms(mission)
+        now = self._clock()
+        since = _since(index)
+        pick = index.last if self._idle_weight < 0 else index.first
+        best, best_key = None, None
+        for profile in index.keys():
+            d = pick(profile)
+            key = self._key(d, profile, priority, payload, now, since)
+            if best_key is None or key > best_key:
+                best, best_key = d, key
+        return _required(best)
+
+    def select_among(self, candidates: List[Tuple[Drone, DroneIndex]],  # type: ignore[override]
+                     mission: Mission) -> Drone:
+        if not candidates:
+            raise RuntimeError("No drones available")
+        priority, payload = self._mission_terms(mission)
+        now = self._clock()
+        return max(candidates, key=lambda pair: self._key(
+            pair[0], drone_profile(pair[0]), priority, payload, now, _since(pair[1])))[0]
+
+    def cost(self, mission: Mission, drone_type: Type[Drone]) -> float:  # type: ignore[override]
+        priority, payload = self._mission_terms(mission)
+        static, per_priority = self._profile_weights((drone_type, frozenset()))
+        return -(static + priority * per_priority
+                 + sum(_class_weight(w, drone_type) for w in payload))
+
+
+def _class_weight(weights: Mapping[Type[Drone], float], drone_type: Type[Drone]) -> float:
+    return sum(w for cls, w in weights.items() if issubclass(drone_type, cls))
+
+
+def _since(index: DroneIndex) -> Mapping[str, Tuple[float, int]]:
+    """Availability times recorded by `index` (empty unless it is an availability index)."""
+    return getattr(index, "since", None) or {}
+
+
+class _RecordingIndex:
+    """Passes index lookups through and records the ones a decision depended on."""
+
+    def __init__(self, index: DroneIndex) -> None:
+        self._index = index
+        self.calls: List[Tuple[str, Hashable, Optional[Drone]]] = []
+        # Set when the strategy used anything beyond which buckets are non-empty.
+        self.opaque = False
+
+    def first(self, key: Hashable) -> Optional[Drone]:
+        d = self._index.first(key)
+        self.calls.append(("first", key, d))
+        return d
+
+    def last(self, key: Hashable) -> Optional[Drone]:
+        d = self._index.last(key)
+        self.calls.append(("last", key, d))
+        return d
+
+    def __getattr__(self, name: str) -> Any:
+        self.opaque = True
+        return getattr(self._index, name)
+
+
+class CachingSelectionStrategy(SelectionStrategy):
+    """Memoizes another strategy's decisions per mission signature.
+
+    Indexed strategies are assumed to decide from which index buckets are
+    non-empty (as the built-in ones do). The cache remembers which lookup,
+    ``first(key)`` or ``last(key)``, produced the chosen drone and replays
+    it while the index's `shape_version` is unchanged, so checkouts and
+    releases that do not empty or create a bucket keep the entry valid.
+    Decisions that used other index methods (including `keys()`, which
+    strategies use to compare drones across buckets), or that several
+    lookups could have produced, are not cached.
+
+    Strategies without an index are run over the `BY_LAST_USED` bucket
+    (every available drone, in availability order), and their decisions
+    are reused only until the index's `version` changes, i.e. while no
+    drone has been checked out or released. Like other indexed strategies,
+    they then choose per stripe on a `ConcurrentDronePool`.
+
+    `signature(mission)` must capture everything the wrapped strategy reads
+    from the mission; the default uses priority and payload.
+    """
+
+    def __init__(self, strategy: SelectionStrategy,
+                 signature: Callable[[Mission], Hashable] = mission_signature,
+                 max_entries: int = 1024) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._strategy = strategy
+        self._signature = signature
+        self._max_entries = max_entries
+        self._by_shape = strategy.index is not None
+        self.index = strategy.index if self._by_shape else BY_LAST_USED
+        # One table per index, so per-stripe indexes of a concurrent pool do not mix.
+        self._tables: weakref.WeakKeyDictionary[DroneIndex, Dict[Hashable, tuple]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def strategy(self) -> SelectionStrategy:
+        return self._strategy
+
+    def select(self, available: List[Drone], mission: Mission) -> Drone:  # type: ignore[override]
+        return self._strategy.select(available, mission)
+
+    def select_among(self, candidates: List[Tuple[Drone, DroneIndex]],  # type: ignore[override]
+                     mission: Mission) -> Drone:
+        return self._strategy.select_among(candidates, mission)
+
+    def select_indexed(self, index: DroneIndex, mission: Mission) -> Drone:  # type: ignore[override]
+        table = self._tables.get(index)
+        if table is None:
+            with self._lock:
+                table = self._tables.setdefault(index, {})
+        signature = self._signature(mission)
+        entry = table.get(signature)
+        if entry is not None:
+            drone = self._replay(index, entry)
+            if drone is not None:
+                self._record(True)
+                return drone
+            table.pop(signature, None)
+        self._record(False)
+        if not self._by_shape:
+            drone = self._strategy.select(index.drones(None), mission)
+            self._store(table, signature, (index.version, drone))
+            return drone
+        recorder = _RecordingIndex(index)
+        drone = self._strategy.select_indexed(recorder, mission)  # type: ignore[arg-type]
+        sources = [(end, key) for end, key, d in recorder.calls if d is drone]
+        if not recorder.opaque and len(sources) == 1:
+            self._store(table, signature, (index.shape_version, *sources[0]))
+        return drone
+
+    def _replay(self, index: DroneIndex, entry: tuple) -> Optional[Drone]:
+        if not self._by_shape:
+            version, drone = entry
+            return drone if version == index.version else None
+        shape_version, end, key = entry
+        if shape_version != index.shape_version:
+            return None
+        return index.first(key) if end == "first" else index.last(key)
+
+    def _store(self, table: Dict[Hashable, tuple], signature: Hashable, entry: tuple) -> None:
+        if len(table) >= self._max_entries:
+            del table[next(iter(table))]
+        table[signature] = entry
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        metrics = instrumentation.ACTIVE
+        if metrics is not None:
+            metrics.count("drone_fleet_selection_cache_total", result="hit" if hit else "miss")
+
+    def cost(self, mission: Mission, drone_type: Type[Drone]) -> float:  # type: ignore[override]
+        return self._strategy.cost(mission, drone_type)
+
+    @property
+    def cost_key(self) -> Optional[Callable[[Mission], Hashable]]:  # type: ignore[override]
+        return self._strategy.cost_key
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables = weakref.WeakKeyDictionary()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+
+def _required(drone: Optional[Drone]) -> Drone:
+    if drone is None:
+        raise RuntimeError("No drones available")
+    return drone
@@ -0,0 +1,13 @@
+import pytest
+
+from drone_fleet.domain.fleet_manager import FleetManager
+
+
+@pytest.fixture
+def fleet():
+    """The FleetManager singleton, with its pool and strategy restored afterwards."""
+    fm = FleetManager.instance()
+    pool, strategy = fm.pool, fm.selection_strategy
+    yield fm
+    fm.set_pool(pool)
+    fm.set_selection_strategy(strategy)
@@ -0,0 +1,32 @@
+import pytest
+
+from drone_fleet.utilities.adapters import LegacyMissionAdapter
+
+GOOD = {"title": "Recon", "wps": ["WP-1", "WP-2"], "len": "30", "prio": 4, "cargo": "Camera"}
+
+
+def test_bulk_conversion_matches_single_conversion():
+    [bulk] = LegacyMissionAdapter.to_missions([GOOD])
+    single = LegacyMissionAdapter(GOOD).to_mission()
+    assert (bulk.name, bulk.waypoints, bulk.duration_minutes, bulk.priority, bulk.payload) == (
+        single.name, single.waypoints, single.duration_minutes, single.priority, single.payload)
+
+
+@pytest.mark.parametrize("bad", [
+    {"title": "A", "wps": 5, "len": 10},
+    {"title": "B", "wps": "WP-1", "len": 10},
+    {"title": "C", "wps": ["WP-1"], "len": "ten"},
+    {"title": "D", "wps": ["WP-1"], "len": 10, "prio": None},
+    {"title": "E", "wps": ["WP-1"], "len": 0},
+    {"title": "F", "wps": [], "len": 10},
+])
+def test_bad_records_go_to_on_error(bad):
+    errors = []
+    missions = LegacyMissionAdapter.to_missions([GOOD, bad, GOOD], lambda r, why: errors.append(r))
+    assert len(missions) == 2
+    assert errors == [bad]
+
+
+def test_bad_record_without_on_error_raises():
+    with pytest.raises((ValueError, TypeError)):
+        LegacyMissionAdapter.to_missions([GOOD, {"title": "A", "wps": 5, "len": 10}])
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from drone_fleet.domain.async_fleet_manager import AsyncFleetManager
+from drone_fleet.factory.async_pool import AsyncDronePool
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import SurveyDrone
+from drone_fleet.models.mission import Mission
+
+
+def make_pool(*identifiers):
+    pool = DronePool(max_size=len(identifiers) or 1)
+    pool.preload([SurveyDrone(i) for i in identifiers])
+    return pool
+
+
+def test_checkout_waits_for_release():
+    async def scenario():
+        pool = AsyncDronePool(make_pool("a"))
+        held = await pool.checkout()
+        waiter = asyncio.create_task(pool.checkout())
+        await asyncio.sleep(0)
+        assert not waiter.done() and pool.waiting == 1
+        pool.release(held)
+        assert await waiter is held
+
+    asyncio.run(scenario())
+
+
+def test_priority_order_serves_highest_priority_first():
+    async def scenario():
+        pool = AsyncDronePool(make_pool("a"), order="priority")
+        held = await pool.checkout()
+        low = asyncio.create_task(pool.checkout(priority=1))
+        high = asyncio.create_task(pool.checkout(priority=5))
+        await asyncio.sleep(0)
+        pool.release(held)
+        await asyncio.sleep(0)
+        assert high.done() and not low.done()
+        low.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_keep_the_drone():
+    async def scenario():
+        inner = make_pool("a")
+        pool = AsyncDronePool(inner)
+        held = await pool.checkout()
+        waiter = asyncio.create_task(pool.checkout())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        pool.release(held)
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert inner.available_count() == 1
+
+    asyncio.run(scenario())
+
+
+def test_manager_follows_the_fleet_pool(fleet):
+    fleet.set_pool(make_pool("old"))
+    manager = AsyncFleetManager(fleet)
+    fleet.set_pool(make_pool("new"))
+
+    async def scenario():
+        drone = await manager.assign_mission(Mission("m", ["WP-1"], 10))
+        assert drone.identifier == "new"
+        await manager.release(drone)
+        assert fleet.pool.available_count() == 1
+
+    asyncio.run(scenario())
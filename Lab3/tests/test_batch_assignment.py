@@ -0,0 +1,52 @@
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import CargoDrone, CombatDrone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.assignment import BatchAssigner
+from drone_fleet.utilities.decorators import EnhancedDrone
+from drone_fleet.utilities.strategies import PrioritySelectionStrategy
+
+
+def test_enhanced_drones_match_their_underlying_type():
+    combat = EnhancedDrone(CombatDrone("C-1"), ["stealth"])
+    cargo = CargoDrone("G-1")
+    buckets = {EnhancedDrone: [combat], CargoDrone: [cargo]}
+    urgent = Mission("strike", ["WP-1"], 10, priority=5)
+    pairs = BatchAssigner(PrioritySelectionStrategy().cost).solve([urgent], buckets)
+    assert pairs == [(urgent, combat)]
+
+
+def test_lazy_drones_are_not_realized_by_batching(fleet):
+    proxies = [fleet.lazy_drone("combat", f"L-{i}") for i in range(50)]
+    pool = DronePool(max_size=50)
+    pool.preload(proxies)
+    fleet.set_pool(pool)
+    fleet.set_selection_strategy(PrioritySelectionStrategy())
+    pairs = fleet.assign_many([Mission("m", ["WP-1"], 10)])
+    assert len(pairs) == 1
+    assert sum(p.is_realized for p in proxies) == 1  # only the drone given a mission
+
+
+def test_select_and_cost_agree_for_wrapped_drones():
+    strategy = PrioritySelectionStrategy()
+    combat = EnhancedDrone(CombatDrone("C-1"), ["stealth"])
+    pool = DronePool(max_size=2)
+    pool.preload([combat, CargoDrone("G-1")])
+    urgent = Mission("strike", ["WP-1"], 10, priority=5)
+    batch = BatchAssigner(strategy.cost).solve([urgent], pool.available_by_type())
+    assert pool.select(strategy, urgent) is combat
+    assert strategy.select(pool.available_drones, urgent) is combat
+    assert batch == [(urgent, combat)]
+
+
+def test_cost_key_gives_the_same_matching():
+    strategy = PrioritySelectionStrategy()
+    missions = [Mission(f"m-{i}", ["WP-1"], 10, priority=1 + i % 5,
+                        payload="HD Camera" if i % 3 else None) for i in range(30)]
+    fleet = [CombatDrone(f"X-{i}") for i in range(10)] + [CargoDrone(f"G-{i}") for i in range(15)]
+
+    def buckets():
+        return {CombatDrone: fleet[:10], CargoDrone: fleet[10:]}
+
+    plain = BatchAssigner(strategy.cost).solve(missions, buckets())
+    keyed = BatchAssigner(strategy.cost, strategy.cost_key).solve(missions, buckets())
+    assert plain == keyed
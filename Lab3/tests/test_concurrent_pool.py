@@ -0,0 +1,102 @@
+import sys
+import threading
+import time
+
+from drone_fleet.factory.concurrent_pool import ConcurrentDronePool
+from drone_fleet.factory.drone_index import BY_CLASS, BY_LAST_USED
+from drone_fleet.models.drone import CargoDrone, Drone, SurveyDrone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.strategies import SimpleSelectionStrategy
+
+MISSION = Mission("Recon", ["WP-1"], 30)
+
+
+def make_pool(size=6):
+    pool = ConcurrentDronePool(max_size=size)
+    pool.preload([(SurveyDrone if i % 2 else CargoDrone)(f"D-{i}") for i in range(size)])
+    return pool
+
+
+def test_in_use_count_sums_stripes():
+    pool = make_pool()
+    assert pool.in_use_count() == 0
+    a = pool.checkout()
+    pool.checkout()
+    assert pool.in_use_count() == 2
+    pool.release(a)
+    assert pool.in_use_count() == 1
+
+
+def test_ensure_index_covers_every_stripe_in_availability_order():
+    pool = make_pool()
+    index = pool.ensure_index(BY_LAST_USED)
+    assert [d.identifier for d in index.drones(None)] == [f"D-{i}" for i in range(6)]
+    assert pool.ensure_index(BY_LAST_USED) is index
+
+
+def test_ensure_index_follows_checkouts_and_releases():
+    pool = make_pool()
+    index = pool.ensure_index(BY_CLASS)
+    survey = pool.checkout_specific(pool.available_by_type()[SurveyDrone][0])
+    assert index.count(SurveyDrone) == 2
+    assert index.count(Drone) == 5
+    pool.release(survey)
+    assert index.last(Drone) is survey
+    pool.discard(survey)
+    assert index.count(Drone) == 5
+
+
+def test_ensure_index_consistent_under_concurrent_churn():
+    pool = make_pool(24)
+    index = pool.ensure_index(BY_LAST_USED)
+
+    def worker():
+        for _ in range(2_000):
+            pool.release(pool.checkout(timeout=None))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert {d.identifier for d in index.drones(None)} == {
+        d.identifier for d in pool.available_drones
+    }
+    assert index.count(None) == pool.available_count() == 24
+
+
+def test_readers_survive_concurrent_discard():
+    pool = ConcurrentDronePool(max_size=64)
+    stop = threading.Event()
+    errors = []
+
+    def churn():
+        n = 0
+        while not stop.is_set():
+            drones = [SurveyDrone(f"s{n + i}") for i in range(32)]
+            n += 32
+            pool.preload(drones)
+            for d in drones:
+                pool.discard(d)
+
+    def read():
+        try:
+            while not stop.is_set():
+                pool.available_drones
+                pool.select(SimpleSelectionStrategy(), MISSION)
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=churn), threading.Thread(target=read)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often enough to hit the race
+    try:
+        for t in threads:
+            t.start()
+        time.sleep(1.0)
+        stop.set()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
@@ -0,0 +1,29 @@
+from drone_fleet.factory.drone_factory import SurveyDroneFactory
+from drone_fleet.models.drone import SurveyDrone
+
+
+class TaggedSurveyDrone(SurveyDrone):
+    pass
+
+
+class TaggingSurveyFactory(SurveyDroneFactory):
+    """Inherits `product` but customizes `create`."""
+
+    def create(self, identifier):
+        return TaggedSurveyDrone(identifier)
+
+
+def test_create_many_builds_product_directly():
+    drones = SurveyDroneFactory().create_many(["a", "b"])
+    assert [(type(d), d.identifier) for d in drones] == [(SurveyDrone, "a"), (SurveyDrone, "b")]
+
+
+def test_create_many_honours_overridden_create():
+    drones = TaggingSurveyFactory().create_many(["a", "b"])
+    assert all(type(d) is TaggedSurveyDrone for d in drones)
+
+
+def test_create_many_threaded_preserves_order():
+    ids = [f"T-{i}" for i in range(25)]
+    drones = TaggingSurveyFactory().create_many(ids, workers=3, chunk_size=4)
+    assert [d.identifier for d in drones] == ids
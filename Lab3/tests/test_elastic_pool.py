@@ -0,0 +1,86 @@
+import pytest
+
+from drone_fleet.factory.elastic_pool import ElasticDronePool
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.factory.registry import default_registry
+from drone_fleet.models.drone import SurveyDrone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.strategies import SelectionStrategy, SimpleSelectionStrategy
+
+MAKERS = {kind: default_registry.get(kind).create for kind in ("survey", "cargo")}
+
+
+def make_pool(watermarks, idle_ttl=None):
+    return ElasticDronePool(watermarks, {k: MAKERS[k] for k in watermarks}, idle_ttl=idle_ttl)
+
+
+def test_watermarks_are_validated():
+    with pytest.raises(ValueError):
+        make_pool({"survey": (3, 2)})
+    with pytest.raises(ValueError):
+        ElasticDronePool({"tank": (1, 2)}, MAKERS)
+
+
+def test_replenish_tops_up_to_low_watermark_within_max_total():
+    pool = make_pool({"survey": (2, 3), "cargo": (1, 1)})
+    assert pool.population() == {"survey": 2, "cargo": 1}
+    held = [pool.checkout(), pool.checkout()]
+    assert pool.replenish() == 1  # survey capped at max_total=3
+    assert pool.population() == {"survey": 3, "cargo": 1}
+    for d in held:
+        pool.release(d)
+    assert pool.replenish() == 0
+    assert pool.metrics["created"] == 4
+
+
+def test_evict_idle_keeps_low_watermark():
+    pool = make_pool({"survey": (1, 4)}, idle_ttl=10.0)
+    held = pool.checkout()
+    assert pool.replenish() == 1
+    pool.release(held)
+    assert pool.available_count() == 2
+    assert pool.evict_idle() == 0  # nothing idle for 10s yet
+    evicted = pool.evict_idle(now=float("inf"))
+    assert evicted == 1
+    assert pool.available_count() == 1
+    assert pool.population() == {"survey": 1}
+    assert pool.discards == 1 and pool.metrics["evicted"] == 1
+
+
+class EvictingStrategy(SelectionStrategy):
+    """Picks the first drone, but lets the pool evict it before checkout once."""
+
+    def __init__(self, pool):
+        self._pool = pool
+        self.evicted = False
+
+    def select(self, available, mission):
+        choice = available[0]
+        if not self.evicted:
+            self.evicted = self._pool.discard(choice)
+        return choice
+
+
+def test_assign_retries_when_choice_is_evicted(fleet):
+    pool = DronePool(max_size=2)
+    pool.preload([SurveyDrone("a"), SurveyDrone("b")])
+    fleet.set_pool(pool)
+    fleet.set_selection_strategy(EvictingStrategy(pool))
+    drone = fleet.assign_mission_to_drone(Mission("m", ["WP-1"], 10))
+    assert drone.identifier == "b"
+
+
+def test_release_after_autoscaling_goes_to_the_old_pool(fleet):
+    old = DronePool(max_size=1)
+    old.preload([SurveyDrone("a")])
+    fleet.set_pool(old)
+    fleet.set_selection_strategy(SimpleSelectionStrategy())
+    drone = fleet.assign_mission_to_drone(Mission("m", ["WP-1"], 10))
+    elastic = fleet.enable_autoscaling({"survey": (1, 2)})
+    try:
+        assert fleet.pool_of(drone) is old
+        fleet.release_drone(drone)
+        assert old.is_available(drone) and drone.active_mission is None
+        assert fleet.pool_of(drone) is elastic
+    finally:
+        elastic.stop()
@@ -0,0 +1,72 @@
+import pytest
+
+from drone_fleet.factory.concurrent_pool import ConcurrentDronePool
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import SurveyDrone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.decorators import EnhancedDrone
+from drone_fleet.utilities.strategies import (
+    ScoringSelectionStrategy,
+    SelectionStrategy,
+    SimpleSelectionStrategy,
+)
+
+
+class GhostStrategy(SelectionStrategy):
+    """Always picks a drone the pool does not hold."""
+
+    def select(self, available, mission):
+        return SurveyDrone("ghost")
+
+
+@pytest.mark.parametrize("pool_cls", [DronePool, ConcurrentDronePool])
+def test_unavailable_choice_raises_instead_of_retrying(fleet, pool_cls):
+    pool = pool_cls(max_size=2)
+    pool.preload([SurveyDrone("a")])
+    fleet.set_pool(pool)
+    fleet.set_selection_strategy(GhostStrategy())
+    with pytest.raises(RuntimeError, match="Requested drone is not available"):
+        fleet.assign_mission_to_drone(Mission("m", ["WP-1"], 10))
+
+
+def test_assign_checks_out_selected_drone(fleet):
+    pool = ConcurrentDronePool(max_size=2)
+    pool.preload([SurveyDrone("a")])
+    fleet.set_pool(pool)
+    fleet.set_selection_strategy(SimpleSelectionStrategy())
+    drone = fleet.assign_mission_to_drone(Mission("m", ["WP-1"], 10))
+    assert pool.is_in_use(drone) and pool.in_use_count() == 1
+
+
+@pytest.mark.parametrize("pool_cls", [DronePool, ConcurrentDronePool])
+def test_enhancing_an_available_drone_updates_indexes(fleet, pool_cls):
+    plain, enhanced = SurveyDrone("a"), EnhancedDrone(SurveyDrone("b"))
+    pool = pool_cls(max_size=2)
+    pool.preload([plain, enhanced])
+    fleet.set_pool(pool)
+    strategy = ScoringSelectionStrategy(enhancement_weights={"stealth": 5.0})
+    fleet.set_selection_strategy(strategy)
+    mission = Mission("m", ["WP-1"], 10)
+    pool.ensure_index(strategy.index)
+    fleet.enhance_drone(enhanced, stealth=True)
+    assert pool.select(strategy, mission) is enhanced
+
+
+def test_set_pool_stops_elastic_pool_and_moves_listeners(fleet):
+    elastic = fleet.enable_autoscaling({"survey": (1, 2)})
+    released = []
+    elastic.add_release_listener(released.append)
+    pool = DronePool(max_size=1)
+    pool.preload([SurveyDrone("a")])
+    fleet.set_pool(pool)
+    assert elastic._thread is None
+    fleet.set_selection_strategy(SimpleSelectionStrategy())
+    drone = fleet.assign_mission_to_drone(Mission("m", ["WP-1"], 10))
+    fleet.release_drone(drone)
+    assert released == [drone]
+
+
+def test_setting_the_current_pool_again_keeps_it_running(fleet):
+    elastic = fleet.enable_autoscaling({"survey": (1, 2)})
+    fleet.set_pool(elastic)
+    assert elastic._thread is not None
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from drone_fleet.utilities import ingestion
+from drone_fleet.utilities.adapters import LegacyMissionAdapter
+from drone_fleet.utilities.ingestion import MissionIngestor, convert_batch
+
+GOOD = {"title": "Recon", "wps": ["WP-1", "WP-2"], "len": 30, "prio": 2}
+BAD = [
+    {"title": "A", "wps": 5, "len": 10},
+    {"title": "B", "wps": ["WP-1"], "len": "ten"},
+    '{"title": "broken"',
+    ["not", "a", "mapping"],
+]
+
+
+def test_convert_batch_reports_bad_records():
+    missions, failed = convert_batch([GOOD, *BAD, json.dumps(GOOD)])
+    assert [m.name for m in missions] == ["Recon", "Recon"]
+    assert [record for record, _ in failed][:2] == BAD[2:]
+    assert len(failed) == len(BAD)
+
+
+def test_convert_batch_falls_back_to_single_records(monkeypatch):
+    def explode(records, on_error=None):
+        raise TypeError("bulk path failed")
+
+    monkeypatch.setattr(LegacyMissionAdapter, "to_missions", staticmethod(explode))
+    missions, failed = convert_batch([GOOD, BAD[0], GOOD])
+    assert len(missions) == 2
+    assert [record for record, _ in failed] == [BAD[0]]
+
+
+def test_ingest_keeps_going_past_bad_records():
+    errors = []
+    ingestor = MissionIngestor(batch_size=2, error_sink=lambda record, problem: errors.append(record))
+    missions = list(ingestor.ingest([GOOD, *BAD, GOOD]))
+    assert len(missions) == 2
+    assert len(errors) == len(BAD)
+    assert (ingestor.report.converted, ingestor.report.failed) == (2, len(BAD))
+
+
+def test_small_streams_stay_in_process(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started for a small stream")
+
+    monkeypatch.setattr(ingestion, "ProcessPoolExecutor", no_pool)
+    ingestor = MissionIngestor(batch_size=2, workers=2, parallel_threshold=10)
+    assert len(list(ingestor.ingest([GOOD] * 10))) == 10
+
+
+def test_stream_past_threshold_uses_pool_and_keeps_order():
+    records = [dict(GOOD, title=f"M-{i}") for i in range(12)]
+    ingestor = MissionIngestor(batch_size=3, workers=1, parallel_threshold=4)
+    assert [m.name for m in ingestor.ingest(records)] == [r["title"] for r in records]
+
+
+def test_parallel_threshold_must_not_be_negative():
+    with pytest.raises(ValueError):
+        MissionIngestor(parallel_threshold=-1)
@@ -0,0 +1,77 @@
+import os
+import urllib.request
+
+import pytest
+
+from drone_fleet.factory.concurrent_pool import ConcurrentDronePool
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import CargoDrone, CombatDrone, SurveyDrone
+from drone_fleet.utilities import instrumentation
+from drone_fleet.utilities.instrumentation import CONTENT_TYPE, Instrumentation
+
+CHECKOUTS = "drone_fleet_pool_checkouts_total"
+
+
+@pytest.fixture
+def metrics():
+    previous = instrumentation.ACTIVE
+    yield instrumentation.enable()
+    instrumentation.ACTIVE = previous
+
+
+@pytest.mark.parametrize("pool_cls", [DronePool, ConcurrentDronePool])
+def test_each_checkout_records_one_hit_or_miss(metrics, pool_cls):
+    pool = pool_cls(max_size=3)
+    pool.preload([SurveyDrone("s"), CargoDrone("c"), CombatDrone("x")])
+    drones = [pool.try_checkout() for _ in range(3)]
+    assert pool.try_checkout() is None
+    assert pool.try_checkout_specific(SurveyDrone("ghost")) is None
+    assert metrics.counter_value(CHECKOUTS, result="hit") == 3
+    assert metrics.counter_value(CHECKOUTS, result="miss") == 2
+    for d in drones:
+        pool.release(d)
+    assert metrics.counter_value("drone_fleet_pool_releases_total") == 3
+
+
+def test_prometheus_text_format():
+    m = Instrumentation(buckets=(0.5, 0.1))
+    m.count(CHECKOUTS, result="hit")
+    m.count(CHECKOUTS, 2, result="miss")
+    m.count("custom_total", 1.5, path='a"b\\c\nd')
+    m.describe("custom_total", "A custom counter.")
+    for value in (0.05, 0.2, 3.0):
+        m.observe("drone_fleet_select_seconds", value, strategy="Simple")
+    assert m.to_prometheus().splitlines() == [
+        "# HELP custom_total A custom counter.",
+        "# TYPE custom_total counter",
+        'custom_total{path="a\\"b\\\\c\\nd"} 1.5',
+        "# HELP drone_fleet_pool_checkouts_total Pool checkout attempts, by result (hit or miss).",
+        "# TYPE drone_fleet_pool_checkouts_total counter",
+        'drone_fleet_pool_checkouts_total{result="hit"} 1',
+        'drone_fleet_pool_checkouts_total{result="miss"} 2',
+        "# HELP drone_fleet_select_seconds Time spent selecting a drone, by strategy.",
+        "# TYPE drone_fleet_select_seconds histogram",
+        'drone_fleet_select_seconds_bucket{strategy="Simple",le="0.1"} 1',
+        'drone_fleet_select_seconds_bucket{strategy="Simple",le="0.5"} 2',
+        'drone_fleet_select_seconds_bucket{strategy="Simple",le="+Inf"} 3',
+        'drone_fleet_select_seconds_sum{strategy="Simple"} 3.25',
+        'drone_fleet_select_seconds_count{strategy="Simple"} 3',
+    ]
+
+
+def test_write_and_serve_export_the_same_text(tmp_path):
+    m = Instrumentation()
+    m.count(CHECKOUTS, result="hit")
+    path = os.path.join(tmp_path, "fleet.prom")
+    m.write(path)
+    with open(path, encoding="utf-8") as fh:
+        assert fh.read() == m.to_prometheus()
+    server = m.serve(port=0)
+    try:
+        host, port = server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert response.read().decode("utf-8") == m.to_prometheus()
+    finally:
+        server.shutdown()
+        server.server_close()
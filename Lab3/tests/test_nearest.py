@@ -0,0 +1,115 @@
+import math
+import random
+
+import pytest
+
+from drone_fleet.factory.drone_index import GridIndex
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import CargoDrone, SurveyDrone
+from drone_fleet.models.mission import Mission
+from drone_fleet.models.waypoints import WaypointRegistry
+from drone_fleet.utilities.strategies import NearestDroneStrategy
+
+
+def brute_force(drones, point, k):
+    positioned = [d for d in drones if d.position is not None]
+    positioned.sort(key=lambda d: (math.hypot(d.position[0] - point[0], d.position[1] - point[1]),
+                                   d.identifier))
+    return positioned[:k]
+
+
+def scattered(count, seed, spread=50.0):
+    rng = random.Random(seed)
+    return [SurveyDrone(f"S-{i:03d}", (rng.uniform(-spread, spread), rng.uniform(-spread, spread)))
+            for i in range(count)]
+
+
+@pytest.mark.parametrize("cell_size", [0.5, 3.0, 40.0])
+@pytest.mark.parametrize("k", [1, 5, 30])
+def test_nearest_matches_brute_force(cell_size, k):
+    drones = scattered(200, seed=7)
+    index = GridIndex(cell_size)
+    for d in drones:
+        index.add(d)
+    rng = random.Random(k)
+    for _ in range(20):
+        point = (rng.uniform(-80, 80), rng.uniform(-80, 80))
+        assert index.nearest(point, k) == brute_force(drones, point, k)
+
+
+def test_nearest_breaks_distance_ties_by_identifier():
+    index = GridIndex(1.0)
+    for name, position in [("d", (0.0, 2.0)), ("b", (2.0, 0.0)), ("c", (-2.0, 0.0)), ("a", (0.0, -2.0))]:
+        index.add(SurveyDrone(name, position))
+    assert [d.identifier for d in index.nearest((0.0, 0.0), 3)] == ["a", "b", "c"]
+
+
+def test_nearest_skips_drones_without_a_position():
+    index = GridIndex(1.0)
+    index.add(SurveyDrone("nowhere"))
+    assert index.nearest((0.0, 0.0), 1) == []
+    index.add(SurveyDrone("here", (5.0, 5.0)))
+    assert [d.identifier for d in index.nearest((0.0, 0.0), 5)] == ["here"]
+
+
+def test_nearest_forgets_discarded_drones():
+    drones = scattered(50, seed=3)
+    index = GridIndex(5.0)
+    for d in drones:
+        index.add(d)
+    for d in drones[::2]:
+        index.discard(d)
+    assert index.nearest((0.0, 0.0), 10) == brute_force(drones[1::2], (0.0, 0.0), 10)
+
+
+def test_nearest_with_non_positive_k_is_empty():
+    index = GridIndex(1.0)
+    index.add(SurveyDrone("a", (0.0, 0.0)))
+    assert index.nearest((0.0, 0.0), 0) == []
+
+
+@pytest.mark.parametrize("cell_size", [0, -1.0])
+def test_grid_index_rejects_non_positive_cell_size(cell_size):
+    with pytest.raises(ValueError):
+        GridIndex(cell_size)
+
+
+@pytest.fixture
+def waypoints():
+    registry = WaypointRegistry()
+    registry.register_many([("HOME", 0.0, 0.0), ("FAR", 40.0, -25.0)])
+    return registry
+
+
+def test_select_and_select_indexed_agree(waypoints):
+    drones = scattered(100, seed=11)
+    strategy = NearestDroneStrategy(waypoints, cell_size=4.0)
+    pool = DronePool(max_size=len(drones))
+    pool.preload(drones)
+    for name in ("HOME", "FAR"):
+        mission = Mission("m", [name], 10)
+        expected = strategy.select(pool.available_drones, mission)
+        assert expected is brute_force(drones, waypoints.resolve(name), 1)[0]
+        assert pool.select(strategy, mission) is expected
+
+
+def test_falls_back_to_drones_without_a_position(waypoints):
+    strategy = NearestDroneStrategy(waypoints)
+    pool = DronePool(max_size=2)
+    pool.preload([CargoDrone("unplaced"), SurveyDrone("placed", (100.0, 100.0))])
+    mission = Mission("m", ["HOME"], 10)
+    assert pool.select(strategy, mission).identifier == "placed"
+    pool.checkout_specific(pool.available_drones[1])
+    assert pool.select(strategy, mission).identifier == "unplaced"
+    assert strategy.select(pool.available_drones, mission).identifier == "unplaced"
+
+
+def test_unknown_waypoint_raises_value_error(waypoints):
+    strategy = NearestDroneStrategy(waypoints)
+    pool = DronePool(max_size=1)
+    pool.preload([SurveyDrone("a", (0.0, 0.0))])
+    mission = Mission("m", ["NOWHERE"], 10)
+    with pytest.raises(ValueError):
+        strategy.select(pool.available_drones, mission)
+    with pytest.raises(ValueError):
+        pool.select(strategy, mission)
@@ -0,0 +1,69 @@
+import pytest
+
+from drone_fleet.factory import registry
+from drone_fleet.factory.drone_factory import DroneFactory
+from drone_fleet.factory.registry import DroneFactoryRegistry, class_name
+from drone_fleet.models.drone import Drone
+
+
+class ReconDrone(Drone):
+    def capabilities(self):
+        return "Recon"
+
+
+class ReconFactory(DroneFactory):
+    product = ReconDrone
+
+    def create(self, identifier):
+        return ReconDrone(identifier)
+
+
+class FakeEntryPoint:
+    def __init__(self, name, target):
+        self.name = name
+        self._target = target
+
+    def load(self):
+        return self._target
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """Serve one plugin from the entry point group and count the scans."""
+    calls = []
+
+    def fake_entry_points(group):
+        calls.append(group)
+        return [FakeEntryPoint("Recon", ReconFactory)]
+
+    monkeypatch.setattr(registry, "entry_points", fake_entry_points)
+    return calls
+
+
+def test_unknown_kind_loads_plugins_once(scans):
+    reg = DroneFactoryRegistry()
+    factory = reg.get("recon")
+    assert isinstance(factory, ReconFactory)
+    assert reg.get("RECON") is factory
+    assert isinstance(reg.create("recon", "R-1"), ReconDrone)
+    with pytest.raises(ValueError, match="Unknown drone kind"):
+        reg.get("tank")
+    assert scans == [registry.ENTRY_POINT_GROUP]
+    assert reg.kinds() == ["recon"]
+
+
+def test_plugin_products_resolve_as_drone_classes(scans):
+    reg = DroneFactoryRegistry()
+    assert reg.drone_class(class_name(ReconDrone)) is ReconDrone
+    with pytest.raises(ValueError, match="Unknown drone class"):
+        reg.drone_class("os:system")
+    assert len(scans) == 1
+
+
+def test_registering_again_replaces_the_cached_factory(scans):
+    reg = DroneFactoryRegistry()
+    first = reg.get("recon")
+    instance = ReconFactory()
+    reg.register("recon", instance)
+    assert reg.get("recon") is instance is not first
+    assert len(scans) == 1
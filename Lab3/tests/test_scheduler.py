@@ -0,0 +1,128 @@
+import random
+
+import pytest
+
+from drone_fleet.domain.scheduler import MissionScheduler
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import SurveyDrone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.strategies import SelectionStrategy, SimpleSelectionStrategy
+
+
+class FailingStrategy(SelectionStrategy):
+    """Raises for missions named "bad", otherwise takes the first drone."""
+
+    def select(self, available, mission):
+        if mission.name == "bad":
+            raise ValueError("cannot plan mission")
+        return available[0] if available else None
+
+
+@pytest.fixture
+def empty_fleet(fleet):
+    fleet.set_pool(DronePool(max_size=100))
+    fleet.set_selection_strategy(SimpleSelectionStrategy())
+    return fleet
+
+
+def add_drones(fleet, count):
+    start = fleet.pool.available_count() + fleet.pool.in_use_count()
+    fleet.pool.preload([SurveyDrone(f"S-{start + i}") for i in range(count)])
+
+
+def test_missions_leave_by_priority_then_deadline_then_order(empty_fleet):
+    scheduler = MissionScheduler(empty_fleet, clock=lambda: 0.0)
+    submitted = [
+        ("low", 1, None), ("urgent-late", 5, 20.0), ("urgent-soon", 5, 10.0),
+        ("mid-a", 3, None), ("mid-b", 3, None), ("urgent-open", 5, None),
+    ]
+    for name, priority, deadline in submitted:
+        scheduler.submit(Mission(name, ["WP-1"], 10, priority=priority), deadline, dispatch=False)
+    add_drones(empty_fleet, len(submitted))
+    order = [m.name for m, _ in scheduler.dispatch()]
+    assert order == ["urgent-soon", "urgent-late", "urgent-open", "mid-a", "mid-b", "low"]
+    scheduler.close()
+
+
+def test_random_cancels_keep_heap_order(empty_fleet):
+    rng = random.Random(7)
+    scheduler = MissionScheduler(empty_fleet)
+    entries = [scheduler.submit(Mission(f"M-{i}", ["WP-1"], 10, priority=rng.randint(1, 5)),
+                                rng.choice([None, rng.random()]), dispatch=False)
+               for i in range(200)]
+    cancelled = set(rng.sample(range(200), 80))
+    for i in cancelled:
+        assert scheduler.cancel(entries[i])
+        assert not scheduler.cancel(entries[i])
+    assert len(scheduler) == 120
+    kept = sorted((e for i, e in enumerate(entries) if i not in cancelled), key=lambda e: e._key)
+    popped = []
+    while scheduler.peek() is not None:
+        head = scheduler.peek()
+        popped.append(head)
+        scheduler.cancel(head)
+    assert popped == kept
+    scheduler.close()
+
+
+def test_cancel_ignores_entries_from_another_scheduler(empty_fleet):
+    first, second = MissionScheduler(empty_fleet), MissionScheduler(empty_fleet)
+    for i in range(3):
+        first.submit(Mission(f"A-{i}", ["WP-1"], 10), dispatch=False)
+    foreign = second.submit(Mission("B", ["WP-1"], 10), dispatch=False)
+    last = first.submit(Mission("A-last", ["WP-1"], 10), dispatch=False)
+    assert not second.cancel(last)  # position 3 is out of range there
+    assert not first.cancel(foreign)
+    assert (len(first), len(second)) == (4, 1)
+    first.close()
+    second.close()
+
+
+def test_expired_missions_are_reported(empty_fleet):
+    expired = []
+    scheduler = MissionScheduler(empty_fleet, on_expired=expired.append, clock=lambda: 5.0)
+    scheduler.submit(Mission("stale", ["WP-1"], 10, priority=5), deadline=1.0, dispatch=False)
+    scheduler.submit(Mission("fresh", ["WP-1"], 10), deadline=9.0, dispatch=False)
+    add_drones(empty_fleet, 1)
+    assert [m.name for m, _ in scheduler.dispatch()] == ["fresh"]
+    assert [m.name for m in expired] == ["stale"]
+    scheduler.close()
+
+
+def test_strategy_failure_drops_only_that_mission(empty_fleet):
+    empty_fleet.set_selection_strategy(FailingStrategy())
+    errors = []
+    scheduler = MissionScheduler(empty_fleet, on_error=lambda m, exc: errors.append((m.name, exc)))
+    scheduler.submit(Mission("bad", ["WP-1"], 10, priority=5), dispatch=False)
+    scheduler.submit(Mission("good", ["WP-1"], 10), dispatch=False)
+    add_drones(empty_fleet, 1)
+    assert [m.name for m, _ in scheduler.dispatch()] == ["good"]
+    assert [(name, type(exc)) for name, exc in errors] == [("bad", ValueError)]
+    assert len(scheduler) == 0
+    scheduler.close()
+
+
+def test_strategy_failure_in_release_listener_does_not_block_queue(empty_fleet):
+    empty_fleet.set_selection_strategy(FailingStrategy())
+    dispatched, errors = [], []
+    scheduler = MissionScheduler(empty_fleet, on_dispatch=lambda m, d: dispatched.append(m.name),
+                                 on_error=lambda m, exc: errors.append(m.name))
+    add_drones(empty_fleet, 1)
+    held = empty_fleet.assign_mission_to_drone(Mission("first", ["WP-1"], 10))
+    scheduler.submit(Mission("bad", ["WP-1"], 10, priority=5))
+    scheduler.submit(Mission("good", ["WP-1"], 10))
+    empty_fleet.release_drone(held)
+    assert (dispatched, errors) == (["good"], ["bad"])
+    scheduler.close()
+
+
+def test_strategy_failure_without_handler_raises_after_dropping(empty_fleet):
+    empty_fleet.set_selection_strategy(FailingStrategy())
+    scheduler = MissionScheduler(empty_fleet)
+    scheduler.submit(Mission("bad", ["WP-1"], 10, priority=5), dispatch=False)
+    scheduler.submit(Mission("good", ["WP-1"], 10), dispatch=False)
+    add_drones(empty_fleet, 1)
+    with pytest.raises(ValueError):
+        scheduler.dispatch()
+    assert len(scheduler) == 0
+    scheduler.close()
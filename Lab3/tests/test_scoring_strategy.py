@@ -0,0 +1,72 @@
+from drone_fleet.factory.concurrent_pool import ConcurrentDronePool
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import CargoDrone, SurveyDrone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.strategies import ScoringSelectionStrategy
+
+
+def test_strategies_with_one_clock_share_one_index():
+    pool = DronePool(max_size=2)
+    pool.preload([SurveyDrone("a"), CargoDrone("b")])
+    mission = Mission("m", ["WP-1"], 10)
+    for weight in range(5):
+        strategy = ScoringSelectionStrategy(type_weights={CargoDrone: float(weight)})
+        pool.select(strategy, mission)
+    assert len(pool._indexes) == 1
+
+
+def test_shared_index_keeps_each_strategys_weights():
+    pool = DronePool(max_size=2)
+    pool.preload([SurveyDrone("a"), CargoDrone("b")])
+    mission = Mission("m", ["WP-1"], 10, payload="none")
+    likes_cargo = ScoringSelectionStrategy(type_weights={CargoDrone: 1.0})
+    likes_survey = ScoringSelectionStrategy(type_weights={SurveyDrone: 1.0})
+    assert likes_cargo.index.name == likes_survey.index.name
+    assert pool.select(likes_cargo, mission).identifier == "b"
+    assert pool.select(likes_survey, mission).identifier == "a"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_strategies_with_different_clocks_use_different_indexes():
+    first = ScoringSelectionStrategy(clock=FakeClock())
+    second = ScoringSelectionStrategy(clock=FakeClock())
+    assert first.index.name != second.index.name
+
+
+def test_pools_keep_their_own_availability_times():
+    clock = FakeClock()
+    strategy = ScoringSelectionStrategy(idle_weight=1.0, clock=clock)
+    mission = Mission("m", ["WP-1"], 10)
+    pools = [DronePool(max_size=2), DronePool(max_size=2)]
+    for pool in pools:
+        pool.preload([SurveyDrone("a"), CargoDrone("b")])
+        pool.select(strategy, mission)
+    clock.now = 5.0
+    first, second = pools
+    first.release(first.checkout_specific(first.available_drones[0]))
+    clock.now = 8.0
+    second.release(second.checkout_specific(second.available_drones[1]))
+    clock.now = 10.0
+    # "b" in the first pool has been idle since 0; the second pool's release must not move it.
+    assert first.select(strategy, mission).identifier == "b"
+    assert second.select(strategy, mission).identifier == "a"
+
+
+def test_concurrent_pool_picks_longest_idle_across_stripes():
+    clock = FakeClock()
+    strategy = ScoringSelectionStrategy(idle_weight=1.0, clock=clock)
+    mission = Mission("m", ["WP-1"], 10)
+    pool = ConcurrentDronePool(max_size=2)
+    pool.preload([SurveyDrone("a"), CargoDrone("b")])
+    pool.select(strategy, mission)
+    clock.now = 5.0
+    pool.release(pool.checkout_specific(pool.available_drones[0]))
+    clock.now = 10.0
+    assert pool.select(strategy, mission).identifier == "b"
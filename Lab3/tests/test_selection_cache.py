@@ -0,0 +1,151 @@
+import random
+
+import pytest
+
+from drone_fleet.factory.concurrent_pool import ConcurrentDronePool
+from drone_fleet.factory.drone_index import BY_CLASS, DroneIndex
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import CargoDrone, CombatDrone, Drone, SurveyDrone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.strategies import (
+    CachingSelectionStrategy,
+    LeastRecentlyUsedSelectionStrategy,
+    PrioritySelectionStrategy,
+    ScoringSelectionStrategy,
+    SelectionStrategy,
+    SimpleSelectionStrategy,
+    _RecordingIndex,
+)
+
+URGENT = Mission("urgent", ["WP-1"], 10, priority=5)
+PHOTO = Mission("photo", ["WP-1"], 10, priority=1, payload="HD Camera")
+ROUTINE = Mission("routine", ["WP-1"], 10, priority=2)
+
+
+class FirstListed(SelectionStrategy):
+    """A strategy without an index."""
+
+    def select(self, available, mission):
+        return available[0]
+
+
+def make_pool(pool_cls=DronePool, per_type=3):
+    pool = pool_cls(max_size=3 * per_type)
+    pool.preload([cls(f"{cls.__name__}-{i}") for i in range(per_type)
+                  for cls in (SurveyDrone, CargoDrone, CombatDrone)])
+    return pool
+
+
+def test_version_tracks_every_change_shape_version_only_buckets():
+    index = DroneIndex(lambda d: (type(d),))
+    a, b = SurveyDrone("a"), SurveyDrone("b")
+    index.add(a)
+    assert (index.version, index.shape_version) == (1, 1)
+    index.add(b)
+    index.discard(a)
+    assert (index.version, index.shape_version) == (3, 1)
+    index.discard(b)
+    assert (index.version, index.shape_version) == (4, 2)
+    index.discard(b)  # not indexed: no change
+    assert index.version == 4
+
+
+def test_recording_index_records_lookups_and_flags_other_use():
+    index = DroneIndex(lambda d: (type(d),))
+    drone = CargoDrone("c")
+    index.add(drone)
+    recorder = _RecordingIndex(index)
+    assert recorder.first(CargoDrone) is drone
+    assert recorder.last(SurveyDrone) is None
+    assert recorder.calls == [("first", CargoDrone, drone), ("last", SurveyDrone, None)]
+    assert not recorder.opaque
+    assert recorder.keys() == [CargoDrone]
+    assert recorder.opaque
+
+
+def test_cached_decision_is_replayed_against_the_current_bucket():
+    pool = make_pool()
+    caching = CachingSelectionStrategy(PrioritySelectionStrategy())
+    first = pool.select(caching, URGENT)
+    assert caching.stats["misses"] == 1
+    pool.checkout_specific(first)
+    # Same bucket, new head: the recorded first(CombatDrone) lookup is replayed.
+    second = pool.select(caching, URGENT)
+    assert second is not first and isinstance(second, CombatDrone)
+    assert caching.hits == 1
+
+
+def test_cache_hits_after_release_into_a_non_empty_bucket():
+    pool = make_pool()
+    caching = CachingSelectionStrategy(PrioritySelectionStrategy())
+    taken = pool.checkout_specific(pool.select(caching, PHOTO))
+    pool.release(taken)
+    assert pool.select(caching, PHOTO) is pool.select(PrioritySelectionStrategy(), PHOTO)
+    assert caching.stats == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_emptied_bucket_invalidates_the_entry():
+    pool = make_pool(per_type=1)
+    caching = CachingSelectionStrategy(PrioritySelectionStrategy())
+    combat = pool.checkout_specific(pool.select(caching, URGENT))
+    fallback = pool.select(caching, URGENT)
+    assert not isinstance(fallback, CombatDrone)
+    assert caching.misses == 2
+    pool.release(combat)
+    assert pool.select(caching, URGENT) is combat
+
+
+def test_strategies_that_compare_buckets_are_not_cached():
+    pool = make_pool()
+    caching = CachingSelectionStrategy(ScoringSelectionStrategy())
+    for _ in range(3):
+        pool.select(caching, PHOTO)
+    assert caching.hits == 0 and caching.misses == 3
+
+
+def test_list_strategies_are_cached_until_the_pool_changes():
+    pool = make_pool()
+    caching = CachingSelectionStrategy(FirstListed())
+    assert caching.index is not None
+    drone = pool.select(caching, ROUTINE)
+    assert pool.select(caching, ROUTINE) is drone and caching.hits == 1
+    pool.release(pool.checkout())
+    pool.select(caching, ROUTINE)
+    assert caching.misses == 2
+
+
+def test_max_entries_and_clear():
+    pool = make_pool()
+    caching = CachingSelectionStrategy(PrioritySelectionStrategy(), max_entries=1)
+    pool.select(caching, URGENT)
+    pool.select(caching, PHOTO)  # evicts the URGENT entry
+    pool.select(caching, URGENT)
+    assert caching.misses == 3
+    caching.clear()
+    pool.select(caching, URGENT)
+    assert caching.misses == 4
+    with pytest.raises(ValueError):
+        CachingSelectionStrategy(SimpleSelectionStrategy(), max_entries=0)
+
+
+@pytest.mark.parametrize("pool_cls", [DronePool, ConcurrentDronePool])
+@pytest.mark.parametrize("strategy_cls", [
+    SimpleSelectionStrategy, PrioritySelectionStrategy, LeastRecentlyUsedSelectionStrategy, FirstListed,
+])
+def test_cached_choices_match_the_wrapped_strategy(pool_cls, strategy_cls):
+    rng = random.Random(5)
+    pool = make_pool(pool_cls, per_type=4)
+    plain, caching = strategy_cls(), CachingSelectionStrategy(strategy_cls())
+    held = []
+    for _ in range(300):
+        mission = rng.choice([URGENT, PHOTO, ROUTINE])
+        expected = pool.select(plain, mission)
+        assert pool.select(caching, mission) is expected
+        roll = rng.random()
+        if roll < 0.2:
+            continue  # unchanged pool: every strategy's entry stays valid
+        if held and (expected is None or roll < 0.55):
+            pool.release(held.pop(rng.randrange(len(held))))
+        elif expected is not None:
+            held.append(pool.checkout_specific(expected))
+    assert caching.hits > 0
@@ -0,0 +1,29 @@
+from drone_fleet.domain.sharded_fleet import ShardedFleet
+from drone_fleet.factory.sharded_pool import SharedAvailability, ShardedDronePool
+from drone_fleet.models.drone import CargoDrone, SurveyDrone
+from drone_fleet.models.mission import Mission
+
+
+def checkout_one(fleet, _):
+    return fleet.assign_mission_to_drone(Mission("m", ["WP-1"], 10))
+
+
+def test_any_view_can_release_a_claimed_drone():
+    shared = SharedAvailability.create([SurveyDrone("a"), CargoDrone("b")])
+    try:
+        owner, other = ShardedDronePool(shared), ShardedDronePool(shared)
+        drone = owner.try_checkout()
+        assert other.is_in_use(drone) and other.in_use_count() == 1
+        other.release(drone)
+        assert owner.is_available(drone) and owner.in_use_count() == 0
+    finally:
+        shared.close()
+
+
+def test_fleet_releases_drones_checked_out_by_workers():
+    with ShardedFleet([SurveyDrone(f"S-{i}") for i in range(4)], workers=1) as fleet:
+        drones = fleet.map(checkout_one, range(3))
+        assert fleet.pool.available_count() == 1
+        for d in drones:
+            fleet.release(d)
+        assert fleet.pool.available_count() == 4
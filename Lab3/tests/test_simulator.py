@@ -0,0 +1,29 @@
+import pytest
+
+from drone_fleet.simulation.simulator import FleetSimulator
+from drone_fleet.utilities.strategies import PrioritySelectionStrategy
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"rate_per_minute": 0},
+    {"rate_per_minute": -1.0},
+    {"arrival": "bursty", "burst_size": 1},
+    {"arrival": "bursty", "burst_size": 0.5},
+    {"arrival": "uniform"},
+])
+def test_invalid_parameters_are_rejected(fleet, kwargs):
+    with pytest.raises(ValueError):
+        FleetSimulator(fleet, **kwargs)
+
+
+def test_run_restores_the_fleet(fleet):
+    pool, strategy = fleet.pool, fleet.selection_strategy
+    simulator = FleetSimulator(fleet, drones={"survey": 2, "cargo": 1}, rate_per_minute=2.0,
+                               arrival="bursty", burst_size=3, strategy=PrioritySelectionStrategy(),
+                               seed=3)
+    first = simulator.run(240)
+    assert fleet.pool is pool and fleet.selection_strategy is strategy
+    assert first.arrived > 0 and first.dispatched > 0
+    second = simulator.run(240)
+    assert (second.arrived, second.dispatched, second.completed) == (
+        first.arrived, first.dispatched, first.completed)
@@ -0,0 +1,62 @@
+import pytest
+
+from drone_fleet.domain.scheduler import MissionScheduler
+from drone_fleet.factory.drone_pool import DronePool
+from drone_fleet.models.drone import SurveyDrone
+from drone_fleet.models.mission import Mission
+from drone_fleet.utilities.snapshot import load_snapshot, save_snapshot
+
+
+class RogueDrone(SurveyDrone):
+    """A drone class no factory builds."""
+
+
+def make_proxy(kind, identifier):
+    raise AssertionError("no proxies expected")
+
+
+def test_round_trip_keeps_order_and_missions(tmp_path):
+    pool = DronePool(max_size=3)
+    pool.preload([SurveyDrone("a"), SurveyDrone("b"), SurveyDrone("c")])
+    busy = pool.checkout_specific(pool.available_drones[1])
+    busy.assign_mission(Mission("m", ["WP-1"], 10))
+    save_snapshot(str(tmp_path / "fleet.snap"), pool)
+    restored, _ = load_snapshot(str(tmp_path / "fleet.snap"), make_proxy)
+    assert [d.identifier for d in restored.available_drones] == ["a", "c"]
+    assert restored.in_use_drones[0].active_mission.name == "m"
+
+
+def test_corrupt_file_raises_value_error(tmp_path):
+    path = tmp_path / "fleet.snap"
+    pool = DronePool(max_size=1)
+    pool.preload([SurveyDrone("a")])
+    save_snapshot(str(path), pool)
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="checksum"):
+        load_snapshot(str(path), make_proxy)
+
+
+def test_unregistered_class_is_rejected(tmp_path):
+    pool = DronePool(max_size=1)
+    pool.preload([RogueDrone("a")])
+    save_snapshot(str(tmp_path / "fleet.snap"), pool)
+    with pytest.raises(ValueError, match="Unknown drone class"):
+        load_snapshot(str(tmp_path / "fleet.snap"), make_proxy)
+
+
+def test_restore_stops_elastic_pool_and_keeps_listeners(fleet, tmp_path):
+    pool = DronePool(max_size=1)
+    pool.preload([SurveyDrone("a")])
+    save_snapshot(str(tmp_path / "fleet.snap"), pool)
+    elastic = fleet.enable_autoscaling({"survey": (1, 2)})
+    dispatched = []
+    scheduler = MissionScheduler(fleet, on_dispatch=lambda m, d: dispatched.append(m))
+    fleet.restore_snapshot(str(tmp_path / "fleet.snap"))
+    assert elastic._thread is None
+    drone = fleet.assign_mission_to_drone(Mission("first", ["WP-1"], 10))
+    scheduler.submit(Mission("queued", ["WP-1"], 10))
+    fleet.release_drone(drone)
+    assert [m.name for m in dispatched] == ["queued"]
+    scheduler.close()
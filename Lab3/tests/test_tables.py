@@ -0,0 +1,51 @@
+import pytest
+
+from drone_fleet.models.drone import CargoDrone, SurveyDrone
+from drone_fleet.models.mission import Mission
+from drone_fleet.models.tables import DroneTable, MissionTable
+
+
+def test_mission_rows_read_back_like_missions():
+    table = MissionTable()
+    table.add(Mission("a", ["WP-1"], 30, priority=4, payload="Cargo"))
+    row = table.append("b", ["WP-2", "WP-3"], 12.5)
+    assert row == 1 and len(table) == 2
+    first, second = table
+    assert (first.name, first.duration_minutes, first.priority, first.payload) == ("a", 30, 4, "Cargo")
+    assert isinstance(first.duration_minutes, int)
+    assert second.waypoints == ("WP-2", "WP-3") and second.duration_minutes == 12.5
+    assert table[-1].to_mission().duration_minutes == 12.5
+
+
+@pytest.mark.parametrize("duration, priority", [(0, 3), ("30", 3), (None, 3), (30, 2.5)])
+def test_mission_table_rejects_bad_rows(duration, priority):
+    table = MissionTable()
+    with pytest.raises(ValueError):
+        table.append("m", ["WP-1"], duration, priority)
+    assert len(table) == 0
+
+
+def test_drone_rows_keep_type_position_and_mission():
+    drones = DroneTable()
+    drones.add(SurveyDrone("S-1", (1.0, 2.0)))
+    drones.add(CargoDrone("C-1"))
+    survey, cargo = drones
+    assert survey.position == (1.0, 2.0) and cargo.position is None
+    cargo.move_to((3.0, 4.0))
+    assert cargo.to_drone().position == (3.0, 4.0)
+    assert isinstance(cargo.to_drone(), CargoDrone)
+
+    mission = drones.missions[drones.missions.append("m", ["WP-1"], 10)]
+    survey.assign_mission(mission)
+    assert survey.active_mission.name == "m"
+    survey.clear_mission()
+    assert survey.active_mission is None
+    with pytest.raises(ValueError):
+        survey.assign_mission(_foreign_mission())
+    with pytest.raises(IndexError):
+        drones[2]
+
+
+def _foreign_mission():
+    other = MissionTable()
+    return other[other.append("x", ["WP-1"], 1)]
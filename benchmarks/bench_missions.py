@@ -0,0 +1,38 @@
+"""Mission construction: MissionBuilder.build and LegacyMissionAdapter.to_mission.
+
+Each round builds a whole fleet's worth of missions, one per drone.
+"""
+import pytest
+
+from conftest import FLEET_SIZES
+from drone_fleet.factory.mission_builder import MissionBuilder
+
+WAYPOINTS = ["WP-1", "WP-2", "WP-3", "WP-4"]
+
+
+@pytest.mark.parametrize("size", FLEET_SIZES)
+def bench_mission_builder(benchmark, size):
+    def build_all():
+        return [
+            MissionBuilder().name(f"M-{i}").add_waypoint("WP-1").add_waypoint("WP-2")
+            .duration(30).priority(i % 5 + 1).payload("Sensors").build()
+            for i in range(size)
+        ]
+
+    benchmark.group = "mission builder"
+    assert len(benchmark(build_all)) == size
+
+
+@pytest.mark.parametrize("size", FLEET_SIZES)
+def bench_legacy_adapter(benchmark, size):
+    adapters = pytest.importorskip("drone_fleet.utilities.adapters")
+    records = [
+        {"title": f"M-{i}", "wps": WAYPOINTS, "len": 30, "prio": i % 5 + 1, "cargo": "Sensors"}
+        for i in range(size)
+    ]
+
+    def adapt_all():
+        return [adapters.LegacyMissionAdapter(record).to_mission() for record in records]
+
+    benchmark.group = "legacy adapter"
+    assert len(benchmark(adapt_all)) == size
@@ -0,0 +1,43 @@
+"""DronePool checkout/release and checkout_specific at several fleet sizes.
+
+Half of the fleet is checked out before timing so that both the available
+and in-use sides of the pool scale with the fleet.
+"""
+import pytest
+
+from conftest import FLEET_SIZES
+from drone_fleet.factory.drone_pool import DronePool
+
+
+def _half_checked_out(make_fleet, size: int) -> DronePool:
+    pool = DronePool(max_size=size)
+    pool.preload(make_fleet(size))
+    for _ in range(size // 2):
+        pool.checkout()
+    return pool
+
+
+@pytest.mark.parametrize("size", FLEET_SIZES)
+def bench_checkout_release(benchmark, make_fleet, size):
+    pool = _half_checked_out(make_fleet, size)
+
+    def round_trip():
+        pool.release(pool.checkout())
+
+    benchmark.group = "pool checkout/release"
+    benchmark(round_trip)
+
+
+@pytest.mark.parametrize("size", FLEET_SIZES)
+def bench_checkout_specific(benchmark, make_fleet, size):
+    if not hasattr(DronePool, "checkout_specific"):
+        pytest.skip("DronePool.checkout_specific is not available in this lab")
+    pool = _half_checked_out(make_fleet, size)
+    # The oldest available drone: the far end of the pool from checkout().
+    target = pool.available_drones[0]
+
+    def round_trip():
+        pool.release(pool.checkout_specific(target))
+
+    benchmark.group = "pool checkout_specific"
+    benchmark(round_trip)
@@ -0,0 +1,69 @@
+"""Drone selection for each SelectionStrategy at several fleet sizes.
+
+Selection goes through `DronePool.select`, so strategies that declare an
+index are measured on the indexed path. Where drones have positions they
+are laid out on a square grid, one per unit cell, centred on WP-1.
+"""
+import math
+
+import pytest
+
+from conftest import FLEET_SIZES
+
+strategies = pytest.importorskip("drone_fleet.utilities.strategies")
+
+from drone_fleet.factory.drone_pool import DronePool  # noqa: E402
+from drone_fleet.models.mission import Mission  # noqa: E402
+
+MISSIONS = {
+    "camera": Mission("Recon", ["WP-1"], 30, priority=2, payload="HD Camera"),
+    "urgent": Mission("Strike", ["WP-1"], 30, priority=4),
+    "routine": Mission("Patrol", ["WP-1"], 30, priority=1),
+}
+STRATEGIES = sorted(
+    name for name, cls in vars(strategies).items()
+    if isinstance(cls, type) and issubclass(cls, strategies.SelectionStrategy)
+    and cls is not strategies.SelectionStrategy
+)
+
+
+def _waypoints():
+    from drone_fleet.models.waypoints import WaypointRegistry
+    registry = WaypointRegistry()
+    registry.register("WP-1", 0.0, 0.0)
+    return registry
+
+
+# Strategies whose constructor takes required arguments or needs waypoints.
+BUILDERS = {
+    "CachingSelectionStrategy":
+        lambda: strategies.CachingSelectionStrategy(strategies.SimpleSelectionStrategy()),
+    "NearestDroneStrategy": lambda: strategies.NearestDroneStrategy(_waypoints()),
+}
+
+
+def make_strategy(name: str):
+    builder = BUILDERS.get(name)
+    return builder() if builder is not None else getattr(strategies, name)()
+
+
+@pytest.mark.parametrize("mission", sorted(MISSIONS))
+@pytest.mark.parametrize("size", FLEET_SIZES)
+@pytest.mark.parametrize("strategy_name", STRATEGIES)
+def bench_select(benchmark, make_fleet, strategy_name, size, mission):
+    strategy = make_strategy(strategy_name)
+    # Cargo drones first, so rules looking for other types cannot stop early.
+    fleet = sorted(make_fleet(size), key=lambda d: type(d).__name__ != "CargoDrone")
+    if hasattr(fleet[0], "move_to"):
+        side = math.isqrt(size - 1) + 1
+        for i, d in enumerate(fleet):
+            d.move_to((i % side - side / 2, i // side - side / 2))
+    pool = DronePool(max_size=size)
+    pool.preload(fleet)
+    target = MISSIONS[mission]
+
+    def select():
+        return pool.select(strategy, target)
+
+    benchmark.group = f"select {strategy_name}"
+    assert benchmark(select) is not None
@@ -0,0 +1,45 @@
+"""Decorator capabilities() by stacking depth, and DroneProxy realization.
+
+Decorated drones are built once and `capabilities()` is timed across the
+fleet; proxies are recreated for every round so each call pays for
+realizing the real drone.
+"""
+import pytest
+
+from conftest import FLEET_SIZES
+
+DEPTHS = (1, 4, 16)
+
+
+@pytest.mark.parametrize("depth", DEPTHS)
+@pytest.mark.parametrize("size", FLEET_SIZES)
+def bench_decorator_capabilities(benchmark, make_fleet, size, depth):
+    decorators = pytest.importorskip("drone_fleet.utilities.decorators")
+    layers = (decorators.StealthDecorator, decorators.RangeExtenderDecorator)
+    fleet = make_fleet(size)
+    for level in range(depth):
+        fleet = [layers[level % 2](d) for d in fleet]
+
+    def describe_all():
+        return [d.capabilities() for d in fleet]
+
+    benchmark.group = f"decorator capabilities depth={depth}"
+    benchmark(describe_all)
+
+
+@pytest.mark.parametrize("size", FLEET_SIZES)
+def bench_proxy_realization(benchmark, size):
+    proxy = pytest.importorskip("drone_fleet.utilities.proxy")
+    from drone_fleet.models.drone import SurveyDrone
+
+    def make_proxies():
+        proxies = [
+            proxy.DroneProxy(f"P-{i}", lambda i=i: SurveyDrone(f"P-{i}")) for i in range(size)
+        ]
+        return (proxies,), {}
+
+    def realize_all(proxies):
+        return [p.capabilities() for p in proxies]
+
+    benchmark.group = "proxy realization"
+    benchmark.pedantic(realize_all, setup=make_proxies, rounds=20)
@@ -0,0 +1,88 @@
+"""Shared setup for the cross-lab pytest-benchmark suite.
+
+The suite targets one lab's `drone_fleet` package per run, chosen with
+`--lab` (or the DRONE_FLEET_LAB environment variable); benchmark names do
+not include the lab, so a run saved against one lab can be compared with
+a run against another.
+
+Timed runs are compared against the committed baseline for the lab and
+this machine (``baselines/<machine id>/<lab>.json``) and fail when a
+benchmark's median regresses by more than `REGRESSION_THRESHOLD`.
+"""
+import os
+import sys
+from typing import Callable, List, Optional
+
+import pytest
+from pytest_benchmark.utils import get_machine_id, parse_compare_fail
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LABS = ("Lab1", "Lab2", "Lab3")
+FLEET_SIZES = (100, 1_000, 10_000)
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+REGRESSION_THRESHOLD = "median:25%"
+
+
+def pytest_addoption(parser) -> None:
+    parser.addoption(
+        "--lab", choices=LABS, default=os.environ.get("DRONE_FLEET_LAB", "Lab3"),
+        help="which lab's drone_fleet package to benchmark (default: Lab3)",
+    )
+    parser.addoption(
+        "--no-baseline", action="store_true",
+        help="do not compare against the committed baseline (e.g. when recording a new one)",
+    )
+
+
+def baseline_path(lab: str) -> str:
+    return os.path.join(BASELINES, get_machine_id(), f"{lab}.json")
+
+
+def _baseline(config) -> Optional[str]:
+    """The committed baseline to compare against, if this run should use one."""
+    option = config.option
+    if config.getoption("--no-baseline") or option.benchmark_compare:
+        return None
+    if option.benchmark_disable or option.benchmark_skip:
+        return None
+    path = baseline_path(config.getoption("--lab"))
+    return path if os.path.isfile(path) else None
+
+
+@pytest.hookimpl(tryfirst=True)  # before pytest-benchmark reads the compare options
+def pytest_configure(config) -> None:
+    lab = config.getoption("--lab")
+    sys.path.insert(0, os.path.join(ROOT, lab))
+    for name in [m for m in sys.modules if m == "drone_fleet" or m.startswith("drone_fleet.")]:
+        del sys.modules[name]
+    baseline = _baseline(config)
+    if baseline is not None:
+        config.option.benchmark_compare = baseline
+        if not config.option.benchmark_compare_fail:
+            config.option.benchmark_compare_fail = [parse_compare_fail(REGRESSION_THRESHOLD)]
+
+
+def pytest_benchmark_update_machine_info(config, machine_info) -> None:
+    machine_info["drone_fleet_lab"] = config.getoption("--lab")
+
+
+@pytest.fixture(scope="session")
+def lab(pytestconfig) -> str:
+    return pytestconfig.getoption("--lab")
+
+
+@pytest.fixture(scope="session")
+def make_fleet() -> Callable[[int], List]:
+    """Return a builder for a mixed fleet of `size` drones (survey/cargo/combat in turn)."""
+    from drone_fleet.factory.drone_factory import (
+        SurveyDroneFactory,
+        CargoDroneFactory,
+        CombatDroneFactory,
+    )
+    factories = (SurveyDroneFactory(), CargoDroneFactory(), CombatDroneFactory())
+
+    def build(size: int) -> List:
+        return [factories[i % 3].create(f"D-{i}") for i in range(size)]
+
+    return build
+